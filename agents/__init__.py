@@ -5,6 +5,7 @@
 from .basic_extraction_agent import BasicExtractionAgent
 from .validation_agent import ValidationAgent, FallbackHandler
 from .judge_agent import JudgeAgent
+from .full_extraction_agent import FullExtractionAgent
 from .report_generator import ReportGenerator
 
 __all__ = [
@@ -12,6 +13,7 @@ __all__ = [
     "ValidationAgent",
     "FallbackHandler",
     "JudgeAgent",
+    "FullExtractionAgent",
     "ReportGenerator"
 ]
 
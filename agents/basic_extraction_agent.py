@@ -6,17 +6,131 @@
 import time
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor, Future, CancelledError, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Union, Any, Optional
+from typing import Callable, List, Union, Any, Optional, Dict, Tuple
 from datetime import datetime
 
-from state import DocumentState, ExtractionResult, PageExtractionResult, add_extraction_result
+from state import DocumentState, ExtractionResult, PageExtractionResult, add_extraction_result, save_bbox_tables
 import config
 from tools.pdfplumber_tool import PDFPlumberTool
 from tools.pdfminer_tool import PDFMinerTool
 from tools.pypdfium2_tool import PyPDFium2Tool
 from tools.upstage_ocr_tool import UpstageOCRTool
 from tools.upstage_document_parse_tool import UpstageDocumentParseTool
+from utils.extraction_cache import get_extraction_cache, file_sha256
+from utils.batch_runner import get_process_pool, discard_process_pool
+from utils.sharded_extraction import shard_pages, extract_shard
+
+
+# CPU 바운드 로컬 파서 (프로세스 풀에서 실행, 나머지 API 도구는 스레드에서 실행)
+LOCAL_TOOL_NAMES = ("pdfplumber", "pdfminer", "pypdfium2")
+
+
+class _ExtractionWriter:
+    """
+    도구별 추출 결과 점진 기록
+    
+    - 페이지가 도착하는 대로 pages_text_sampled.jsonl에 한 줄씩 기록 (도착 순서, "page" 필드로 식별)
+    - 새로 추출한 페이지는 바로 추출 캐시에 저장
+    - on_page가 있으면 기록한 페이지를 바로 전달 (추출 중 초기 검증 시작)
+    - bbox npz는 close()에서 한 번에 저장
+    """
+    
+    def __init__(
+        self,
+        tool_name: str,
+        tool: Any,
+        document_name: str,
+        sampled_pages: List[int],
+        pdf_hash: Optional[str] = None,
+        on_page: Optional[Callable[[PageExtractionResult], None]] = None
+    ):
+        self.tool_name = tool_name
+        self.tool = tool
+        self.sampled_pages = set(sampled_pages)
+        self.pdf_hash = pdf_hash
+        self.on_page = on_page
+        self.page_results: List[PageExtractionResult] = []
+        
+        output_dir = config.EXTRACTED_DIR / document_name.replace('.pdf', '') / tool_name
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.pages_text_path = output_dir / "pages_text_sampled.jsonl"
+        self.bboxes_path = output_dir / config.BBOX_FILENAME
+        self.doc_meta_path = output_dir / "doc_meta.json"
+        
+        self._file = open(self.pages_text_path, 'w', encoding='utf-8')
+    
+    def add_pages(self, pages_data: List[Dict[str, Any]], time_per_page_ms: float, from_cache: bool = False):
+        """
+        페이지 기록 (샘플링되지 않은 페이지는 무시)
+        
+        Args:
+            pages_data: 도구 extract()의 "pages" 항목 형식
+            time_per_page_ms: 페이지당 처리 시간
+            from_cache: 캐시에서 가져온 페이지면 True (캐시에 다시 저장하지 않음)
+        """
+        pages_data = [p for p in pages_data if p["page"] in self.sampled_pages]
+        if not pages_data:
+            return
+        
+        # 새로 추출한 페이지는 바로 캐시에 저장
+        cache = get_extraction_cache()
+        if not from_cache and cache is not None and self.pdf_hash is not None:
+            try:
+                cache.put_pages(self.pdf_hash, self.tool_name, self.tool, pages_data, time_per_page_ms)
+            except Exception as e:
+                print(f"[WARN] {self.tool_name} extraction cache store failed: {str(e)}")
+        
+        for page_data in pages_data:
+            page_result = PageExtractionResult(
+                page_num=page_data["page"],
+                strategy=self.tool_name,
+                text=page_data["text"],
+                bbox=page_data.get("bbox", []),
+                tables=page_data.get("tables", []),
+                processing_time_ms=time_per_page_ms,
+                status="success",
+                metadata={
+                    "width": page_data.get("width", 0),
+                    "height": page_data.get("height", 0)
+                }
+            )
+            
+            # pages_text_sampled.jsonl 기록 (bbox는 npz로 따로 저장)
+            page_dict = {
+                "page": page_result.page_num,
+                "source": page_result.strategy,
+                "text": page_result.text,
+                "bbox_count": len(page_result.bbox),
+                "tables": page_result.tables
+            }
+            self._file.write(json.dumps(page_dict, ensure_ascii=False) + '\n')
+            self.page_results.append(page_result)
+        
+        self._file.flush()
+        
+        if self.on_page is not None:
+            for page_result in self.page_results[-len(pages_data):]:
+                self.on_page(page_result)
+    
+    def close(self) -> List[PageExtractionResult]:
+        """jsonl을 닫고 bbox npz 저장 (페이지 순서로 정렬된 결과 반환)"""
+        self._file.close()
+        
+        self.page_results.sort(key=lambda p: p.page_num)
+        save_bbox_tables(self.bboxes_path, {
+            page_result.page_num: page_result.bbox for page_result in self.page_results
+        })
+        return self.page_results
+    
+    def abort(self):
+        """실패한 도구의 부분 기록 삭제"""
+        if not self._file.closed:
+            self._file.close()
+            self.pages_text_path.unlink(missing_ok=True)
 
 
 class BasicExtractionAgent:
@@ -31,6 +145,9 @@ class BasicExtractionAgent:
       4. Upstage OCR API
       5. Upstage Document Parse API
     - 페이지 샘플링 (최대 5페이지)
+    - 도구 동시 실행 (로컬 파서: 프로세스 풀, API: 스레드)
+    - 추출 결과 캐시 (PDF 해시/도구/버전/설정/페이지 단위, 캐시에 없는 페이지만 추출)
+    - 페이지가 나오는 대로 jsonl 기록 (on_page로 2단계 초기 검증에 바로 전달 가능)
     - 최소 가공 원칙 (정렬/교정/헤더 제거 X)
     - 원본 좌표 그대로 저장
     - 각 도구별 조합 생성 → 2단계에서 검증
@@ -45,8 +162,18 @@ class BasicExtractionAgent:
             "upstage_document_parse": UpstageDocumentParseTool()
         }
     
-    def run(self, state: DocumentState) -> DocumentState:
-        """기본 추출 실행 (다중 라이브러리)"""
+    def run(
+        self,
+        state: DocumentState,
+        on_page: Optional[Callable[[PageExtractionResult], None]] = None
+    ) -> DocumentState:
+        """
+        기본 추출 실행 (다중 라이브러리)
+        
+        Args:
+            state: 문서 상태
+            on_page: 페이지를 기록할 때마다 호출 (도착 순서, 예: 초기 검증 스트림의 add_page)
+        """
         
         document_path = state["document_path"]
         document_name = state["document_name"]
@@ -55,19 +182,44 @@ class BasicExtractionAgent:
         print(f"[EXTRACTION] Document: {document_name}")
         print(f"{'='*60}\n")
         
-        # 모든 라이브러리로 추출
-        for idx, (tool_name, tool) in enumerate(self.tools.items(), 1):
-            print(f"[{idx}/{len(self.tools)}] {tool_name} extraction starting...")
-            
-            result = self._extract_with_tool(
-                tool_name, 
-                tool, 
-                document_path, 
-                document_name
+        # 페이지 수 확인 후 샘플링 (모든 도구가 동일한 페이지를 추출)
+        total_pages = self._probe_page_count(document_path)
+        sampled_pages = self._sample_pages(total_pages, max_samples=config.MAX_PAGES_SAMPLE)
+        print(f"[SAMPLING] Selected {len(sampled_pages)} pages from {total_pages} total: {sampled_pages}")
+        
+        pdf_hash = self._document_hash(document_path)
+        
+        # 모든 라이브러리로 추출 (샘플링된 페이지만)
+        if config.PARALLEL_EXTRACTION:
+            results = self._extract_concurrently(
+                document_path,
+                document_name,
+                sampled_pages,
+                total_pages,
+                pdf_hash,
+                on_page
             )
-            
+        else:
+            results = []
+            for idx, (tool_name, tool) in enumerate(self.tools.items(), 1):
+                print(f"[{idx}/{len(self.tools)}] {tool_name} extraction starting...")
+                results.append(self._extract_with_tool(
+                    tool_name, 
+                    tool, 
+                    document_path, 
+                    document_name,
+                    sampled_pages,
+                    total_pages,
+                    pdf_hash,
+                    on_page
+                ))
+        
+        # 도구 순서대로 결과 병합 (완료 순서와 무관하게 결정적)
+        for tool_name, result in zip(self.tools.keys(), results):
             if result:
                 state = add_extraction_result(state, result)
+            
+            if result and result.status == "success":
                 print(f"[OK] {tool_name} completed: {result.page_count} pages, {result.processing_time_ms:.0f}ms")
             else:
                 print(f"[WARN] {tool_name} failed")
@@ -76,6 +228,8 @@ class BasicExtractionAgent:
         state["doc_meta"] = {
             "document_name": document_name,
             "document_path": document_path,
+            "total_pages": total_pages,
+            "sampled_pages": sampled_pages,
             "extraction_count": len(state["extraction_results"]),
             "timestamp": datetime.now().isoformat()
         }
@@ -87,6 +241,61 @@ class BasicExtractionAgent:
         
         return state
     
+    def _probe_page_count(self, document_path: Union[str, Path]) -> int:
+        """
+        전체 페이지 수 확인 (텍스트 추출 없이)
+        
+        도구 순서대로 시도하여 처음 성공한 값을 사용
+        """
+        for tool_name, tool in self.tools.items():
+            if not hasattr(tool, "get_page_count"):
+                continue
+            try:
+                return tool.get_page_count(document_path)
+            except Exception as e:
+                print(f"[WARN] {tool_name} page count failed: {str(e)}")
+        
+        raise ValueError(f"페이지 수를 확인할 수 없습니다: {document_path}")
+    
+    def _document_hash(self, document_path: Union[str, Path]) -> Optional[str]:
+        """추출 캐시용 PDF 내용 해시 (캐시 비활성화 또는 실패 시 None)"""
+        if get_extraction_cache() is None:
+            return None
+        
+        try:
+            return file_sha256(document_path)
+        except Exception as e:
+            print(f"[WARN] Document hash failed, extraction cache disabled: {str(e)}")
+            return None
+    
+    def _lookup_cache(
+        self,
+        tool_name: str,
+        tool: Any,
+        pdf_hash: Optional[str],
+        pages: List[int]
+    ) -> Tuple[List[Dict[str, Any]], float, List[int]]:
+        """
+        캐시된 페이지 조회
+        
+        Returns:
+            (캐시된 페이지 데이터, 캐시된 페이지의 최초 추출 시간 ms, 추출이 필요한 페이지)
+        """
+        cache = get_extraction_cache()
+        if cache is None or pdf_hash is None:
+            return [], 0.0, list(pages)
+        
+        try:
+            cached_pages, cached_time_ms, missing_pages = cache.get_pages(pdf_hash, tool_name, tool, pages)
+        except Exception as e:
+            print(f"[WARN] {tool_name} extraction cache lookup failed: {str(e)}")
+            return [], 0.0, list(pages)
+        
+        if cached_pages:
+            print(f"[CACHE] {tool_name}: {len(cached_pages)}/{len(pages)} pages from extraction cache")
+        
+        return cached_pages, cached_time_ms, missing_pages
+    
     def _sample_pages(self, total_pages: int, max_samples: int = 5) -> List[int]:
         """페이지 샘플링 (랜덤, 최대 5개)"""
         if total_pages <= max_samples:
@@ -110,114 +319,291 @@ class BasicExtractionAgent:
         cost_per_page = config.UPSTAGE_API_PRICING.get(tool_name, 0.0)
         return cost_per_page * page_count
     
+    def _extract_concurrently(
+        self,
+        document_path: Union[str, Path],
+        document_name: str,
+        sampled_pages: List[int],
+        total_pages: int,
+        pdf_hash: Optional[str] = None,
+        on_page: Optional[Callable[[PageExtractionResult], None]] = None
+    ) -> List[ExtractionResult]:
+        """
+        모든 도구 동시 추출
+        
+        - 로컬 파서 (pdfplumber/pdfminer/pypdfium2): 공유 프로세스 풀 (CPU 바운드, 문서 간 재사용)
+          추출 페이지가 많으면 페이지 범위 샤드로 나눠 제출
+        - Upstage API: 스레드 풀 (네트워크 바운드)
+        - 도구별 타임아웃: config.OCR_TIMEOUT (동시 시작 기준)
+          마감 시 실행 중인 로컬 작업이 남아 있으면 워커를 강제 종료하고 풀 교체
+          (다른 문서의 작업이 풀 교체로 중단되면 새 풀에 한 번 다시 제출)
+        - 캐시에 있는 페이지는 바로 기록하고 나머지만 제출 (전부 캐시되어 있으면 제출하지 않음)
+        - 샤드가 끝나는 대로 도구와 무관하게 바로 기록 (느린 도구를 기다리지 않음)
+        
+        Returns:
+            self.tools 순서와 동일한 추출 결과 리스트
+        """
+        
+        if not isinstance(document_path, Path):
+            document_path = Path(document_path)
+        
+        local_tools = [name for name in self.tools if name in LOCAL_TOOL_NAMES]
+        remote_tools = [name for name in self.tools if name not in LOCAL_TOOL_NAMES]
+        
+        print(f"[PARALLEL] {len(local_tools)} local tools (process pool) + "
+              f"{len(remote_tools)} API tools (threads) starting...")
+        
+        thread_pool = ThreadPoolExecutor(max_workers=len(remote_tools)) if remote_tools else None
+        
+        futures: Dict[Future, Tuple[str, List[int]]] = {}
+        process_futures: Dict[Future, Any] = {}  # 로컬 작업 → 제출한 프로세스 풀
+        resubmitted = set()
+        writers: Dict[str, _ExtractionWriter] = {}
+        processing_times: Dict[str, float] = {}
+        cached_counts: Dict[str, int] = {}
+        failures: Dict[str, str] = {}
+        results: List[ExtractionResult] = []
+        
+        try:
+            for tool_name, tool in self.tools.items():
+                cached_pages, cached_time_ms, missing_pages = self._lookup_cache(tool_name, tool, pdf_hash, sampled_pages)
+                
+                writer = _ExtractionWriter(tool_name, tool, document_name, sampled_pages, pdf_hash, on_page)
+                writers[tool_name] = writer
+                processing_times[tool_name] = cached_time_ms
+                cached_counts[tool_name] = len(cached_pages)
+                
+                # 캐시된 페이지는 바로 기록
+                if cached_pages:
+                    writer.add_pages(cached_pages, cached_time_ms / len(cached_pages), from_cache=True)
+                
+                if not missing_pages:
+                    continue
+                
+                # 로컬 파서는 페이지 범위 샤드 단위로 제출 (페이지가 적으면 샤드 1개)
+                is_local = tool_name in LOCAL_TOOL_NAMES
+                shards = shard_pages(missing_pages) if is_local else [missing_pages]
+                
+                if len(shards) > 1:
+                    print(f"[SHARD] {tool_name}: {len(missing_pages)} pages in {len(shards)} shards")
+                
+                try:
+                    for shard in shards:
+                        pool = get_process_pool() if is_local else thread_pool
+                        future = pool.submit(extract_shard, tool, document_path, shard)
+                        futures[future] = (tool_name, shard)
+                        if is_local:
+                            process_futures[future] = pool
+                except Exception as e:
+                    print(f"[ERROR] {tool_name} 작업 제출 실패: {str(e)}")
+                    failures[tool_name] = "submit failed"
+            
+            # 모든 도구가 동시에 시작되므로 공통 마감 시간 기준으로 대기
+            deadline = time.time() + config.OCR_TIMEOUT
+            pending = set(futures)
+            
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, deadline - time.time()),
+                    return_when=FIRST_COMPLETED
+                )
+                
+                if not done:
+                    # 마감 시간 초과: 샤드가 남은 도구는 실패 처리
+                    # (실행 중인 로컬 작업은 취소되지 않으므로 워커를 종료해야 코어가 풀림)
+                    stuck = [future for future in pending if not future.cancel()]
+                    stuck_pools = {
+                        id(process_futures[future]): process_futures[future]
+                        for future in stuck if future in process_futures
+                    }
+                    for pool in stuck_pools.values():
+                        print(f"[WARN] Terminating stuck parser workers after {config.OCR_TIMEOUT}s")
+                        discard_process_pool(pool)
+                    
+                    timed_out = {futures[future][0] for future in pending}
+                    for tool_name in self.tools:
+                        if tool_name in timed_out and tool_name not in failures:
+                            print(f"[ERROR] {tool_name} 타임아웃 ({config.OCR_TIMEOUT}s)")
+                            failures[tool_name] = f"timeout after {config.OCR_TIMEOUT}s"
+                    break
+                
+                for future in done:
+                    tool_name, shard = futures[future]
+                    if tool_name in failures:
+                        continue
+                    
+                    try:
+                        result, shard_time = future.result()
+                        writers[tool_name].add_pages(result["pages"], shard_time / len(shard))
+                        processing_times[tool_name] += shard_time
+                    except (BrokenProcessPool, CancelledError) as e:
+                        # 다른 문서의 타임아웃으로 공유 풀이 교체됨 (실행 중 → 중단, 대기 중 → 취소)
+                        # → 새 풀에 한 번 재제출
+                        retry_key = (tool_name, tuple(shard))
+                        if retry_key in resubmitted:
+                            print(f"[ERROR] {tool_name} 에러: {str(e) or type(e).__name__}")
+                            failures[tool_name] = str(e) or type(e).__name__
+                            continue
+                        
+                        resubmitted.add(retry_key)
+                        print(f"[WARN] {tool_name}: process pool was replaced, resubmitting pages {shard}")
+                        try:
+                            pool = get_process_pool()
+                            retry = pool.submit(extract_shard, self.tools[tool_name], document_path, shard)
+                        except Exception as submit_error:
+                            print(f"[ERROR] {tool_name} 작업 제출 실패: {str(submit_error)}")
+                            failures[tool_name] = "submit failed"
+                            continue
+                        futures[retry] = (tool_name, shard)
+                        process_futures[retry] = pool
+                        pending.add(retry)
+                    except Exception as e:
+                        print(f"[ERROR] {tool_name} 에러: {str(e)}")
+                        failures[tool_name] = str(e)
+            
+            for tool_name, tool in self.tools.items():
+                if tool_name in failures:
+                    writers[tool_name].abort()
+                    results.append(self._failed_result(tool_name, failures[tool_name]))
+                    continue
+                
+                results.append(self._build_extraction_result(
+                    tool_name,
+                    tool,
+                    writers[tool_name],
+                    processing_times[tool_name],
+                    sampled_pages,
+                    total_pages,
+                    cached_page_count=cached_counts[tool_name]
+                ))
+        finally:
+            # 타임아웃된 작업이 있어도 대기하지 않음 (공유 프로세스 풀은 닫지 않고 남은 작업만 취소)
+            for future in futures:
+                future.cancel()
+            if thread_pool is not None:
+                thread_pool.shutdown(wait=False, cancel_futures=True)
+            
+            for writer in writers.values():
+                writer.abort()
+        
+        return results
+    
     def _extract_with_tool(
         self, 
         tool_name: str,
         tool: Any, 
         document_path: Union[str, Path], 
-        document_name: str
+        document_name: str,
+        sampled_pages: List[int],
+        total_pages: int,
+        pdf_hash: Optional[str] = None,
+        on_page: Optional[Callable[[PageExtractionResult], None]] = None
     ) -> ExtractionResult:
-        """범용 도구로 텍스트 추출 (페이지 샘플링)"""
+        """
+        범용 도구로 텍스트 추출 (샘플링된 페이지 중 캐시에 없는 페이지만 추출)
+        
+        tool.iter_pages()로 페이지가 나오는 대로 기록 (문서 전체 결과를 기다리지 않음)
+        """
         
         # Path 객체로 변환 (한글 경로 처리)
         if not isinstance(document_path, Path):
             document_path = Path(document_path)
         
-        start_time = time.time()
+        writer = None
         
         try:
-            # 전체 추출 실행 (페이지 수 확인용)
-            result = tool.extract(document_path)
-            total_pages = len(result["pages"])
-            
-            # 페이지 샘플링
-            sampled_pages = self._sample_pages(total_pages, max_samples=5)
-            print(f"[SAMPLING] Selected {len(sampled_pages)} pages from {total_pages} total: {sampled_pages}")
-            
-            # 전체 처리 시간 측정
-            processing_time = (time.time() - start_time) * 1000  # ms
-            
-            # API 비용 계산
-            api_cost = self._calculate_extraction_cost(tool_name, len(sampled_pages))
-            
-            # 샘플링된 페이지만 추출 (페이지당 평균 시간 계산)
-            page_results = []
-            avg_time_per_page = processing_time / len(sampled_pages) if sampled_pages else 0.0
-            
-            for page_data in result["pages"]:
-                page_num = page_data["page"]
-                if page_num in sampled_pages:
-                    page_result = PageExtractionResult(
-                        page_num=page_num,
-                        strategy=tool_name,
-                        text=page_data["text"],
-                        bbox=page_data.get("bbox", []),
-                        tables=page_data.get("tables", []),
-                        processing_time_ms=avg_time_per_page,
-                        status="success",
-                        metadata={
-                            "width": page_data.get("width", 0),
-                            "height": page_data.get("height", 0)
-                        }
-                    )
-                    page_results.append(page_result)
-            
-            # 결과 저장
-            output_dir = config.EXTRACTED_DIR / document_name.replace('.pdf', '') / tool_name
-            output_dir.mkdir(parents=True, exist_ok=True)
+            cached_pages, cached_time_ms, missing_pages = self._lookup_cache(
+                tool_name, tool, pdf_hash, sampled_pages
+            )
             
-            pages_text_path = output_dir / "pages_text_sampled.jsonl"
-            doc_meta_path = output_dir / "doc_meta.json"
+            writer = _ExtractionWriter(tool_name, tool, document_name, sampled_pages, pdf_hash, on_page)
             
-            # pages_text_sampled.jsonl 저장 (샘플링된 페이지만)
-            with open(pages_text_path, 'w', encoding='utf-8') as f:
-                for page_result in page_results:
-                    page_dict = {
-                        "page": page_result.page_num,
-                        "source": page_result.strategy,
-                        "text": page_result.text,
-                        "bbox": page_result.bbox,
-                        "tables": page_result.tables
-                    }
-                    f.write(json.dumps(page_dict, ensure_ascii=False) + '\n')
+            # 캐시된 페이지는 바로 기록
+            if cached_pages:
+                writer.add_pages(cached_pages, cached_time_ms / len(cached_pages), from_cache=True)
             
-            # doc_meta.json 저장
-            meta = {
-                "engine": tool_name,
-                "version": getattr(tool, 'get_version', lambda: "unknown")(),
-                "settings": result["settings"],
-                "total_page_count": total_pages,
-                "sampled_page_count": len(sampled_pages),
-                "sampled_pages": sampled_pages,
-                "processing_time_ms": processing_time,
-                "timestamp": datetime.now().isoformat()
-            }
-            with open(doc_meta_path, 'w', encoding='utf-8') as f:
-                json.dump(meta, f, ensure_ascii=False, indent=2)
+            # 샘플링된 페이지만 추출 (문서 길이와 무관하게 샘플 수에 비례)
+            processing_time = 0.0
+            if missing_pages:
+                page_start = time.time()
+                for page_data in tool.iter_pages(document_path, missing_pages):
+                    page_time = (time.time() - page_start) * 1000
+                    processing_time += page_time
+                    writer.add_pages([page_data], page_time)
+                    page_start = time.time()
             
-            return ExtractionResult(
-                strategy=tool_name,
-                pages_text_path=str(pages_text_path),
-                doc_meta_path=str(doc_meta_path),
-                sampled_pages=sampled_pages,
-                page_results=page_results,
-                processing_time_ms=processing_time,
-                extraction_cost_usd=api_cost,
-                page_count=len(sampled_pages),
-                total_page_count=total_pages,
-                status="success",
-                metadata=meta
+            return self._build_extraction_result(
+                tool_name,
+                tool,
+                writer,
+                processing_time + cached_time_ms,
+                sampled_pages,
+                total_pages,
+                cached_page_count=len(cached_pages)
             )
             
         except Exception as e:
+            if writer is not None:
+                writer.abort()
             print(f"[ERROR] {tool_name} 에러: {str(e)}")
-            return ExtractionResult(
-                strategy=tool_name,
-                pages_text_path="",
-                doc_meta_path="",
-                status="failed",
-                error_message=str(e)
-            )
+            return self._failed_result(tool_name, str(e))
+    
+    def _build_extraction_result(
+        self,
+        tool_name: str,
+        tool: Any,
+        writer: _ExtractionWriter,
+        processing_time: float,
+        sampled_pages: List[int],
+        total_pages: int,
+        cached_page_count: int = 0
+    ) -> ExtractionResult:
+        """기록을 마무리하고 ExtractionResult 생성 (bbox npz, doc_meta.json 저장)"""
+        
+        # API 비용 계산 (캐시에서 가져온 페이지는 호출하지 않았으므로 제외)
+        api_cost = self._calculate_extraction_cost(tool_name, len(sampled_pages) - cached_page_count)
+        
+        page_results = writer.close()
+        
+        # doc_meta.json 저장
+        meta = {
+            "engine": tool_name,
+            "version": getattr(tool, 'get_version', lambda: "unknown")(),
+            "settings": getattr(tool, "settings", {}),
+            "total_page_count": total_pages,
+            "sampled_page_count": len(sampled_pages),
+            "sampled_pages": sampled_pages,
+            "cached_page_count": cached_page_count,
+            "processing_time_ms": processing_time,
+            "timestamp": datetime.now().isoformat()
+        }
+        with open(writer.doc_meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        
+        return ExtractionResult(
+            strategy=tool_name,
+            pages_text_path=str(writer.pages_text_path),
+            doc_meta_path=str(writer.doc_meta_path),
+            sampled_pages=sampled_pages,
+            page_results=page_results,
+            processing_time_ms=processing_time,
+            extraction_cost_usd=api_cost,
+            page_count=len(sampled_pages),
+            total_page_count=total_pages,
+            status="success",
+            metadata=meta
+        )
+    
+    def _failed_result(self, tool_name: str, error_message: str) -> ExtractionResult:
+        """실패한 추출 결과 생성"""
+        return ExtractionResult(
+            strategy=tool_name,
+            pages_text_path="",
+            doc_meta_path="",
+            status="failed",
+            error_message=error_message
+        )
 
 
 if __name__ == "__main__":
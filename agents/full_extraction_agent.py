@@ -0,0 +1,197 @@
+"""
+전체 문서 추출 Agent (선택 단계)
+Judge가 최종 선택한 전략으로 샘플이 아닌 문서 전체를 추출
+"""
+
+import json
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from datetime import datetime
+
+from state import DocumentState, BBoxTable
+import config
+from tools.pdfplumber_tool import PDFPlumberTool
+from tools.pdfminer_tool import PDFMinerTool
+from tools.pypdfium2_tool import PyPDFium2Tool
+from tools.upstage_ocr_tool import UpstageOCRTool
+from tools.upstage_document_parse_tool import UpstageDocumentParseTool
+from tools.custom_split_tool import CustomSplitTool
+from utils.sharded_extraction import iter_sharded
+
+
+# 페이지 범위 샤딩으로 추출하는 로컬 파서 (나머지 API 도구는 페이지 묶음 단위 업로드)
+LOCAL_TOOLS = {
+    "pdfplumber": PDFPlumberTool,
+    "pdfminer": PDFMinerTool,
+    "pypdfium2": PyPDFium2Tool
+}
+
+API_TOOLS = {
+    "upstage_ocr": UpstageOCRTool,
+    "upstage_document_parse": UpstageDocumentParseTool
+}
+
+
+class FullExtractionAgent:
+    """
+    전체 문서 추출 에이전트 (config.FULL_EXTRACTION_ENABLED 또는 --full-extraction)
+
+    역할:
+    - 최종 선택 전략의 도구로 모든 페이지 추출
+    - 로컬 파서: 페이지 범위 샤드를 공유 프로세스 풀에서 동시에 추출 (iter_sharded)
+    - API 도구: config.FULL_EXTRACTION_API_CHUNK_PAGES 페이지씩 나눠 업로드
+    - 검증 단계에서 custom_split 폴백으로 통과한 로컬 전략은 문서 전체를 분할한 뒤 추출
+      (양면 스캔/가로 IR 자료 등, 분할은 CustomSplitTool의 병렬 분할 사용)
+    - 페이지가 나오는 대로 pages_text_full.jsonl에 기록하고 메모리에 모으지 않음
+      (수백~수천 페이지 문서도 메모리 사용량이 샤드/묶음 크기로 제한됨)
+    - 추출 캐시는 사용하지 않음 (샘플 페이지 단위 캐시, 전체 문서를 넣으면 용량 한도를 금방 채움)
+    """
+
+    def run(self, state: DocumentState) -> DocumentState:
+        """전체 문서 추출 실행"""
+
+        selection = state["final_selection"]
+        if not selection:
+            print("[SKIP] Full extraction: no final selection")
+            return state
+
+        strategy = selection.selected_strategy
+        document_path = Path(state["document_path"])
+        total_pages = state["doc_meta"].get("total_pages", 0)
+
+        print(f"\n{'='*60}")
+        print(f"[FULL_EXTRACTION] {state['document_name']} with {strategy} ({total_pages} pages)")
+        print(f"{'='*60}\n")
+
+        use_custom_split = False
+        if strategy in LOCAL_TOOLS:
+            tool = LOCAL_TOOLS[strategy]()
+            use_custom_split = self._uses_custom_split(state, strategy)
+            if use_custom_split:
+                pages = self._iter_custom_split_pages(tool, document_path)
+            else:
+                pages = iter_sharded(tool, document_path, range(1, total_pages + 1))
+        elif strategy in API_TOOLS:
+            tool = API_TOOLS[strategy]()
+            pages = self._iter_api_chunks(tool, document_path, total_pages)
+        else:
+            print(f"[WARN] Full extraction not supported for strategy: {strategy}")
+            return state
+
+        output_dir = config.EXTRACTED_DIR / state["document_name"].replace('.pdf', '') / strategy
+        output_dir.mkdir(parents=True, exist_ok=True)
+        pages_text_path = output_dir / "pages_text_full.jsonl"
+
+        start_time = time.time()
+        page_count = self._write_pages(pages, strategy, pages_text_path)
+        processing_time = (time.time() - start_time) * 1000
+
+        meta = {
+            "engine": strategy,
+            "version": getattr(tool, 'get_version', lambda: "unknown")(),
+            "settings": getattr(tool, "settings", {}),
+            "total_page_count": total_pages,
+            "extracted_page_count": page_count,
+            "processing_time_ms": processing_time,
+            "extraction_cost_usd": config.UPSTAGE_API_PRICING.get(strategy, 0.0) * page_count,
+            "custom_split": use_custom_split,
+            "pages_text_path": str(pages_text_path),
+            "timestamp": datetime.now().isoformat()
+        }
+        with open(output_dir / "doc_meta_full.json", 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        state["metadata"]["full_extraction"] = meta
+
+        print(f"[OK] Full extraction completed: {page_count}/{total_pages} pages, "
+              f"{processing_time:.0f}ms ({processing_time / max(page_count, 1):.0f}ms/page)")
+        print(f"[OUTPUT] {pages_text_path}\n")
+
+        return state
+
+    def _uses_custom_split(self, state: DocumentState, strategy: str) -> bool:
+        """선택 전략의 샘플 검증에서 custom_split 폴백이 사용되었는지 확인"""
+        return any(
+            validation.strategy == strategy and "custom_split" in validation.fallback_path
+            for validation in state["validation_results"]
+        )
+
+    def _iter_custom_split_pages(self, tool: Any, document_path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        문서 전체를 custom split으로 분할한 뒤 추출하고 원본 페이지 단위로 합쳐 반환
+
+        - 분할 PDF 추출은 iter_sharded로 샤딩 (페이지 순서대로 도착)
+        - 한 원본 페이지의 분할 페이지는 연속되므로 원본 페이지가 바뀔 때마다 바로 반환
+        """
+        split_record = CustomSplitTool().split_document(document_path)
+        original_page_of = {
+            split_page: page_num
+            for page_num, split_pages in split_record["page_map"].items()
+            for split_page in split_pages
+        }
+
+        print(f"[CUSTOM_SPLIT] Full document split: {len(split_record['page_map'])} pages "
+              f"→ {len(original_page_of)} split pages")
+
+        current_page = None
+        segments: List[Dict[str, Any]] = []
+        for page_data in iter_sharded(tool, split_record["split_pdf_path"], range(1, len(original_page_of) + 1)):
+            page_num = original_page_of.get(page_data["page"])
+            if page_num != current_page and segments:
+                yield self._merge_segments(current_page, segments)
+                segments = []
+            current_page = page_num
+            segments.append(page_data)
+
+        if segments:
+            yield self._merge_segments(current_page, segments)
+
+    def _merge_segments(self, page_num: int, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """분할 페이지들을 원본 페이지 하나로 합침 (좌 → 우 순서, 검증 단계 재추출과 같은 방식)"""
+        return {
+            "page": page_num,
+            "text": "\n\n".join(segment["text"] for segment in segments if segment["text"]),
+            "bbox": BBoxTable.concat(segment.get("bbox", []) for segment in segments),
+            "tables": [table for segment in segments for table in segment.get("tables", [])]
+        }
+
+    def _iter_api_chunks(self, tool: Any, document_path: Path, total_pages: int) -> Iterator[Dict[str, Any]]:
+        """API 도구 전체 추출 (페이지 묶음별 업로드, 묶음 결과만 메모리에 보관)"""
+        chunk_size = max(1, config.FULL_EXTRACTION_API_CHUNK_PAGES)
+        page_numbers = iter(range(1, total_pages + 1))
+
+        while True:
+            chunk: List[int] = list(islice(page_numbers, chunk_size))
+            if not chunk:
+                return
+            yield from tool.iter_pages(document_path, chunk)
+
+    def _write_pages(self, pages: Iterator[Dict[str, Any]], strategy: str, pages_text_path: Path) -> int:
+        """
+        페이지를 도착 순서(페이지 순서)대로 jsonl에 기록
+
+        Returns:
+            기록한 페이지 수
+        """
+        page_count = 0
+
+        # 중간에 실패하면 부분 결과를 남기지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = pages_text_path.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for page_data in pages:
+                    f.write(json.dumps({
+                        "page": page_data["page"],
+                        "source": strategy,
+                        "text": page_data["text"],
+                        "bbox_count": len(page_data.get("bbox", [])),
+                        "tables": page_data.get("tables", [])
+                    }, ensure_ascii=False) + '\n')
+                    page_count += 1
+            tmp_path.replace(pages_text_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return page_count
@@ -4,7 +4,7 @@ Solar pro2 기반 품질 평가 및 최적 전략 선택
 """
 
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from state import (
     DocumentState, JudgeResult, PageJudgeResult, FinalSelection, ValidationResult, PageValidationResult,
@@ -12,6 +12,8 @@ from state import (
 )
 import config
 from utils.llm_client import SolarClient
+from utils.batch_runner import run_batch
+from utils.log_buffer import capture_task_output, task_output
 from prompts.judge_prompts import (
     create_judge_prompt,
     parse_judge_response
@@ -53,22 +55,44 @@ class JudgeAgent:
         total_passed_pages = sum(sum(1 for p in v.page_validations if p.passed) for v in candidates)
         print(f"[INFO] Total passed pages to judge: {total_passed_pages}\n")
         
-        # 각 후보 평가 (페이지별)
+        # 페이지별 Judge (모든 전략의 Pass 페이지를 하나의 작업 큐로 병렬 처리)
+        items = [
+            (validation, page_val)
+            for validation in candidates
+            for page_val in validation.page_validations
+            if page_val.passed  # Pass된 페이지만 LLM Judge
+        ]
+        print(f"[JUDGE] {len(items)} page tasks, up to {config.JUDGE_MAX_CONCURRENCY} in parallel\n")
+        
+        def judge_task(task_idx: int, item: Tuple[ValidationResult, PageValidationResult]):
+            validation, page_val = item
+            header = f"  [{task_idx}/{len(items)}] {validation.strategy} - Page {page_val.page_num}"
+            
+            # 작업별 출력은 모았다가 한 번에 출력 (병렬 작업 출력이 섞이지 않도록)
+            with task_output(header):
+                page_judge = self._judge_page(page_val, validation, state)
+                print(f"    S_total={page_judge.S_total:.2f}" if page_judge else "    [ERROR]")
+                return page_judge
+        
+        with capture_task_output():
+            task_results = run_batch(
+                items,
+                judge_task,
+                max_workers=config.JUDGE_MAX_CONCURRENCY,
+                max_in_flight=config.JUDGE_MAX_CONCURRENCY
+            )
+        
+        # 전략별 집계 (입력 순서 유지)
+        page_judges_by_strategy: Dict[str, List[PageJudgeResult]] = {}
+        for (validation, _), page_judge in zip(items, task_results):
+            if page_judge:
+                page_judges_by_strategy.setdefault(validation.strategy, []).append(page_judge)
+        
         for idx, validation in enumerate(candidates, 1):
-            print(f"[{idx}/{len(candidates)}] Evaluating {validation.strategy}...")
+            print(f"\n[{idx}/{len(candidates)}] {validation.strategy}")
             print(f"  Pages: {len(validation.page_validations)}")
             
-            # 페이지별 Judge 실행 (Pass된 페이지만)
-            page_judges = []
-            for page_val in validation.page_validations:
-                if page_val.passed:  # Pass된 페이지만 LLM Judge
-                    print(f"  Page {page_val.page_num}...", end=" ")
-                    page_judge = self._judge_page(page_val, validation, state)
-                    if page_judge:
-                        page_judges.append(page_judge)
-                        print(f"S_total={page_judge.S_total:.2f}")
-                    else:
-                        print("[ERROR]")
+            page_judges = page_judges_by_strategy.get(validation.strategy, [])
             
             # 전체 Judge 결과 생성 (페이지별 평균)
             if page_judges:
@@ -131,8 +155,8 @@ class JudgeAgent:
                 doc_meta=state["doc_meta"]
             )
             
-            # LLM 호출
-            response = self.llm_client.call(prompt)
+            # LLM 호출 (시간 한도 초과 시 요청/재시도를 멈추고 해당 페이지만 제외)
+            response = self.llm_client.call(prompt, timeout=config.JUDGE_CALL_TIMEOUT)
             
             if not response:
                 return None
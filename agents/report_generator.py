@@ -5,6 +5,7 @@
 
 import json
 import csv
+import threading
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
@@ -15,6 +16,9 @@ import config
 # 세션 타임스탬프 (모든 CSV가 같은 타임스탬프 사용)
 SESSION_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+# 세션 CSV는 여러 문서가 읽고-수정-저장하므로 배치 병렬 실행 시 직렬화
+_SESSION_CSV_LOCK = threading.Lock()
+
 
 class ReportGenerator:
     """
@@ -44,23 +48,24 @@ class ReportGenerator:
         self._generate_judge_report(state)
         print("[OK] Complete")
         
-        # 2. page_level_results.csv 업데이트 (페이지별 상세)
-        print("\n[2/4] Updating page_level_results.csv...")
-        self._update_page_level_csv(state)
-        print("[OK] Complete")
-        
-        # 3. final_selection.csv 업데이트
-        print("\n[3/4] Updating final_selection.csv...")
-        self._update_final_selection_csv(state)
-        print("[OK] Complete")
-        
-        # 4. failed_documents.csv 업데이트 (필요 시)
-        if not state["final_selection"] or not state["judge_results"]:
-            print("\n[4/4] Updating failed_documents.csv...")
-            self._update_failed_documents_csv(state)
+        with _SESSION_CSV_LOCK:
+            # 2. page_level_results.csv 업데이트 (페이지별 상세)
+            print("\n[2/4] Updating page_level_results.csv...")
+            self._update_page_level_csv(state)
+            print("[OK] Complete")
+            
+            # 3. final_selection.csv 업데이트
+            print("\n[3/4] Updating final_selection.csv...")
+            self._update_final_selection_csv(state)
             print("[OK] Complete")
-        else:
-            print("\n[SKIP] [4/4] failed_documents.csv not needed (success case)")
+            
+            # 4. failed_documents.csv 업데이트 (필요 시)
+            if not state["final_selection"] or not state["judge_results"]:
+                print("\n[4/4] Updating failed_documents.csv...")
+                self._update_failed_documents_csv(state)
+                print("[OK] Complete")
+            else:
+                print("\n[SKIP] [4/4] failed_documents.csv not needed (success case)")
         
         print(f"\n[OUTPUT] Reports saved to: {config.REPORTS_DIR}")
         print(f"[OUTPUT] Tables saved to: {config.TABLES_DIR}\n")
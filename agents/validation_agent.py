@@ -3,30 +3,199 @@
 Solar LLM이 텍스트 추출 결과의 Pass/Fail 판정 및 자동 폴백 반복 (페이지 단위)
 """
 
+import contextvars
+import copy
+import hashlib
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from itertools import combinations
 
 from state import (
     DocumentState, ValidationResult, PageValidationResult, ExtractionResult, PageExtractionResult,
-    add_validation_result, add_error
+    BBoxTable, add_validation_result, add_error
 )
 import config
 from utils.llm_client import SolarClient
+from utils.metrics import ValidationMetrics
+from utils.disk_cache import make_cache_key
+from utils.batch_runner import run_batch
+from utils.log_buffer import capture_task_output, task_output
+from utils.extraction_cache import get_extraction_cache, file_sha256
 from prompts.validation_prompts import (
     create_validation_prompt,
+    create_multi_page_validation_prompt,
     parse_validation_response
 )
 
 
+class _FallbackMemo:
+    """
+    한 페이지의 폴백 탐색 중 공유하는 메모 (워커 스레드 간 공유)
+    
+    - prefix_pages: (페이지 해시, 도구 접두 조합) → 도구 적용 결과 (같은 접두는 한 번만 실행)
+    - verdicts: 검증 입력(텍스트/표/bbox) 해시 → 검증 결과 Future (같은 출력은 LLM 1회만 호출)
+    """
+    
+    def __init__(self, page_result: PageExtractionResult):
+        self.page_hash = make_cache_key(page_result.strategy, page_result.page_num, page_result.text)
+        self.prefix_pages: Dict[Tuple[str, Tuple[str, ...]], List[Dict]] = {}
+        self.verdicts: Dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.prefix_locks: Dict[Tuple[str, Tuple[str, ...]], threading.Lock] = {}
+    
+    def prefix_lock(self, key: Tuple[str, Tuple[str, ...]]) -> threading.Lock:
+        with self.lock:
+            return self.prefix_locks.setdefault(key, threading.Lock())
+    
+    def claim_verdict(self, key: str) -> Tuple[Future, bool]:
+        """검증 결과 Future 반환 (True면 호출 측이 검증해서 결과를 채워야 함)"""
+        with self.lock:
+            if key in self.verdicts:
+                return self.verdicts[key], False
+            future = Future()
+            self.verdicts[key] = future
+            return future, True
+
+
+def _validation_input_key(page_result: PageExtractionResult) -> str:
+    """검증 결과를 좌우하는 입력(텍스트, 표, bbox)의 해시"""
+    bbox = page_result.bbox
+    bbox_digest = hashlib.sha256(bbox.coords.tobytes() + bbox.text_buffer).hexdigest()
+    return make_cache_key(page_result.text, page_result.tables, bbox_digest)
+
+
+class _InitialValidationStream:
+    """
+    1단계 추출과 동시에 진행하는 초기 검증 (ValidationAgent.start_initial_validation)
+    
+    - 추출 단계가 페이지를 기록할 때마다 add_page()로 받아 바로 사전 검증
+    - LLM 검증이 필요한 페이지는 config.VALIDATION_BATCH_SIZE개가 모이는 대로 묶음 호출 제출
+      (느린 도구의 추출이 끝나기 전에 먼저 나온 페이지의 LLM 검증 시작)
+    - finish(): 남은 페이지를 제출하고 모든 결과를 기다려 반환
+      → ValidationAgent.run()은 여기서 판정된 페이지의 초기 검증을 생략
+    - 판정을 얻지 못한 페이지(호출 실패, 응답 누락)는 run()에서 기존대로 검증
+    """
+    
+    def __init__(self, agent: "ValidationAgent"):
+        self.agent = agent
+        self.validations: Dict[Tuple[str, int], PageValidationResult] = {}
+        self.pregates: Dict[Tuple[str, int], Dict] = {}
+        self.extractions: Dict[str, ExtractionResult] = {}
+        self.pending: List[Tuple[ExtractionResult, PageExtractionResult]] = []
+        self.futures: List[Future] = []
+        self.page_count = 0
+        self.local_count = 0
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max(1, config.VALIDATION_MAX_CONCURRENCY))
+    
+    def add_page(self, page_result: PageExtractionResult):
+        """추출된 페이지 1개 사전 검증 (실패해도 추출은 계속, 해당 페이지는 run()에서 검증)"""
+        start_time = time.time()
+        key = (page_result.strategy, page_result.page_num)
+        
+        with self.lock:
+            # 판정 결과에는 전략 이름만 쓰이므로 추출 결과 대신 전략별 자리표시자 사용
+            extraction = self.extractions.setdefault(page_result.strategy, ExtractionResult(
+                strategy=page_result.strategy,
+                pages_text_path="",
+                doc_meta_path=""
+            ))
+            self.page_count += 1
+        
+        try:
+            if len(page_result.text.strip()) < 20:
+                validation, pregate = self.agent._short_text_validation(page_result, extraction, start_time), None
+            else:
+                pregate = self.agent._pregate_decisions([page_result])[0]
+                validation = None
+                if pregate is not None and pregate["decision"] != "escalate":
+                    validation = self.agent._pregate_validation(page_result, extraction, pregate, start_time)
+        except Exception as e:
+            print(f"[WARN] Pipelined pre-validation failed for {key}: {str(e)}")
+            return
+        
+        with self.lock:
+            if pregate is not None:
+                self.pregates[key] = pregate
+            
+            if validation is not None:
+                self.validations[key] = validation
+                if pregate is not None:
+                    self.local_count += 1
+                return
+            
+            self.pending.append((extraction, page_result))
+            if len(self.pending) >= max(1, config.VALIDATION_BATCH_SIZE):
+                self._submit_pending()
+    
+    def _submit_pending(self):
+        """모인 페이지를 LLM 검증 작업으로 제출 (self.lock 안에서 호출)"""
+        batch, self.pending = self.pending, []
+        
+        if config.VALIDATION_BATCH_SIZE > 1:
+            self.futures.append(self.executor.submit(
+                self.agent._validate_pages_batched, batch, dict(self.pregates)
+            ))
+            return
+        
+        # 묶음 검증을 쓰지 않으면 페이지별 호출
+        for extraction, page_result in batch:
+            self.futures.append(self.executor.submit(self._validate_single, extraction, page_result))
+    
+    def _validate_single(
+        self,
+        extraction: ExtractionResult,
+        page_result: PageExtractionResult
+    ) -> Dict[Tuple[str, int], PageValidationResult]:
+        validation = self.agent._validate_page(page_result, extraction)
+        return {(extraction.strategy, page_result.page_num): validation} if validation else {}
+    
+    def finish(self) -> Dict[Tuple[str, int], PageValidationResult]:
+        """
+        남은 페이지를 제출하고 초기 검증 결과 반환
+        
+        Returns:
+            {(전략, 페이지 번호): 검증 결과}
+        """
+        with self.lock:
+            if self.pending:
+                self._submit_pending()
+            futures = list(self.futures)
+        
+        try:
+            for future in futures:
+                try:
+                    self.validations.update(future.result() or {})
+                except Exception as e:
+                    print(f"[WARN] Pipelined validation batch failed: {str(e)}")
+        finally:
+            self.close()
+        
+        print(f"[PIPELINE] {len(self.validations)}/{self.page_count} pages validated during extraction "
+              f"({self.local_count} decided locally)")
+        
+        return dict(self.validations)
+    
+    def close(self):
+        """대기 중인 검증 작업 취소 (추출 실패 등으로 결과를 쓰지 않을 때)"""
+        with self.lock:
+            self.pending = []
+            for future in self.futures:
+                future.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
 class ValidationAgent:
     """
     2단계: 유효성 검증 에이전트 (Solar LLM 기반 페이지별 폴백 통합)
     
     역할:
-    - Solar LLM이 텍스트 추출 결과를 보고 "말이 되는지" 종합 판단
-    - 페이지별 Pass/Fail 판정 (1회 LLM 호출)
+    - 휴리스틱 사전 검증(ValidationMetrics)으로 확실한 Pass/Fail 페이지는 LLM 없이 판정
+    - Solar LLM이 텍스트 추출 결과를 보고 "말이 되는지" 종합 판단 (애매한 페이지만)
+    - 페이지별 Pass/Fail 판정 (초기 검증은 여러 페이지를 1회 LLM 호출로 묶어서 판정)
     - 실패 시 페이지별로 도구 순차 적용:
       1. 단일 도구 시도 → LLM 재검증
       2. Pass가 나오면 즉시 중단
@@ -43,6 +212,7 @@ class ValidationAgent:
     
     def __init__(self):
         self.llm_client = SolarClient()
+        self.metrics = ValidationMetrics()
         self._init_tools()
     
     def _init_tools(self):
@@ -71,37 +241,65 @@ class ValidationAgent:
         
         extraction_results = state["extraction_results"]
         
+        items = [
+            (extraction, page_result)
+            for extraction in extraction_results
+            if extraction.status == "success"
+            for page_result in extraction.page_results
+        ]
+        
+        # 추출과 동시에 끝난 초기 검증 (config.VALIDATION_PIPELINED, 폴백 후 재검증 시에는 없음)
+        initial_validations = state["metadata"].pop("initial_validations", None) or {}
+        if initial_validations:
+            print(f"[PIPELINE] Reusing {len(initial_validations)} initial validations from extraction stage")
+        
+        # 사전 검증 (확실한 페이지는 로컬 판정, 나머지만 LLM으로)
+        local_validations, escalated, pregates = self._pregate_pages([
+            (extraction, page_result) for extraction, page_result in items
+            if (extraction.strategy, page_result.page_num) not in initial_validations
+        ])
+        initial_validations.update(local_validations)
+        
+        # 초기 검증 일괄 수행 (모든 전략의 페이지를 묶어서 LLM 호출 수 절감)
+        initial_validations.update(self._validate_pages_batched(escalated, pregates))
+        
+        # 페이지별 검증 + 폴백 (모든 전략의 페이지를 하나의 작업 큐로 병렬 처리)
+        print(f"\n[VALIDATION] {len(items)} page tasks, up to {config.VALIDATION_MAX_CONCURRENCY} in parallel")
+        
+        def validate_task(task_idx: int, item: Tuple[ExtractionResult, PageExtractionResult]):
+            extraction, page_result = item
+            header = f"\n  [{task_idx}/{len(items)}] {extraction.strategy} - Page {page_result.page_num}"
+            
+            # 작업별 출력은 모았다가 한 번에 출력 (병렬 작업 출력이 섞이지 않도록)
+            with task_output(header):
+                return self._validate_page_task(
+                    page_result, extraction, state,
+                    initial_validations.get((extraction.strategy, page_result.page_num))
+                )
+        
+        with capture_task_output():
+            task_results = run_batch(
+                items,
+                validate_task,
+                max_workers=config.VALIDATION_MAX_CONCURRENCY,
+                max_in_flight=config.VALIDATION_MAX_CONCURRENCY
+            )
+        
+        # 전략별 집계 (입력 순서 유지)
+        page_validations_by_strategy: Dict[str, List[PageValidationResult]] = {}
+        for (extraction, _), page_validation in zip(items, task_results):
+            if page_validation:
+                page_validations_by_strategy.setdefault(extraction.strategy, []).append(page_validation)
+        
         for idx, extraction in enumerate(extraction_results, 1):
             if extraction.status != "success":
                 print(f"[SKIP] [{idx}/{len(extraction_results)}] {extraction.strategy} - extraction failed")
                 continue
             
-            print(f"\n[{idx}/{len(extraction_results)}] Validating {extraction.strategy}...")
+            print(f"\n[{idx}/{len(extraction_results)}] {extraction.strategy}")
             print(f"  Sampled pages: {extraction.sampled_pages}")
             
-            # 페이지별 검증 + 폴백
-            page_validations = []
-            for page_idx, page_result in enumerate(extraction.page_results, 1):
-                print(f"\n  [{page_idx}/{len(extraction.page_results)}] Page {page_result.page_num}...")
-                
-                # 페이지 검증 (폴백 포함)
-                page_validation = self._validate_page_with_fallback(
-                    page_result, extraction, state
-                )
-                
-                if page_validation:
-                    page_validations.append(page_validation)
-                    
-                    # 결과 출력
-                    if page_validation.passed:
-                        fallback_info = f" (after {len(page_validation.fallback_path)} tools)" if page_validation.fallback_path else ""
-                        print(f"    [PASS]{fallback_info} scores: {page_validation.scores}")
-                    else:
-                        print(f"    [FAIL] after {page_validation.fallback_attempts} attempts")
-                        print(f"    Failed axes: {[k for k, v in page_validation.pass_flags.items() if not v]}")
-                        print(f"    Final scores: {page_validation.scores}")
-                else:
-                    print(f"    [ERROR] Validation failed")
+            page_validations = page_validations_by_strategy.get(extraction.strategy, [])
             
             # 전체 검증 결과 생성 (페이지별 평균)
             if page_validations:
@@ -127,17 +325,55 @@ class ValidationAgent:
         
         return state
     
+    def start_initial_validation(self) -> _InitialValidationStream:
+        """
+        1단계 추출과 동시에 초기 검증 시작
+        
+        Returns:
+            add_page()를 BasicExtractionAgent.run(on_page=...)에 넘기고,
+            추출이 끝나면 finish() 결과를 state["metadata"]["initial_validations"]에 저장
+        """
+        return _InitialValidationStream(self)
+    
+    def _validate_page_task(
+        self,
+        page_result: PageExtractionResult,
+        extraction: ExtractionResult,
+        state: DocumentState,
+        initial_validation: Optional[PageValidationResult]
+    ) -> Optional[PageValidationResult]:
+        """페이지 1개 검증 작업 (폴백 포함) + 결과 출력"""
+        
+        page_validation = self._validate_page_with_fallback(
+            page_result, extraction, state,
+            initial_validation=initial_validation
+        )
+        
+        if page_validation:
+            if page_validation.passed:
+                fallback_info = f" (after {len(page_validation.fallback_path)} tools)" if page_validation.fallback_path else ""
+                print(f"    [PASS]{fallback_info} scores: {page_validation.scores}")
+            else:
+                print(f"    [FAIL] after {page_validation.fallback_attempts} attempts")
+                print(f"    Failed axes: {[k for k, v in page_validation.pass_flags.items() if not v]}")
+                print(f"    Final scores: {page_validation.scores}")
+        else:
+            print(f"    [ERROR] Validation failed")
+        
+        return page_validation
+    
     def _validate_page_with_fallback(
         self,
         page_result: PageExtractionResult,
         extraction: ExtractionResult,
-        state: DocumentState
+        state: DocumentState,
+        initial_validation: Optional[PageValidationResult] = None
     ) -> Optional[PageValidationResult]:
         """
         개별 페이지 검증 + 실패 시 폴백 시도
         
         프로세스:
-        1. 초기 검증
+        1. 초기 검증 (일괄 검증 결과가 있으면 재사용)
         2. Pass → 반환
         3. Fail → 단일 도구 순차 시도
         4. Pass → 반환
@@ -147,61 +383,129 @@ class ValidationAgent:
         """
         
         # 1. 초기 검증
-        print(f"    Initial validation...", end=" ")
-        page_validation = self._validate_page(page_result, extraction)
+        page_validation = initial_validation or self._validate_page(page_result, extraction)
         
         if not page_validation:
+            print(f"    Initial validation... [ERROR]")
             return None
         
         if page_validation.passed:
-            print("[PASS]")
+            print(f"    Initial validation... [PASS]")
             return page_validation
         
-        print(f"[FAIL]")
+        print(f"    Initial validation... [FAIL]")
         print(f"    Failed axes: {[k for k, v in page_validation.pass_flags.items() if not v]}")
         print(f"    Scores: {page_validation.scores}")
         
         # 2. 도구 조합 시도 (단일 → 2개)
-        best_validation = page_validation
-        
         tool_combinations = self._generate_tool_combinations(page_validation)
         
-        for combo_idx, tool_combo in enumerate(tool_combinations, 1):
-            print(f"    Trying tools: {' + '.join(tool_combo)}...", end=" ")
-            
-            # 도구 적용
-            improved_page = self._apply_tools_to_page(
-                page_result,
-                tool_combo,
-                state["document_path"]
-            )
-            
-            if not improved_page:
-                print("[SKIP]")
-                continue
-            
-            # 재검증
-            new_validation = self._revalidate_page(
-                improved_page,
-                extraction,
-                previous_validation=best_validation,
-                fallback_tools=tool_combo
-            )
-            
-            if not new_validation:
-                print("[ERROR]")
-                continue
-            
-            # Pass 체크
-            if new_validation.passed:
-                print(f"[PASS] (confidence: {new_validation.scores.get('llm_confidence', 0):.2f})")
-                return new_validation
-            else:
+        return self._explore_tool_combinations(
+            page_result, extraction, state["document_path"], tool_combinations, page_validation
+        )
+    
+    def _explore_tool_combinations(
+        self,
+        page_result: PageExtractionResult,
+        extraction: ExtractionResult,
+        document_path: str,
+        tool_combinations: List[List[str]],
+        initial_validation: PageValidationResult
+    ) -> PageValidationResult:
+        """
+        도구 조합 추측 실행 (config.FALLBACK_SPECULATIVE_WIDTH개를 동시에 적용 + 재검증)
+        
+        결과는 조합 순서대로 확인하므로 순차 실행과 판정이 같음:
+        - 순서상 처음으로 Pass한 조합 반환
+        - 모두 Fail이면 confidence가 가장 높은 결과 반환 (개선 없으면 2회 이후 조기 중단)
+        
+        어떤 조합이 Pass하면 그 뒤 조합은 LLM 호출 전에 중단하고,
+        config.FALLBACK_PAGE_TIMEOUT 초과 시 그때까지의 최선 결과 반환
+        """
+        
+        best_validation = initial_validation
+        if not tool_combinations:
+            return best_validation
+        
+        # 접두 조합 결과 / 검증 결과 공유 (원본과 같은 출력은 초기 검증 결과 재사용)
+        memo = _FallbackMemo(page_result)
+        original_verdict, _ = memo.claim_verdict(_validation_input_key(page_result))
+        original_verdict.set_result(initial_validation)
+        
+        width = max(1, config.FALLBACK_SPECULATIVE_WIDTH)
+        timeout = config.FALLBACK_PAGE_TIMEOUT
+        deadline = time.time() + timeout if timeout else None
+        
+        # 이 인덱스보다 뒤의 조합은 중단 (Pass한 조합 중 가장 앞선 인덱스)
+        stop_index = [len(tool_combinations)]
+        stop_lock = threading.Lock()
+        
+        def on_done(combo_index: int, future):
+            if future.cancelled() or future.exception() is not None:
+                return
+            new_validation = future.result()[1]
+            if new_validation and new_validation.passed:
+                with stop_lock:
+                    stop_index[0] = min(stop_index[0], combo_index)
+        
+        pool = ThreadPoolExecutor(max_workers=width)
+        futures = {}
+        next_submit = 0
+        
+        try:
+            for combo_index, tool_combo in enumerate(tool_combinations):
+                # 앞으로 width개 조합을 미리 실행
+                while (
+                    next_submit < len(tool_combinations)
+                    and next_submit < combo_index + width
+                    and next_submit <= stop_index[0]
+                ):
+                    # 작업 출력 버퍼 등 현재 컨텍스트를 워커 스레드로 전달
+                    future = pool.submit(
+                        contextvars.copy_context().run,
+                        self._try_tool_combination,
+                        page_result, extraction, document_path,
+                        tool_combinations[next_submit], next_submit, stop_index, memo
+                    )
+                    future.add_done_callback(lambda f, i=next_submit: on_done(i, f))
+                    futures[next_submit] = future
+                    next_submit += 1
+                
+                remaining = deadline - time.time() if deadline else None
+                try:
+                    improved_page, new_validation = futures[combo_index].result(
+                        timeout=max(remaining, 0) if remaining is not None else None
+                    )
+                except FuturesTimeoutError:
+                    print(f"    [TIMEOUT] Fallback exceeded {timeout}s, keeping best result")
+                    break
+                except Exception as e:
+                    print(f"    Trying tools: {' + '.join(tool_combo)}... [ERROR] {e}")
+                    continue
+                
+                if not improved_page:
+                    print(f"    Trying tools: {' + '.join(tool_combo)}... [SKIP]")
+                    continue
+                
+                if not new_validation:
+                    print(f"    Trying tools: {' + '.join(tool_combo)}... [ERROR]")
+                    continue
+                
+                # 폴백 정보 기록 (순서대로 확인하므로 순차 실행과 같은 경로)
+                self._record_fallback(new_validation, improved_page, best_validation, tool_combo)
+                reused = " (same output, verdict reused)" if new_validation.metadata.get("verdict_reused_from") else ""
+                
+                # Pass 체크
+                if new_validation.passed:
+                    print(f"    Trying tools: {' + '.join(tool_combo)}... "
+                          f"[PASS] (confidence: {new_validation.scores.get('llm_confidence', 0):.2f}){reused}")
+                    return new_validation
+                
                 # Fail - confidence 비교해서 최선 유지
                 old_confidence = best_validation.scores.get('llm_confidence', 0)
                 new_confidence = new_validation.scores.get('llm_confidence', 0)
                 
-                print(f"[FAIL] (confidence: {new_confidence:.2f})")
+                print(f"    Trying tools: {' + '.join(tool_combo)}... [FAIL] (confidence: {new_confidence:.2f}){reused}")
                 
                 # confidence가 개선되면 best 업데이트
                 if new_confidence > old_confidence:
@@ -209,13 +513,63 @@ class ValidationAgent:
                     print(f"    [IMPROVEMENT] {old_confidence:.2f} → {new_confidence:.2f}")
                 
                 # confidence가 전혀 개선 안 되면 조기 중단 (2회 시도 후)
-                if new_confidence <= old_confidence and combo_idx > 2:
+                if new_confidence <= old_confidence and combo_index + 1 > 2:
                     print(f"    [STOP] No improvement, stopping fallback")
                     break
+        finally:
+            # 남은 조합 중단 (실행 중인 조합은 LLM 호출 전에 멈춤)
+            with stop_lock:
+                stop_index[0] = -1
+            pool.shutdown(wait=False, cancel_futures=True)
         
         # 최종 Fail (최선의 결과 반환)
         return best_validation
     
+    def _try_tool_combination(
+        self,
+        page_result: PageExtractionResult,
+        extraction: ExtractionResult,
+        document_path: str,
+        tool_combo: List[str],
+        combo_index: int,
+        stop_index: List[int],
+        memo: Optional[_FallbackMemo] = None
+    ) -> Tuple[Optional[PageExtractionResult], Optional[PageValidationResult]]:
+        """
+        도구 조합 적용 + 재검증 (워커 스레드, 중단 요청 시 LLM 호출 생략)
+        
+        memo가 있으면 같은 접두 조합은 재실행하지 않고,
+        이미 검증한(또는 검증 중인) 출력과 같으면 그 결과를 복사해서 사용
+        """
+        
+        if combo_index > stop_index[0]:
+            return None, None
+        
+        improved_page = self._apply_tools_to_page(page_result, tool_combo, document_path, memo=memo)
+        if not improved_page or combo_index > stop_index[0]:
+            return improved_page, None
+        
+        if memo is None:
+            return improved_page, self._validate_page(improved_page, extraction)
+        
+        verdict, is_owner = memo.claim_verdict(_validation_input_key(improved_page))
+        if is_owner:
+            try:
+                new_validation = self._validate_page(improved_page, extraction)
+            except Exception as e:
+                verdict.set_exception(e)
+                raise
+            verdict.set_result(new_validation)
+            return improved_page, new_validation
+        
+        previous = verdict.result()
+        if previous is None:
+            return improved_page, None
+        
+        new_validation = copy.deepcopy(previous)
+        new_validation.metadata["verdict_reused_from"] = previous.strategy
+        return improved_page, new_validation
+    
     def _validate_page(
         self,
         page_result: PageExtractionResult,
@@ -228,26 +582,16 @@ class ValidationAgent:
         try:
             # 텍스트가 너무 짧으면 즉시 Fail
             if len(page_result.text.strip()) < 20:
-                return PageValidationResult(
-                    page_num=page_result.page_num,
-                    extraction_id=extraction.strategy,
-                    strategy=extraction.strategy,
-                    passed=False,
-                    scores={"llm_confidence": 0.0},
-                    pass_flags={"overall": False},
-                    fallback_path=[],
-                    fallback_attempts=0,
-                    processing_time_ms=(time.time() - start_time) * 1000,
-                    status="fail",
-                    metadata={"fail_reason": "text_too_short"}
-                )
+                return self._short_text_validation(page_result, extraction, start_time)
+            
+            # 사전 검증 (확실하면 LLM 없이 판정)
+            pregate = self._pregate_decisions([page_result])[0]
+            if pregate is not None and pregate["decision"] != "escalate":
+                print(f"      [PREGATE] {pregate['decision'].upper()} ({pregate['reason']})")
+                return self._pregate_validation(page_result, extraction, pregate, start_time)
             
             # Validation 프롬프트 생성
-            has_tables = len(page_result.tables) > 0
-            table_preview = ""
-            if has_tables and page_result.tables:
-                first_table = page_result.tables[0]
-                table_preview = f"행: {first_table.get('rows', 0)}, 열: {first_table.get('cols', 0)}"
+            has_tables, table_preview = self._table_preview(page_result)
             
             prompt = create_validation_prompt(
                 page_text=page_result.text,
@@ -258,54 +602,23 @@ class ValidationAgent:
             )
             
             # Solar LLM 호출
-            print(f"      [LLM] Calling Solar for validation...", end=" ")
             response = self.llm_client.call(prompt)
             
             if not response:
-                print("[ERROR]")
+                print(f"      [LLM] Solar validation... [ERROR]")
                 return None
             
             # 응답 파싱
             result = parse_validation_response(response["content"])
             
-            passed = result['pass']
-            confidence = result['confidence']
-            reason = result['reason']
-            issues = result['issues']
-            suggestions = result['suggestions']
-            
-            print(f"{'[PASS]' if passed else '[FAIL]'} (confidence: {confidence:.2f})")
-            
-            # 점수 형태로 변환 (하위 호환성)
-            scores = {
-                "llm_confidence": confidence,
-                "overall": 1.0 if passed else 0.0
-            }
-            
-            pass_flags = {
-                "overall": passed
-            }
+            print(f"      [LLM] Solar validation... {'[PASS]' if result['pass'] else '[FAIL]'} "
+                  f"(confidence: {result['confidence']:.2f})")
             
             processing_time = (time.time() - start_time) * 1000  # ms
             
-            return PageValidationResult(
-                page_num=page_result.page_num,
-                extraction_id=extraction.strategy,
-                strategy=extraction.strategy,
-                passed=passed,
-                scores=scores,
-                pass_flags=pass_flags,
-                fallback_path=[],
-                fallback_attempts=0,
-                processing_time_ms=processing_time,
-                status="pass" if passed else "fail",
-                metadata={
-                    "llm_reason": reason,
-                    "llm_issues": issues,
-                    "llm_suggestions": suggestions,
-                    "llm_confidence": confidence,
-                    "page_text": page_result.text  # 2단 레이아웃 감지용
-                }
+            return self._build_page_validation(
+                page_result, extraction, result, processing_time,
+                extra_metadata={"pregate": pregate} if pregate else None
             )
             
         except Exception as e:
@@ -314,6 +627,306 @@ class ValidationAgent:
             traceback.print_exc()
             return None
     
+    def _pregate_decisions(self, page_results: List[PageExtractionResult]) -> List[Optional[Dict]]:
+        """
+        휴리스틱 사전 판정 (ValidationMetrics 4개 축을 한 번에 채점)
+        
+        - pass: 모든 축 통과 + 텍스트/bbox 충분 + 다단 아님
+        - fail: config.VALIDATION_PREGATE_FAIL_AXES개 이상 축 실패
+        - escalate: 그 외 (LLM 검증)
+        
+        Returns:
+            페이지별 {'decision', 'scores', 'reason'} (사전 검증 비활성화 시 None)
+        """
+        
+        if not config.VALIDATION_PREGATE_ENABLED or not page_results:
+            return [None] * len(page_results)
+        
+        pages = [
+            {
+                "text": page_result.text,
+                "bbox": page_result.bbox,
+                "tables": page_result.tables,
+                "width": page_result.metadata.get("width", 0)
+            }
+            for page_result in page_results
+        ]
+        
+        decisions = []
+        for page, scores in zip(pages, self.metrics.evaluate_pages(pages)):
+            failed_axes = [
+                axis for axis, score in scores.items()
+                if score < config.VALIDATION_THRESHOLDS.get(axis, 0.5)
+            ]
+            
+            if len(failed_axes) >= config.VALIDATION_PREGATE_FAIL_AXES:
+                # 예: 문장 단절 + 노이즈 + 표 구조 깨짐
+                decision, reason = "fail", f"failed axes: {', '.join(failed_axes)}"
+            elif failed_axes:
+                decision, reason = "escalate", f"failed axes: {', '.join(failed_axes)}"
+            elif len(page["text"].strip()) < config.VALIDATION_PREGATE_MIN_CHARS:
+                decision, reason = "escalate", "text too short to judge locally"
+            elif len(page["bbox"]) < config.VALIDATION_PREGATE_MIN_BOXES:
+                decision, reason = "escalate", "not enough bboxes for reading order"
+            elif self.metrics.has_column_gutter(page):
+                decision, reason = "escalate", "multi-column layout"
+            else:
+                decision, reason = "pass", "all heuristic axes passed"
+            
+            decisions.append({
+                "decision": decision,
+                "scores": scores,
+                "failed_axes": failed_axes,
+                "reason": reason
+            })
+        
+        return decisions
+    
+    def _pregate_pages(
+        self,
+        items: List[Tuple[ExtractionResult, PageExtractionResult]]
+    ) -> Tuple[
+        Dict[Tuple[str, int], PageValidationResult],
+        List[Tuple[ExtractionResult, PageExtractionResult]],
+        Dict[Tuple[str, int], Dict]
+    ]:
+        """
+        초기 검증 대상 페이지 사전 판정
+        
+        Returns:
+            ({(전략, 페이지 번호): 로컬 판정 결과},
+             LLM 검증이 필요한 (추출 결과, 페이지 결과) 리스트,
+             {(전략, 페이지 번호): 사전 판정 정보})
+        """
+        
+        start_time = time.time()
+        
+        # 텍스트가 너무 짧은 페이지는 기존대로 처리 (_validate_pages_batched에서 즉시 Fail)
+        candidates = [item for item in items if len(item[1].text.strip()) >= 20]
+        decisions = self._pregate_decisions([page_result for _, page_result in candidates])
+        
+        local: Dict[Tuple[str, int], PageValidationResult] = {}
+        escalated = [item for item in items if len(item[1].text.strip()) < 20]
+        pregates: Dict[Tuple[str, int], Dict] = {}
+        
+        for (extraction, page_result), pregate in zip(candidates, decisions):
+            if pregate is not None:
+                pregates[(extraction.strategy, page_result.page_num)] = pregate
+            
+            if pregate is None or pregate["decision"] == "escalate":
+                escalated.append((extraction, page_result))
+            else:
+                local[(extraction.strategy, page_result.page_num)] = self._pregate_validation(
+                    page_result, extraction, pregate, start_time
+                )
+        
+        if decisions and decisions[0] is not None:
+            print(f"[PREGATE] {len(local)}/{len(candidates)} pages decided locally "
+                  f"({len(candidates) - len(local)} escalated to LLM)")
+        
+        return local, escalated, pregates
+    
+    def _pregate_validation(
+        self,
+        page_result: PageExtractionResult,
+        extraction: ExtractionResult,
+        pregate: Dict,
+        start_time: float
+    ) -> PageValidationResult:
+        """사전 판정 결과를 PageValidationResult로 변환 (LLM 판정과 같은 형식)"""
+        
+        passed = pregate["decision"] == "pass"
+        result = {
+            'pass': passed,
+            'confidence': config.VALIDATION_PREGATE_PASS_CONFIDENCE if passed else 0.0,
+            'reason': f"[pregate] {pregate['reason']}",
+            'issues': pregate["failed_axes"],
+            'suggestions': []
+        }
+        
+        return self._build_page_validation(
+            page_result, extraction, result, (time.time() - start_time) * 1000,
+            extra_metadata={"pregate": pregate}
+        )
+    
+    def _validate_pages_batched(
+        self,
+        items: List[Tuple[ExtractionResult, PageExtractionResult]],
+        pregates: Optional[Dict[Tuple[str, int], Dict]] = None
+    ) -> Dict[Tuple[str, int], PageValidationResult]:
+        """
+        여러 페이지 초기 검증 (config.VALIDATION_BATCH_SIZE개씩 하나의 프롬프트로 묶어 LLM 호출)
+        
+        - 텍스트가 너무 짧은 페이지는 LLM 없이 즉시 Fail
+        - 응답에서 누락된 항목은 결과에 넣지 않음 (호출 측에서 개별 검증)
+        
+        Args:
+            items: (추출 결과, 페이지 결과) 리스트
+            pregates: 사전 판정 정보 (있으면 결과 metadata["pregate"]에 기록)
+            
+        Returns:
+            {(전략, 페이지 번호): 검증 결과}
+        """
+        
+        validations: Dict[Tuple[str, int], PageValidationResult] = {}
+        batch_size = config.VALIDATION_BATCH_SIZE
+        
+        if batch_size <= 1:
+            return validations
+        
+        pending = []
+        for extraction, page_result in items:
+            if len(page_result.text.strip()) < 20:
+                validations[(extraction.strategy, page_result.page_num)] = self._short_text_validation(
+                    page_result, extraction, time.time()
+                )
+            else:
+                pending.append((extraction, page_result))
+        
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        if batches:
+            print(f"[BATCH] Validating {len(pending)} pages in {len(batches)} LLM calls")
+        
+        def validate_batch(batch_idx: int, batch: List[Tuple[ExtractionResult, PageExtractionResult]]):
+            start_time = time.time()
+            batch_validations: Dict[Tuple[str, int], PageValidationResult] = {}
+            
+            pages_data = []
+            for item_idx, (extraction, page_result) in enumerate(batch, 1):
+                has_tables, table_preview = self._table_preview(page_result)
+                pages_data.append({
+                    "id": f"p{item_idx}",
+                    "page_num": page_result.page_num,
+                    "strategy": extraction.strategy,
+                    "page_text": page_result.text,
+                    "has_tables": has_tables,
+                    "table_preview": table_preview
+                })
+            
+            batch_ids = [item["id"] for item in pages_data]
+            
+            try:
+                response = self.llm_client.call(create_multi_page_validation_prompt(pages_data))
+            except Exception as e:
+                print(f"[ERROR] Batch validation error: {str(e)}")
+                response = None
+            
+            if not response:
+                print(f"[WARN] Batch validation failed, falling back to per-page calls ({len(batch)} pages)")
+                return batch_validations
+            
+            verdicts = parse_validation_response(response["content"], batch_ids=batch_ids)
+            processing_time = (time.time() - start_time) * 1000 / len(batch)
+            
+            for batch_id, (extraction, page_result) in zip(batch_ids, batch):
+                result = verdicts.get(batch_id)
+                if result is None:
+                    continue
+                
+                key = (extraction.strategy, page_result.page_num)
+                extra_metadata = {"validation_batch_size": len(batch)}
+                if pregates and key in pregates:
+                    extra_metadata["pregate"] = pregates[key]
+                
+                batch_validations[key] = self._build_page_validation(
+                    page_result, extraction, result, processing_time,
+                    extra_metadata=extra_metadata
+                )
+            
+            missing = sum(1 for batch_id in batch_ids if verdicts.get(batch_id) is None)
+            if missing:
+                print(f"[WARN] {missing}/{len(batch)} verdicts missing from batch response, will validate individually")
+            
+            return batch_validations
+        
+        # 묶음 호출끼리는 독립적이므로 병렬 실행
+        for batch_validations in run_batch(
+            batches,
+            validate_batch,
+            max_workers=config.VALIDATION_MAX_CONCURRENCY,
+            max_in_flight=config.VALIDATION_MAX_CONCURRENCY
+        ):
+            validations.update(batch_validations or {})
+        
+        return validations
+    
+    def _table_preview(self, page_result: PageExtractionResult) -> Tuple[bool, str]:
+        """프롬프트용 표 포함 여부 / 미리보기"""
+        has_tables = len(page_result.tables) > 0
+        table_preview = ""
+        if has_tables and page_result.tables:
+            first_table = page_result.tables[0]
+            table_preview = f"행: {first_table.get('rows', 0)}, 열: {first_table.get('cols', 0)}"
+        return has_tables, table_preview
+    
+    def _short_text_validation(
+        self,
+        page_result: PageExtractionResult,
+        extraction: ExtractionResult,
+        start_time: float
+    ) -> PageValidationResult:
+        """텍스트가 너무 짧은 페이지 (LLM 호출 없이 Fail)"""
+        return PageValidationResult(
+            page_num=page_result.page_num,
+            extraction_id=extraction.strategy,
+            strategy=extraction.strategy,
+            passed=False,
+            scores={"llm_confidence": 0.0},
+            pass_flags={"overall": False},
+            fallback_path=[],
+            fallback_attempts=0,
+            processing_time_ms=(time.time() - start_time) * 1000,
+            status="fail",
+            metadata={"fail_reason": "text_too_short"}
+        )
+    
+    def _build_page_validation(
+        self,
+        page_result: PageExtractionResult,
+        extraction: ExtractionResult,
+        result: Dict,
+        processing_time: float,
+        extra_metadata: Optional[Dict] = None
+    ) -> PageValidationResult:
+        """LLM 판정(parse_validation_response 결과)을 PageValidationResult로 변환"""
+        
+        passed = result['pass']
+        confidence = result['confidence']
+        
+        # 점수 형태로 변환 (하위 호환성)
+        scores = {
+            "llm_confidence": confidence,
+            "overall": 1.0 if passed else 0.0
+        }
+        
+        pass_flags = {
+            "overall": passed
+        }
+        
+        metadata = {
+            "llm_reason": result['reason'],
+            "llm_issues": result['issues'],
+            "llm_suggestions": result['suggestions'],
+            "llm_confidence": confidence,
+            "page_text": page_result.text  # 2단 레이아웃 감지용
+        }
+        if extra_metadata:
+            metadata.update(extra_metadata)
+        
+        return PageValidationResult(
+            page_num=page_result.page_num,
+            extraction_id=extraction.strategy,
+            strategy=extraction.strategy,
+            passed=passed,
+            scores=scores,
+            pass_flags=pass_flags,
+            fallback_path=[],
+            fallback_attempts=0,
+            processing_time_ms=processing_time,
+            status="pass" if passed else "fail",
+            metadata=metadata
+        )
+    
     def _apply_custom_split_and_reextract(
         self,
         page_result: PageExtractionResult,
@@ -334,22 +947,15 @@ class ValidationAgent:
             
             print(f"      [CUSTOM_SPLIT] Preprocessing PDF...")
             
-            # PDF 전처리
-            pdf_path = Path(document_path)
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
-            
-            # Custom Split 적용
+            # Custom Split 적용 (실패한 페이지만 렌더링/분할, 다른 전략의 같은 페이지는 재사용)
             custom_split_tool = self.tools["custom_split"]
-            split_pdf_bytes = custom_split_tool._process_pdf_bytes(pdf_bytes)
-            
-            # 임시 파일로 저장
-            temp_dir = config.EXTRACTED_DIR / "temp"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            temp_pdf_path = temp_dir / f"{pdf_path.stem}_split_{page_result.page_num}.pdf"
+            split_record = custom_split_tool.split_document(Path(document_path), pages=[page_result.page_num])
+            temp_pdf_path = split_record["split_pdf_path"]
+            split_pages = split_record["page_map"].get(page_result.page_num, [])
             
-            with open(temp_pdf_path, 'wb') as f:
-                f.write(split_pdf_bytes)
+            if not split_pages:
+                print(f"      [ERROR] Page {page_result.page_num} not found in document")
+                return None
             
             print(f"      [CUSTOM_SPLIT] PDF preprocessed, re-extracting with {page_result.strategy}...")
             
@@ -367,24 +973,19 @@ class ValidationAgent:
                 print(f"      [ERROR] Unknown extraction strategy: {page_result.strategy}")
                 return None
             
-            # 재추출
-            result = extraction_tool.extract(temp_pdf_path)
-            
-            # 해당 페이지 찾기 (페이지 번호가 변경되었을 수 있음)
-            # 원본 페이지 번호에 해당하는 페이지를 찾거나, 첫 번째 페이지 사용
-            target_page = None
-            if result["pages"]:
-                # 페이지 수가 증가했을 수 있으므로, 원본 페이지 번호의 2배 근처를 찾음
-                for page_data in result["pages"]:
-                    if page_data["page"] == page_result.page_num:
-                        target_page = page_data
-                        break
-                
-                # 못 찾으면 첫 번째 페이지 사용
-                if not target_page:
-                    target_page = result["pages"][0]
+            # 재추출 (분할 PDF 해시 기준 캐시 확인)
+            result = self._extract_with_cache(
+                page_result.strategy,
+                extraction_tool,
+                temp_pdf_path,
+                pdf_hash=split_record["split_pdf_sha256"]
+            )
+            
+            # 원본 페이지에 해당하는 분할 페이지 (좌 → 우 순서로 이어 붙임)
+            pages_by_num = {page_data["page"]: page_data for page_data in result["pages"]}
+            segments = [pages_by_num[p] for p in split_pages if p in pages_by_num]
             
-            if not target_page:
+            if not segments:
                 print(f"      [ERROR] No pages found after re-extraction")
                 return None
             
@@ -392,14 +993,16 @@ class ValidationAgent:
             improved_page = PageExtractionResult(
                 page_num=page_result.page_num,
                 strategy=page_result.strategy + "+custom_split",
-                text=target_page["text"],
-                bbox=target_page.get("bbox", []),
-                tables=target_page.get("tables", []),
+                text="\n\n".join(segment["text"] for segment in segments if segment["text"]),
+                bbox=BBoxTable.concat(segment.get("bbox", []) for segment in segments),
+                tables=[table for segment in segments for table in segment.get("tables", [])],
                 processing_time_ms=0.0,
                 status="success",
                 metadata={
                     "preprocessed_with": "custom_split",
-                    "original_strategy": page_result.strategy
+                    "original_strategy": page_result.strategy,
+                    "split_pages": split_pages,
+                    "was_split": len(split_pages) > 1
                 }
             )
             
@@ -411,6 +1014,40 @@ class ValidationAgent:
             traceback.print_exc()
             return None
     
+    def _extract_with_cache(self, tool_name: str, tool, pdf_path, pdf_hash: Optional[str] = None) -> Dict:
+        """
+        PDF 전체 추출 (추출 캐시에 있는 페이지는 재파싱하지 않음)
+        
+        Args:
+            tool_name: 도구 이름
+            tool: 1단계 추출 도구
+            pdf_path: PDF 경로
+            pdf_hash: PDF 내용 해시 (이미 알고 있으면 재계산 생략)
+            
+        Returns:
+            도구 extract()와 동일한 형식의 결과
+        """
+        cache = get_extraction_cache()
+        if cache is None:
+            return tool.extract(pdf_path)
+        
+        pdf_hash = pdf_hash or file_sha256(pdf_path)
+        all_pages = list(range(1, tool.get_page_count(pdf_path) + 1))
+        cached_pages, _, missing_pages = cache.get_pages(pdf_hash, tool_name, tool, all_pages)
+        
+        if not missing_pages:
+            print(f"      [CACHE] {tool_name}: re-extraction served from cache")
+            return {"pages": cached_pages, "settings": tool.settings}
+        
+        start_time = time.time()
+        result = tool.extract(pdf_path, pages=missing_pages)
+        processing_time = (time.time() - start_time) * 1000
+        
+        cache.put_pages(pdf_hash, tool_name, tool, result["pages"], processing_time / len(missing_pages))
+        
+        result["pages"] = sorted(cached_pages + result["pages"], key=lambda p: p["page"])
+        return result
+    
     def _generate_tool_combinations(
         self,
         page_validation: PageValidationResult
@@ -480,7 +1117,8 @@ class ValidationAgent:
         self,
         page_result: PageExtractionResult,
         tool_names: List[str],
-        document_path: str
+        document_path: str,
+        memo: Optional[_FallbackMemo] = None
     ) -> Optional[PageExtractionResult]:
         """
         페이지에 도구 조합 적용
@@ -489,6 +1127,7 @@ class ValidationAgent:
             page_result: 원본 페이지 결과
             tool_names: 적용할 도구 이름 리스트
             document_path: 문서 경로
+            memo: 접두 조합 결과 메모 (있으면 같은 접두는 한 번만 실행)
             
         Returns:
             개선된 페이지 결과 또는 None
@@ -513,23 +1152,26 @@ class ValidationAgent:
             improved_pages = [page_data]
             
             # 도구 순차 적용
-            for tool_name in tool_names:
+            for tool_idx, tool_name in enumerate(tool_names):
                 if tool_name not in self.tools:
                     print(f"[WARNING] Tool {tool_name} not available")
                     continue
                 
                 tool = self.tools[tool_name]
                 
-                try:
-                    # 도구 적용
-                    improved_pages = tool.process(improved_pages, document_path)
-                    
-                    if not improved_pages:
-                        print(f"[WARNING] Tool {tool_name} returned empty result")
-                        return None
-                    
-                except Exception as e:
-                    print(f"[ERROR] Tool {tool_name} failed: {e}")
+                if memo is None:
+                    improved_pages = self._run_fallback_tool(tool_name, tool, improved_pages, document_path)
+                else:
+                    # 같은 접두 조합 결과 재사용 (도구는 입력 페이지를 수정하지 않음)
+                    prefix_key = (memo.page_hash, tuple(tool_names[:tool_idx + 1]))
+                    with memo.prefix_lock(prefix_key):
+                        if prefix_key not in memo.prefix_pages:
+                            memo.prefix_pages[prefix_key] = self._run_fallback_tool(
+                                tool_name, tool, improved_pages, document_path
+                            )
+                        improved_pages = memo.prefix_pages[prefix_key]
+                
+                if not improved_pages:
                     return None
             
             # 첫 번째 페이지를 PageExtractionResult로 변환
@@ -552,24 +1194,32 @@ class ValidationAgent:
             print(f"[ERROR] Failed to apply tools: {e}")
             return None
     
-    def _revalidate_page(
+    def _run_fallback_tool(self, tool_name: str, tool, pages: List[Dict], document_path: str) -> Optional[List[Dict]]:
+        """폴백 도구 1개 적용 (실패/빈 결과면 None)"""
+        try:
+            improved_pages = tool.process(pages, document_path)
+            
+            if not improved_pages:
+                print(f"[WARNING] Tool {tool_name} returned empty result")
+                return None
+            
+            return improved_pages
+            
+        except Exception as e:
+            print(f"[ERROR] Tool {tool_name} failed: {e}")
+            return None
+    
+    def _record_fallback(
         self,
+        new_validation: PageValidationResult,
         improved_page: PageExtractionResult,
-        extraction: ExtractionResult,
         previous_validation: PageValidationResult,
         fallback_tools: List[str]
-    ) -> Optional[PageValidationResult]:
-        """도구 적용 후 재검증"""
-        
-        new_validation = self._validate_page(improved_page, extraction)
-        
-        if new_validation:
-            # 폴백 정보 업데이트
-            new_validation.fallback_path = previous_validation.fallback_path + fallback_tools
-            new_validation.fallback_attempts = previous_validation.fallback_attempts + 1
-            new_validation.strategy = improved_page.strategy
-        
-        return new_validation
+    ):
+        """폴백 정보 업데이트 (이전 최선 결과 기준 경로 + 시도 횟수)"""
+        new_validation.fallback_path = previous_validation.fallback_path + fallback_tools
+        new_validation.fallback_attempts = previous_validation.fallback_attempts + 1
+        new_validation.strategy = improved_page.strategy
     
     def _aggregate_page_validations(
         self,
@@ -599,6 +1249,12 @@ class ValidationAgent:
         # 가장 많이 사용된 도구들을 fallback_path로
         unique_tools = list(set(all_fallback_paths))
         
+        # 사전 검증 집계 (최종 판정 기준: 로컬 판정 / LLM 에스컬레이션)
+        pregate_decisions = [
+            pv.metadata["pregate"]["decision"] for pv in page_validations if pv.metadata.get("pregate")
+        ]
+        pregate_escalated = sum(1 for decision in pregate_decisions if decision == "escalate")
+        
         return ValidationResult(
             extraction_id=extraction.strategy,
             strategy=extraction.strategy,
@@ -621,7 +1277,10 @@ class ValidationAgent:
                 "page_count": len(page_validations),
                 "total_page_count": extraction.total_page_count,
                 "pages_with_fallback": sum(1 for pv in page_validations if pv.fallback_path),
-                "avg_llm_confidence": avg_confidence
+                "avg_llm_confidence": avg_confidence,
+                "pregate_local_pages": len(pregate_decisions) - pregate_escalated,
+                "pregate_escalated_pages": pregate_escalated,
+                "pregate_escalation_rate": pregate_escalated / len(pregate_decisions) if pregate_decisions else None
             }
         )
 
@@ -26,6 +26,9 @@ EXTRACTED_DIR = TEMP_DIR / "extracted"
 VALIDATED_DIR = TEMP_DIR / "validated"
 JUDGED_DIR = TEMP_DIR / "judged"
 
+# 페이지별 bbox 저장 파일 (pages_text_sampled.jsonl 옆에 npz로 저장)
+BBOX_FILENAME = "bboxes.npz"
+
 # LLM API 설정 - Upstage Solar pro2
 SOLAR_API_KEY = os.getenv("SOLAR_API_KEY")
 if not SOLAR_API_KEY:
@@ -36,6 +39,27 @@ SOLAR_MODEL = "solar-pro2"
 SOLAR_MAX_TOKENS = 4096
 SOLAR_TEMPERATURE = 0.3
 
+# Solar API 연결/호출 제한 (프로세스 내 모든 SolarClient가 공유)
+SOLAR_MAX_CONCURRENCY = 8        # 동시 호출 최대 수 (연결 풀 크기)
+SOLAR_RATE_LIMIT_RPS = 5.0       # 초당 요청 수 (None 또는 0이면 제한 없음)
+SOLAR_RATE_LIMIT_BURST = 10      # 순간 허용 요청 수
+SOLAR_MAX_RETRIES = 3            # 429/5xx 재시도 횟수
+SOLAR_RETRY_BACKOFF_BASE = 1.0   # 재시도 기본 대기 (초, 지수 증가 + 지터)
+SOLAR_RETRY_BACKOFF_MAX = 20.0   # 재시도 최대 대기 (초)
+
+# LLM 응답 캐시 (동일 프롬프트 재호출 생략)
+CACHE_DIR = TEMP_DIR / "cache"
+LLM_CACHE_ENABLED = True
+LLM_CACHE_PATH = CACHE_DIR / "llm_cache.sqlite"
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 3600  # 30일
+LLM_CACHE_MAX_MB = 512
+
+# 추출 결과 캐시 (같은 PDF/도구/버전/설정이면 재파싱 생략)
+EXTRACTION_CACHE_ENABLED = True
+EXTRACTION_CACHE_PATH = CACHE_DIR / "extraction_cache.sqlite"
+EXTRACTION_CACHE_TTL_SECONDS = None  # 내용 해시 기반이므로 만료 없음
+EXTRACTION_CACHE_MAX_MB = 2048
+
 # Upstage API 비용 (per page)
 UPSTAGE_API_PRICING = {
     "upstage_ocr": 0.0015,           # $0.0015 per page
@@ -45,6 +69,13 @@ UPSTAGE_API_PRICING = {
     "pypdfium2": 0.0                 # 오픈소스 (무료)
 }
 
+# 페이지 샘플링
+MAX_PAGES_SAMPLE = 5  # 최대 샘플링 페이지 수
+
+# 전체 문서 추출 (Judge가 선택한 전략으로 샘플이 아닌 모든 페이지 추출, --full-extraction)
+FULL_EXTRACTION_ENABLED = False
+FULL_EXTRACTION_API_CHUNK_PAGES = 32  # API 도구는 이 페이지 수씩 나눠 업로드
+
 # OCR/파싱 도구 설정
 # pdfplumber
 PDF_PLUMBER_LAYOUT_WIDTH_TOLERANCE = 3
@@ -56,6 +87,13 @@ CUSTOM_SPLIT_OVERLAP_PX = 10
 CUSTOM_SPLIT_MARGIN_LEFT = 50
 CUSTOM_SPLIT_MARGIN_RIGHT = 50
 CUSTOM_SPLIT_DPI = 300
+CUSTOM_SPLIT_MODE = "vector"  # vector: 원본 페이지 절반 크롭 (텍스트 유지) / raster: 이미지 렌더링 후 절단
+CUSTOM_SPLIT_SPILL_TO_DISK = True  # 분할 PDF를 메모리 대신 파일로 바로 기록
+CUSTOM_SPLIT_CACHE_TTL_SECONDS = None  # 분할 결과 디스크 캐시 유효 기간 (내용 해시 기반이므로 기본은 만료 없음)
+CUSTOM_SPLIT_CACHE_MAX_MB = 2048  # 분할 결과 디스크 캐시 최대 용량 (초과 시 오래 사용하지 않은 항목부터 삭제)
+CUSTOM_SPLIT_WORKERS = 4  # 페이지 범위 병렬 분할 워커 수 (1이면 순차, CPU 코어 수로 제한)
+CUSTOM_SPLIT_PARALLEL_MIN_PAGES = 8  # 이 페이지 수 이상일 때만 병렬 분할
+CUSTOM_SPLIT_DETECT_DPI = 72  # 이중 페이지 판정용 썸네일 DPI (벡터 메트릭으로 판단 불가할 때만)
 CUSTOM_SPLIT_MIDLINE_DETECTION = "auto"  # auto or fixed
 
 # 유효성 검증 임계치 (1.0=Pass, 0.0=Fail 방식)
@@ -66,6 +104,18 @@ VALIDATION_THRESHOLDS = {
     "table": 0.5   # 표 파싱 (Pass/Fail)
 }
 
+# 검증 LLM 호출 묶음 크기 (초기 검증 시 N페이지를 1회 호출로 판정, 1이면 페이지별 호출)
+VALIDATION_BATCH_SIZE = 5
+VALIDATION_MAX_CONCURRENCY = 4  # 동시에 검증하는 (전략, 페이지) 작업 수 (1이면 순차)
+VALIDATION_PIPELINED = True  # 1단계 추출 중 기록된 페이지부터 초기 검증 시작 (추출과 LLM 검증 병행)
+
+# 휴리스틱 사전 검증 (ValidationMetrics로 확실한 페이지는 LLM 없이 판정, 애매한 페이지만 LLM)
+VALIDATION_PREGATE_ENABLED = True
+VALIDATION_PREGATE_MIN_CHARS = 200  # 로컬 Pass 최소 텍스트 길이
+VALIDATION_PREGATE_MIN_BOXES = 5  # 로컬 Pass 최소 bbox 수 (읽기 순서 근거가 부족하면 LLM, pdfminer는 블록 단위)
+VALIDATION_PREGATE_FAIL_AXES = 3  # 이 개수 이상의 축이 Fail이면 로컬 Fail
+VALIDATION_PREGATE_PASS_CONFIDENCE = 0.8  # 로컬 Pass 판정의 confidence
+
 # 폴백 설정
 MAX_FALLBACK_ATTEMPTS = 2  # 각 축별 최대 재시도 횟수
 MIN_IMPROVEMENT_DELTA = 0.1  # 최소 개선폭 (Pass/Fail 방식: 0.1 이상)
@@ -74,6 +124,8 @@ FALLBACK_PRIORITY = [
     "layout_reorder",    # 2. 레이아웃 재정렬
     "table_enhancement"  # 3. 표 강화
 ]
+FALLBACK_SPECULATIVE_WIDTH = 3  # 페이지당 동시에 시도할 도구 조합 수 (1이면 순차)
+FALLBACK_PAGE_TIMEOUT = 180  # 페이지당 폴백 시간 한도 (초, None이면 무제한)
 
 # LLM Judge 평가 가중치 (각 점수 0-100)
 JUDGE_WEIGHTS = {
@@ -84,6 +136,9 @@ JUDGE_WEIGHTS = {
     "S_fig": 0.10        # 10% - 그림/도표
 }
 
+JUDGE_MAX_CONCURRENCY = 8  # 동시에 평가하는 (전략, 페이지) 작업 수 (1이면 순차)
+JUDGE_CALL_TIMEOUT = 150  # 페이지당 Judge LLM 호출 시간 한도 (초, 슬롯 대기/재시도/백오프 포함, 넘으면 요청 중단, None이면 무제한)
+
 # 점수 기준 (0-100 범위)
 SCORE_THRESHOLDS = {
     "pass": 85,          # 85점 이상: 우수
@@ -105,6 +160,12 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # 멀티프로세싱 설정
 MAX_WORKERS = 4  # 병렬 처리 워커 수
 BATCH_SIZE = 10  # 배치 처리 크기
+PARALLEL_EXTRACTION = True  # 1단계 도구 동시 실행 (로컬: 프로세스 풀, API: 스레드)
+PROCESS_POOL_START_METHOD = "forkserver"  # 프로세스 풀 시작 방식 (스레드가 도는 프로세스에서 fork하면 락 교착 위험, 미지원 OS는 spawn)
+PROCESS_POOL_WORKERS = None  # 공유 프로세스 풀 워커 수 (None이면 CPU 코어 수, 문서/단계와 무관하게 재사용)
+EXTRACTION_SHARD_WORKERS = 4  # 로컬 파서 페이지 범위 샤드 병렬 워커 수 (1이면 샤딩 안 함)
+EXTRACTION_SHARD_MIN_PAGES = 16  # 추출 페이지가 이 수 이상일 때만 샤딩 (전체 문서 추출 등, 기본 샘플 5페이지는 샤딩 안 함)
+EXTRACTION_SHARD_MAX_PAGES = 32  # 샤드 1개의 최대 페이지 수 (전체 문서 추출 시 메모리에 남는 페이지 수 상한)
 
 # 타임아웃 설정 (초)
 OCR_TIMEOUT = 300         # OCR 처리 타임아웃
@@ -136,7 +197,8 @@ def create_directories():
         TABLES_DIR,
         EXTRACTED_DIR,
         VALIDATED_DIR,
-        JUDGED_DIR
+        JUDGED_DIR,
+        CACHE_DIR
     ]
     
     for directory in directories:
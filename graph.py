@@ -24,6 +24,7 @@ class DocumentProcessingGraph:
         self.graph.add_node("validation", self.validation_node)
         self.graph.add_node("fallback_handler", self.fallback_handler_node)
         self.graph.add_node("judge", self.judge_node)
+        self.graph.add_node("full_extraction", self.full_extraction_node)
         self.graph.add_node("report_generation", self.report_generation_node)
         self.graph.add_node("error_handler", self.error_handler_node)
         
@@ -60,7 +61,16 @@ class DocumentProcessingGraph:
             }
         )
         
-        self.graph.add_edge("judge", "report_generation")
+        self.graph.add_conditional_edges(
+            "judge",
+            self.route_after_judge,
+            {
+                "full_extraction": "full_extraction",
+                "report": "report_generation"
+            }
+        )
+        
+        self.graph.add_edge("full_extraction", "report_generation")
         self.graph.add_edge("report_generation", END)
         self.graph.add_edge("error_handler", END)
     
@@ -72,9 +82,21 @@ class DocumentProcessingGraph:
         
         print(f"[1단계] 기본 추출 시작: {state['document_name']}")
         
+        # 추출과 동시에 초기 검증 (페이지가 기록되는 대로 사전 검증/LLM 묶음 검증 시작)
+        validation_stream = None
+        
         try:
+            if config.VALIDATION_PIPELINED:
+                from agents.validation_agent import ValidationAgent
+                validation_stream = ValidationAgent().start_initial_validation()
+            
             agent = BasicExtractionAgent()
-            state = agent.run(state)
+            state = agent.run(state, on_page=validation_stream.add_page if validation_stream else None)
+            
+            if validation_stream is not None:
+                state["metadata"]["initial_validations"] = validation_stream.finish()
+                validation_stream = None
+            
             state = update_stage(state, "validation")
             print(f"[OK] 기본 추출 완료: {len(state['extraction_results'])}개 결과")
             
@@ -87,6 +109,9 @@ class DocumentProcessingGraph:
                 "error_type": type(e).__name__
             })
             state = update_stage(state, "failed")
+        finally:
+            if validation_stream is not None:
+                validation_stream.close()
         
         return state
     
@@ -158,6 +183,27 @@ class DocumentProcessingGraph:
         
         return state
     
+    def full_extraction_node(self, state: DocumentState) -> DocumentState:
+        """전체 문서 추출 노드 (선택 단계, 실패해도 리포트는 생성)"""
+        from agents.full_extraction_agent import FullExtractionAgent
+        
+        print(f"[전체 추출] 최종 선택 전략으로 문서 전체 추출")
+        
+        try:
+            agent = FullExtractionAgent()
+            state = agent.run(state)
+            
+        except Exception as e:
+            print(f"[ERROR] 전체 추출 실패: {str(e)}")
+            from state import add_error
+            state = add_error(state, {
+                "stage": "full_extraction",
+                "error": str(e),
+                "error_type": type(e).__name__
+            })
+        
+        return state
+    
     def report_generation_node(self, state: DocumentState) -> DocumentState:
         """리포트 생성 노드"""
         from agents.report_generator import ReportGenerator
@@ -228,6 +274,14 @@ class DocumentProcessingGraph:
         # (통과/실패 여부와 무관하게 Judge가 최종 평가)
         return "judge"
     
+    def route_after_judge(self, state: DocumentState) -> str:
+        """평가 후 라우팅 (전체 문서 추출은 설정 시에만, 최종 선택이 있어야 함)"""
+        
+        if config.FULL_EXTRACTION_ENABLED and state["current_stage"] != "failed" and state["final_selection"]:
+            return "full_extraction"
+        
+        return "report"
+    
     def route_after_fallback(self, state: DocumentState) -> str:
         """폴백 후 라우팅"""
         
@@ -272,6 +326,8 @@ if __name__ == "__main__":
       ↓               │
     No → [Fallback]───┘
       ↓
+    [Full Extraction] (선택, --full-extraction)
+      ↓
     [Report Generation]
       ↓
     END
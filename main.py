@@ -5,6 +5,7 @@ LangGraph 기반 문서 파싱 시스템
 
 import argparse
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
@@ -17,6 +18,9 @@ from state import create_initial_document_state, create_initial_refine_state
 from graph import create_processing_graph
 from refine_graph import create_refine_graph
 from utils.file_utils import ensure_directories, get_input_files
+from utils.batch_runner import run_batch
+from utils.log_buffer import capture_task_output, task_output
+from utils.llm_client import get_llm_cache
 
 
 def run_strategy_mode(input_files: List[Path], args) -> List[Dict]:
@@ -29,61 +33,85 @@ def run_strategy_mode(input_files: List[Path], args) -> List[Dict]:
     # LangGraph 그래프 생성
     graph = create_processing_graph()
     
-    results = []
+    workers = _resolve_workers(args, len(input_files))
+    if workers > 1:
+        print(f"[INFO] Batch mode: {workers} workers, up to {config.BATCH_SIZE} documents in flight\n")
+    
+    def _fatal_result(idx: int, file_path: Path, error: Exception) -> Dict:
+        return {
+            "mode": "strategy",
+            "file": file_path.name,
+            "status": "fatal_error",
+            "final_selection": None,
+            "error_count": 1
+        }
+    
+    def _run_document(idx: int, file_path: Path) -> Dict:
+        with _document_output(workers, idx, len(input_files), file_path):
+            return _run_strategy_document(graph, file_path, idx, len(input_files))
+    
+    with capture_task_output():
+        return run_batch(
+            input_files,
+            _run_document,
+            max_workers=workers,
+            max_in_flight=config.BATCH_SIZE,
+            on_error=_fatal_result
+        )
+
+
+def _run_strategy_document(graph, file_path: Path, idx: int, total: int) -> Dict:
+    """파싱 전략 선택 - 문서 1개 처리 (다른 문서와 독립적으로 실패 처리)"""
+    
+    print(f"\n{'#'*80}")
+    print(f"[{idx}/{total}] {file_path.name}")
+    print(f"{'#'*80}\n")
     
-    for idx, file_path in enumerate(input_files, 1):
-        print(f"\n{'#'*80}")
-        print(f"[{idx}/{len(input_files)}] {file_path.name}")
-        print(f"{'#'*80}\n")
+    # 초기 상태 생성
+    state = create_initial_document_state(str(file_path))
+    
+    try:
+        # 그래프 실행
+        final_state = graph.invoke(state)
+        
+        # 결과 출력
+        print(f"\n{'='*80}")
+        if final_state["current_stage"] == "completed":
+            print(f"[OK] Processing completed: {file_path.name}")
+            if final_state.get("final_selection"):
+                selection = final_state["final_selection"]
+                print(f"   Final strategy: {selection.selected_strategy}")
+                print(f"   Score: {selection.S_total:.3f}")
+        else:
+            print(f"[FAIL] Processing failed: {file_path.name}")
+            print(f"   Status: {final_state['current_stage']}")
+            print(f"   Errors: {len(final_state.get('error_log', []))}")
+        print(f"{'='*80}\n")
+        
+        return {
+            "mode": "strategy",
+            "file": file_path.name,
+            "status": final_state["current_stage"],
+            "final_selection": final_state.get("final_selection"),
+            "error_count": len(final_state.get("error_log", []))
+        }
         
-        # 초기 상태 생성
-        state = create_initial_document_state(str(file_path))
+    except Exception as e:
+        print(f"\n{'='*80}")
+        print(f"[FATAL ERROR] {file_path.name}")
+        print(f"   {str(e)}")
+        print(f"{'='*80}\n")
+        
+        import traceback
+        traceback.print_exc()
         
-        try:
-            # 그래프 실행
-            final_state = graph.invoke(state)
-            
-            # 결과 저장
-            results.append({
-                "mode": "strategy",
-                "file": file_path.name,
-                "status": final_state["current_stage"],
-                "final_selection": final_state.get("final_selection"),
-                "error_count": len(final_state.get("error_log", []))
-            })
-            
-            # 결과 출력
-            print(f"\n{'='*80}")
-            if final_state["current_stage"] == "completed":
-                print(f"[OK] Processing completed: {file_path.name}")
-                if final_state.get("final_selection"):
-                    selection = final_state["final_selection"]
-                    print(f"   Final strategy: {selection.selected_strategy}")
-                    print(f"   Score: {selection.S_total:.3f}")
-            else:
-                print(f"[FAIL] Processing failed: {file_path.name}")
-                print(f"   Status: {final_state['current_stage']}")
-                print(f"   Errors: {len(final_state.get('error_log', []))}")
-            print(f"{'='*80}\n")
-            
-        except Exception as e:
-            print(f"\n{'='*80}")
-            print(f"[FATAL ERROR] {file_path.name}")
-            print(f"   {str(e)}")
-            print(f"{'='*80}\n")
-            
-            import traceback
-            traceback.print_exc()
-            
-            results.append({
-                "mode": "strategy",
-                "file": file_path.name,
-                "status": "fatal_error",
-                "final_selection": None,
-                "error_count": 1
-            })
-    
-    return results
+        return {
+            "mode": "strategy",
+            "file": file_path.name,
+            "status": "fatal_error",
+            "final_selection": None,
+            "error_count": 1
+        }
 
 
 def run_refine_mode(input_files: List[Path], args) -> List[Dict]:
@@ -96,66 +124,112 @@ def run_refine_mode(input_files: List[Path], args) -> List[Dict]:
     # LangGraph 그래프 생성
     graph = create_refine_graph()
     
-    results = []
+    workers = _resolve_workers(args, len(input_files))
+    if workers > 1:
+        print(f"[INFO] Batch mode: {workers} workers, up to {config.BATCH_SIZE} documents in flight\n")
+    
+    def _fatal_result(idx: int, file_path: Path, error: Exception) -> Dict:
+        return {
+            "mode": "refine",
+            "file": file_path.name,
+            "status": "fatal_error",
+            "pages_refined": 0,
+            "total_pages": 0,
+            "error_count": 1
+        }
+    
+    def _run_document(idx: int, file_path: Path) -> Dict:
+        with _document_output(workers, idx, len(input_files), file_path):
+            return _run_refine_document(graph, file_path, idx, len(input_files))
+    
+    with capture_task_output():
+        return run_batch(
+            input_files,
+            _run_document,
+            max_workers=workers,
+            max_in_flight=config.BATCH_SIZE,
+            on_error=_fatal_result
+        )
+
+
+def _run_refine_document(graph, file_path: Path, idx: int, total: int) -> Dict:
+    """문서 정제 - 문서 1개 처리 (다른 문서와 독립적으로 실패 처리)"""
     
-    for idx, file_path in enumerate(input_files, 1):
-        print(f"\n{'#'*80}")
-        print(f"[{idx}/{len(input_files)}] {file_path.name}")
-        print(f"{'#'*80}\n")
+    print(f"\n{'#'*80}")
+    print(f"[{idx}/{total}] {file_path.name}")
+    print(f"{'#'*80}\n")
+    
+    # 초기 상태 생성
+    state = create_initial_refine_state(str(file_path), file_path.name)
+    
+    try:
+        # 그래프 실행
+        final_state = graph.invoke(state)
+        
+        # 결과 저장
+        refine_report = final_state.get("refine_report")
+        
+        # 결과 출력
+        print(f"\n{'='*80}")
+        if final_state["current_stage"] == "complete":
+            print(f"[OK] Refine completed: {file_path.name}")
+            if refine_report:
+                print(f"   Total pages: {refine_report.total_pages}")
+                print(f"   Pages refined: {refine_report.pages_refined}")
+                print(f"   Pages skipped: {refine_report.pages_skipped}")
+                print(f"   LLM cost: ${refine_report.total_llm_cost_usd:.4f}")
+        else:
+            print(f"[FAIL] Refine failed: {file_path.name}")
+            print(f"   Status: {final_state['current_stage']}")
+            print(f"   Errors: {len(final_state.get('error_log', []))}")
+        print(f"{'='*80}\n")
+        
+        return {
+            "mode": "refine",
+            "file": file_path.name,
+            "status": final_state["current_stage"],
+            "pages_refined": refine_report.pages_refined if refine_report else 0,
+            "total_pages": refine_report.total_pages if refine_report else 0,
+            "error_count": len(final_state.get("error_log", []))
+        }
+        
+    except Exception as e:
+        print(f"\n{'='*80}")
+        print(f"[FATAL ERROR] {file_path.name}")
+        print(f"   {str(e)}")
+        print(f"{'='*80}\n")
         
-        # 초기 상태 생성
-        state = create_initial_refine_state(str(file_path), file_path.name)
+        import traceback
+        traceback.print_exc()
         
-        try:
-            # 그래프 실행
-            final_state = graph.invoke(state)
-            
-            # 결과 저장
-            refine_report = final_state.get("refine_report")
-            
-            results.append({
-                "mode": "refine",
-                "file": file_path.name,
-                "status": final_state["current_stage"],
-                "pages_refined": refine_report.pages_refined if refine_report else 0,
-                "total_pages": refine_report.total_pages if refine_report else 0,
-                "error_count": len(final_state.get("error_log", []))
-            })
-            
-            # 결과 출력
-            print(f"\n{'='*80}")
-            if final_state["current_stage"] == "complete":
-                print(f"[OK] Refine completed: {file_path.name}")
-                if refine_report:
-                    print(f"   Total pages: {refine_report.total_pages}")
-                    print(f"   Pages refined: {refine_report.pages_refined}")
-                    print(f"   Pages skipped: {refine_report.pages_skipped}")
-                    print(f"   LLM cost: ${refine_report.total_llm_cost_usd:.4f}")
-            else:
-                print(f"[FAIL] Refine failed: {file_path.name}")
-                print(f"   Status: {final_state['current_stage']}")
-                print(f"   Errors: {len(final_state.get('error_log', []))}")
-            print(f"{'='*80}\n")
-            
-        except Exception as e:
-            print(f"\n{'='*80}")
-            print(f"[FATAL ERROR] {file_path.name}")
-            print(f"   {str(e)}")
-            print(f"{'='*80}\n")
-            
-            import traceback
-            traceback.print_exc()
-            
-            results.append({
-                "mode": "refine",
-                "file": file_path.name,
-                "status": "fatal_error",
-                "pages_refined": 0,
-                "total_pages": 0,
-                "error_count": 1
-            })
-    
-    return results
+        return {
+            "mode": "refine",
+            "file": file_path.name,
+            "status": "fatal_error",
+            "pages_refined": 0,
+            "total_pages": 0,
+            "error_count": 1
+        }
+
+
+def _document_output(workers: int, idx: int, total: int, file_path: Path):
+    """
+    문서 1개의 출력 버퍼
+    
+    여러 문서를 동시에 처리하면 문서별 출력(배너, 에이전트 로그, 결과)을 모았다가
+    문서가 끝날 때 한 덩어리로 출력 (문서 1개씩 처리하면 그대로 바로 출력)
+    """
+    if workers <= 1:
+        return nullcontext()
+    
+    print(f"[INFO] [{idx}/{total}] Started: {file_path.name}")
+    return task_output()
+
+
+def _resolve_workers(args, file_count: int) -> int:
+    """문서 병렬 처리 워커 수 결정 (--workers 우선, 기본값 config.MAX_WORKERS)"""
+    workers = getattr(args, "workers", None) or config.MAX_WORKERS
+    return max(1, min(workers, file_count))
 
 
 def main():
@@ -194,6 +268,31 @@ def main():
         help="실행할 단계 (strategy 모드에서만 사용, 기본값: all)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"동시에 처리할 문서 수 (기본값: config.MAX_WORKERS={config.MAX_WORKERS}, 1이면 순차 처리)"
+    )
+    
+    parser.add_argument(
+        "--full-extraction",
+        action="store_true",
+        help="최종 선택 전략으로 문서 전체 페이지 추출 (strategy 모드, 기본값: 샘플 페이지만)"
+    )
+    
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="LLM 응답 캐시 사용 안 함 (항상 Solar API 호출)"
+    )
+    
+    parser.add_argument(
+        "--no-extraction-cache",
+        action="store_true",
+        help="추출 결과 캐시 사용 안 함 (항상 PDF 재파싱)"
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -206,6 +305,15 @@ def main():
     if args.debug:
         config.DEBUG_MODE = True
     
+    if args.full_extraction:
+        config.FULL_EXTRACTION_ENABLED = True
+    
+    if args.no_llm_cache:
+        config.LLM_CACHE_ENABLED = False
+    
+    if args.no_extraction_cache:
+        config.EXTRACTION_CACHE_ENABLED = False
+    
     # 디렉토리 생성
     ensure_directories()
     
@@ -231,6 +339,7 @@ def main():
     print(f"[INFO] Input Files: {len(input_files)}")
     if args.mode == "strategy":
         print(f"[INFO] Stage: {args.stage}")
+    print(f"[INFO] Workers: {_resolve_workers(args, len(input_files))}")
     print(f"{'='*80}\n")
     
     # 모드에 따라 처리
@@ -258,6 +367,12 @@ def main():
     print(f"[FAIL] Failed: {failed}")
     print(f"[TOTAL] Total: {len(results)}")
     
+    llm_cache = get_llm_cache()
+    if llm_cache is not None:
+        cache_stats = llm_cache.stats()
+        print(f"[CACHE] LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']*100:.1f}%), {cache_stats['entries']} entries")
+    
     print(f"\n[OUTPUT] Output locations:")
     print(f"   - Reports: {config.REPORTS_DIR}")
     print(f"   - Tables: {config.TABLES_DIR}")
@@ -4,7 +4,7 @@
 """
 
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 
 def create_validation_prompt(
@@ -107,14 +107,135 @@ JSON만 출력하세요 (다른 설명 없이):"""
     return prompt
 
 
-def parse_validation_response(response_text: str) -> Dict[str, Any]:
+def create_multi_page_validation_prompt(pages_data: List[Dict[str, Any]]) -> str:
+    """
+    여러 페이지(또는 같은 페이지의 여러 전략)를 하나의 프롬프트로 묶어 검증
+    
+    Args:
+        pages_data: 검증 항목 리스트
+            [{
+                'id': 'p1',              # 응답에서 항목을 구분할 ID
+                'page_num': 3,
+                'strategy': 'pdfplumber',
+                'page_text': '...',
+                'has_tables': False,
+                'table_preview': ''
+            }, ...]
+        
+    Returns:
+        Solar LLM용 프롬프트 (응답은 parse_validation_response(..., batch_ids=[...])로 파싱)
+    """
+    
+    prompt = f"""당신은 PDF 텍스트 추출 결과를 검증하는 전문가입니다.
+
+아래 {len(pages_data)}개의 추출 결과를 **각각 독립적으로** 검증해주세요.
+항목끼리 서로 비교하지 말고, 각 항목만 보고 판단하세요.
+"""
+
+    for item in pages_data:
+        page_text = item['page_text']
+        prompt += f"""
+
+==============================
+🆔 **항목 ID: {item['id']}**
+- 페이지: {item['page_num']}
+- 추출 전략: {item['strategy']}
+- 표 포함: {'예' if item.get('has_tables') else '아니오'}
+
+📝 **추출된 텍스트:**
+```
+{page_text[:2000]}
+{f"... (총 {len(page_text)}자)" if len(page_text) > 2000 else ""}
+```
+"""
+        if item.get('has_tables') and item.get('table_preview'):
+            prompt += f"""
+📊 **표 미리보기:**
+```
+{item['table_preview'][:500]}
+```
+"""
+
+    prompt += """
+
+==============================
+🎯 **검증 기준 (항목마다 적용):**
+
+1. **문장의 자연스러움**: 문장이 의미상 자연스럽고 끊기거나 뒤섞이지 않았는가?
+2. **읽기 순서**: 다단(multi-column) 레이아웃이 올바르게 처리되었는가?
+3. **노이즈 제거**: 헤더/푸터/페이지 번호가 본문에 섞여있지 않은가?
+4. **표 및 구조적 요소** (표가 있는 경우): 행/열 구분과 표 구조가 유지되었는가?
+5. **전체적인 가독성**: 실무에서 사용 가능한 수준인가?
+
+📤 **응답 형식:**
+
+모든 항목 ID에 대해 하나씩, JSON 형식으로 응답해주세요:
+
+```json
+{
+  "results": [
+    {
+      "id": "p1",
+      "pass": true,  // 또는 false
+      "confidence": 0.95,  // 0.0~1.0, 판단의 확신도
+      "reason": "판단 근거",
+      "issues": [],  // fail인 경우 ["문장 단절", "다단 혼입"] 등
+      "suggestions": []  // fail인 경우 ["custom_split 사용", "layout_reorder 필요"] 등
+    }
+  ]
+}
+```
+
+**판단 원칙:**
+- **PASS**: 실무에서 사용 가능한 수준 (완벽하지 않아도 괜찮음, 핵심 정보 전달 가능)
+- **FAIL**: 심각한 문제가 있어서 실무 사용 불가 (문장 뒤섞임, 심각한 단절, 표 구조 깨짐 등)
+- 사소한 오타나 미세한 노이즈는 PASS로 처리 (너무 엄격하게 판단하지 말 것)
+
+JSON만 출력하세요 (다른 설명 없이):"""
+
+    return prompt
+
+
+def _extract_json_text(response_text: str) -> str:
+    """LLM 응답에서 JSON 블록 추출 (```json ... ``` 형식 처리)"""
+    text = response_text.strip()
+    
+    if "```json" in text:
+        start = text.find("```json") + 7
+        end = text.find("```", start)
+        text = text[start:end].strip()
+    elif "```" in text:
+        start = text.find("```") + 3
+        end = text.find("```", start)
+        text = text[start:end].strip()
+    
+    return text
+
+
+def _normalize_verdict(result: Dict[str, Any]) -> Dict[str, Any]:
+    """판정 결과 필수 필드 정리"""
+    return {
+        'pass': result.get('pass', False),
+        'confidence': float(result.get('confidence', 0.5)),
+        'reason': result.get('reason', ''),
+        'issues': result.get('issues', []),
+        'suggestions': result.get('suggestions', [])
+    }
+
+
+def parse_validation_response(
+    response_text: str,
+    batch_ids: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Solar LLM 응답 파싱
     
     Args:
         response_text: LLM 응답 텍스트
+        batch_ids: 다중 페이지 프롬프트의 항목 ID 리스트 (없으면 단일 페이지 응답)
         
     Returns:
+        단일 페이지:
         {
             'pass': bool,
             'confidence': float,
@@ -122,33 +243,23 @@ def parse_validation_response(response_text: str) -> Dict[str, Any]:
             'issues': List[str],
             'suggestions': List[str]
         }
+        
+        다중 페이지 (batch_ids 지정 시):
+        {
+            'p1': {...위와 동일...},
+            'p2': None  # 응답에 없거나 파싱 실패한 항목 (개별 재검증 필요)
+        }
     """
     
+    if batch_ids is not None:
+        return _parse_batch_validation_response(response_text, batch_ids)
+    
     try:
-        # JSON 블록 추출
-        text = response_text.strip()
-        
-        # ```json ... ``` 형식 처리
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        
         # JSON 파싱
-        result = json.loads(text)
+        result = json.loads(_extract_json_text(response_text))
         
         # 필수 필드 검증
-        return {
-            'pass': result.get('pass', False),
-            'confidence': float(result.get('confidence', 0.5)),
-            'reason': result.get('reason', ''),
-            'issues': result.get('issues', []),
-            'suggestions': result.get('suggestions', [])
-        }
+        return _normalize_verdict(result)
         
     except Exception as e:
         print(f"[ERROR] Failed to parse validation response: {e}")
@@ -164,6 +275,56 @@ def parse_validation_response(response_text: str) -> Dict[str, Any]:
         }
 
 
+def _parse_batch_validation_response(
+    response_text: str,
+    batch_ids: List[str]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    다중 페이지 응답 파싱 (항목별 판정, 누락/오류 항목은 None)
+    
+    - 요청하지 않은 ID는 무시
+    - 같은 ID가 여러 번 나오면 어느 페이지의 판정인지 알 수 없으므로 None
+    - pass가 bool이 아니면 ("false" 문자열 등) None
+    """
+    
+    verdicts: Dict[str, Optional[Dict[str, Any]]] = {batch_id: None for batch_id in batch_ids}
+    
+    try:
+        result = json.loads(_extract_json_text(response_text))
+    except Exception as e:
+        print(f"[ERROR] Failed to parse batch validation response: {e}")
+        print(f"Response text: {response_text[:200]}")
+        return verdicts
+    
+    items = result.get('results', []) if isinstance(result, dict) else result
+    if not isinstance(items, list):
+        return verdicts
+    
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        
+        batch_id = str(item.get('id', '')).strip()
+        if batch_id not in verdicts:
+            continue
+        
+        if batch_id in seen:
+            verdicts[batch_id] = None
+            continue
+        seen.add(batch_id)
+        
+        if not isinstance(item.get('pass'), bool):
+            continue
+        
+        try:
+            verdicts[batch_id] = _normalize_verdict(item)
+        except (TypeError, ValueError):
+            continue
+    
+    return verdicts
+
+
 def create_validation_prompt_batch(
     pages_data: List[Dict[str, Any]],
     strategy: str
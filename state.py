@@ -3,9 +3,196 @@ LangGraph 상태 정의
 멀티 에이전트 시스템의 상태를 관리
 """
 
-from typing import TypedDict, List, Dict, Optional, Any, Literal
+import operator
+from typing import TypedDict, List, Dict, Optional, Any, Literal, Iterable, Iterator, Union
 from datetime import datetime
 from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+
+class BBoxTable:
+    """
+    단어/블록 바운딩 박스의 열(column) 기반 표현
+    
+    - 좌표: 열마다 float32 배열 하나 (x0, y0, x1, y1, top, bottom)
+    - 텍스트: UTF-8 버퍼 하나 + 오프셋 배열 (i번째 텍스트 = buffer[offsets[i]:offsets[i+1]])
+    - 기존 호출부 호환: len(), 인덱싱, 순회 시 {"text", "x0", ...} dict 반환 (슬라이싱은 새 BBoxTable)
+    - 직렬화: to_arrays()/from_arrays() (npz 저장은 save_bbox_tables/load_bbox_tables)
+    """
+    
+    COLUMNS = ("x0", "y0", "x1", "y1", "top", "bottom")
+    
+    __slots__ = ("coords", "text_buffer", "offsets")
+    
+    def __init__(
+        self,
+        coords: Optional[np.ndarray] = None,
+        text_buffer: bytes = b"",
+        offsets: Optional[np.ndarray] = None
+    ):
+        self.coords = coords if coords is not None else np.zeros((len(self.COLUMNS), 0), dtype=np.float32)
+        self.text_buffer = text_buffer
+        self.offsets = offsets if offsets is not None else np.zeros(1, dtype=np.int64)
+    
+    @classmethod
+    def from_dicts(cls, boxes: Iterable[Dict[str, Any]]) -> "BBoxTable":
+        """dict 리스트(도구 출력 형식)에서 생성 (top/bottom이 없으면 y0/y1 사용)"""
+        boxes = [box for box in boxes if isinstance(box, dict)]
+        
+        coords = np.empty((len(cls.COLUMNS), len(boxes)), dtype=np.float32)
+        encoded = []
+        for i, box in enumerate(boxes):
+            y0 = box.get("y0", 0) or 0
+            y1 = box.get("y1", 0) or 0
+            coords[:, i] = (
+                box.get("x0", 0) or 0,
+                y0,
+                box.get("x1", 0) or 0,
+                y1,
+                box.get("top", y0),
+                box.get("bottom", y1)
+            )
+            encoded.append(str(box.get("text", "")).encode("utf-8"))
+        
+        offsets = np.zeros(len(boxes) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=offsets[1:])
+        return cls(coords, b"".join(encoded), offsets)
+    
+    @classmethod
+    def coerce(cls, boxes: Union["BBoxTable", Iterable[Dict[str, Any]], None]) -> "BBoxTable":
+        """BBoxTable이면 그대로, dict 리스트면 변환"""
+        if isinstance(boxes, cls):
+            return boxes
+        return cls.from_dicts(boxes or [])
+    
+    @classmethod
+    def concat(cls, tables: Iterable["BBoxTable"]) -> "BBoxTable":
+        """여러 테이블을 순서대로 이어 붙임"""
+        tables = [cls.coerce(table) for table in tables]
+        if not tables:
+            return cls()
+        
+        offsets = [np.zeros(1, dtype=np.int64)]
+        base = 0
+        for table in tables:
+            offsets.append(table.offsets[1:] + base)
+            base += len(table.text_buffer)
+        
+        return cls(
+            np.concatenate([table.coords for table in tables], axis=1),
+            b"".join(table.text_buffer for table in tables),
+            np.concatenate(offsets)
+        )
+    
+    def column(self, name: str) -> np.ndarray:
+        """좌표 열 (float32 배열 뷰)"""
+        return self.coords[self.COLUMNS.index(name)]
+    
+    def text(self, index: int) -> str:
+        """index번째 텍스트"""
+        return self.text_buffer[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+    
+    def texts(self, indices: Optional[Iterable[int]] = None) -> List[str]:
+        """텍스트 리스트 (indices 지정 시 해당 순서로)"""
+        if indices is None:
+            indices = range(len(self))
+        return [self.text(int(i)) for i in indices]
+    
+    def take(self, indices: Union[np.ndarray, List[int]]) -> "BBoxTable":
+        """지정한 순서의 행만 모은 새 테이블 (재정렬/필터링)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        encoded = [self.text_buffer[self.offsets[i]:self.offsets[i + 1]] for i in indices]
+        
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=offsets[1:])
+        return BBoxTable(self.coords[:, indices], b"".join(encoded), offsets)
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """dict 리스트로 변환 (기존 형식)"""
+        return list(self)
+    
+    def to_arrays(self, prefix: str = "") -> Dict[str, np.ndarray]:
+        """npz 저장용 배열 dict"""
+        return {
+            f"{prefix}coords": self.coords,
+            f"{prefix}text": np.frombuffer(self.text_buffer, dtype=np.uint8),
+            f"{prefix}offsets": self.offsets
+        }
+    
+    @classmethod
+    def from_arrays(cls, arrays: Any, prefix: str = "") -> "BBoxTable":
+        """to_arrays() 결과(또는 np.load 결과)에서 복원"""
+        return cls(
+            np.asarray(arrays[f"{prefix}coords"], dtype=np.float32),
+            np.asarray(arrays[f"{prefix}text"], dtype=np.uint8).tobytes(),
+            np.asarray(arrays[f"{prefix}offsets"], dtype=np.int64)
+        )
+    
+    @property
+    def nbytes(self) -> int:
+        """메모리 사용량 (bytes)"""
+        return self.coords.nbytes + len(self.text_buffer) + self.offsets.nbytes
+    
+    def __len__(self) -> int:
+        return self.coords.shape[1]
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], "BBoxTable"]:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(
+                f"BBoxTable indices must be integers or slices, not {type(index).__name__}"
+            ) from None
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BBoxTable index out of range")
+        
+        box = {"text": self.text(index)}
+        box.update(zip(self.COLUMNS, self.coords[:, index].tolist()))
+        return box
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, list):
+            other = BBoxTable.from_dicts(other)
+        if not isinstance(other, BBoxTable):
+            return NotImplemented
+        return (
+            np.array_equal(self.coords, other.coords)
+            and self.text_buffer == other.text_buffer
+            and np.array_equal(self.offsets, other.offsets)
+        )
+    
+    def __repr__(self) -> str:
+        return f"BBoxTable({len(self)} boxes, {self.nbytes} bytes)"
+
+
+def save_bbox_tables(path: Union[str, Path], tables: Dict[int, BBoxTable]) -> None:
+    """페이지별 BBoxTable을 npz 파일 하나로 저장 (키: 페이지 번호)"""
+    arrays = {}
+    for page_num, table in tables.items():
+        arrays.update(BBoxTable.coerce(table).to_arrays(prefix=f"p{page_num}_"))
+    np.savez_compressed(path, **arrays)
+
+
+def load_bbox_tables(path: Union[str, Path]) -> Dict[int, BBoxTable]:
+    """save_bbox_tables()로 저장한 npz 로드"""
+    with np.load(path) as arrays:
+        page_nums = sorted({int(key[1:].split("_", 1)[0]) for key in arrays.files})
+        return {
+            page_num: BBoxTable.from_arrays(arrays, prefix=f"p{page_num}_")
+            for page_num in page_nums
+        }
 
 
 @dataclass
@@ -14,12 +201,15 @@ class PageExtractionResult:
     page_num: int  # 페이지 번호
     strategy: str  # 'pdfplumber', 'pdfminer', 'pypdfium2', etc.
     text: str  # 추출된 텍스트
-    bbox: List[Dict[str, Any]] = field(default_factory=list)  # 바운딩 박스 정보
+    bbox: BBoxTable = field(default_factory=BBoxTable)  # 바운딩 박스 정보 (dict 리스트도 허용, 자동 변환)
     tables: List[Dict[str, Any]] = field(default_factory=list)  # 테이블 정보
     processing_time_ms: float = 0.0
     status: Literal["success", "failed"] = "success"
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        self.bbox = BBoxTable.coerce(self.bbox)
 
 
 @dataclass
@@ -0,0 +1,150 @@
+"""
+BBoxTable 테스트 스크립트
+
+- dict 리스트 → BBoxTable → dict 리스트 왕복
+- to_arrays/from_arrays, save_bbox_tables/load_bbox_tables 왕복
+- 인덱싱/슬라이싱, 잘못된 인덱스 타입
+- concat/take
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 현재 디렉토리를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SOLAR_API_KEY", "test-key")
+
+import numpy as np
+
+from state import BBoxTable, save_bbox_tables, load_bbox_tables
+
+
+def _boxes(count: int, prefix: str = "단어"):
+    """float32로 정확히 표현되는 좌표 + 한글/BMP 밖 문자가 섞인 텍스트"""
+    return [
+        {
+            "text": f"{prefix}{i}" + ("𝑥" if i % 3 == 0 else ""),
+            "x0": 10.0 + i,
+            "y0": 700.5 - i,
+            "x1": 20.25 + i,
+            "y1": 710.5 - i,
+            "top": 81.5 + i,
+            "bottom": 91.5 + i
+        }
+        for i in range(count)
+    ]
+
+
+def test_dicts_round_trip():
+    """from_dicts → to_dicts 왕복 (텍스트/좌표 보존, top/bottom 누락 시 y0/y1 사용)"""
+    boxes = _boxes(7)
+    table = BBoxTable.from_dicts(boxes)
+
+    assert len(table) == 7
+    assert table.to_dicts() == boxes
+    assert table == boxes
+
+    no_top = BBoxTable.from_dicts([{"text": "a", "x0": 1, "y0": 2, "x1": 3, "y1": 4}])
+    assert no_top[0]["top"] == 2 and no_top[0]["bottom"] == 4
+
+    empty = BBoxTable.from_dicts([])
+    assert len(empty) == 0 and empty.to_dicts() == []
+
+
+def test_arrays_round_trip():
+    """to_arrays → from_arrays 왕복 (prefix 포함)"""
+    table = BBoxTable.from_dicts(_boxes(5))
+
+    restored = BBoxTable.from_arrays(table.to_arrays(prefix="p3_"), prefix="p3_")
+    assert restored == table
+    assert restored.coords.dtype == np.float32
+    assert restored.offsets.dtype == np.int64
+    assert restored.texts() == table.texts()
+
+
+def test_npz_round_trip():
+    """save_bbox_tables → load_bbox_tables 왕복 (dict 리스트/빈 페이지 포함)"""
+    tables = {
+        1: BBoxTable.from_dicts(_boxes(4)),
+        12: _boxes(2, prefix="표"),  # dict 리스트도 저장 가능
+        3: BBoxTable()
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "bboxes.npz"
+        save_bbox_tables(path, tables)
+        loaded = load_bbox_tables(path)
+
+    assert sorted(loaded) == [1, 3, 12]
+    assert loaded[1] == tables[1]
+    assert loaded[12].to_dicts() == tables[12]
+    assert len(loaded[3]) == 0
+
+
+def test_indexing_and_slicing():
+    """정수 인덱싱은 dict, 슬라이스는 BBoxTable, 그 외 타입은 TypeError"""
+    boxes = _boxes(6)
+    table = BBoxTable.from_dicts(boxes)
+
+    assert table[0] == boxes[0]
+    assert table[-1] == boxes[-1]
+    assert table[np.int64(2)] == boxes[2]
+
+    for key in (slice(1, 4), slice(None, None, 2), slice(None, None, -1), slice(4, 100), slice(5, 1)):
+        sliced = table[key]
+        assert isinstance(sliced, BBoxTable)
+        assert sliced.to_dicts() == boxes[key], key
+
+    try:
+        table[6]
+        assert False, "IndexError expected"
+    except IndexError:
+        pass
+
+    try:
+        table["x0"]
+        assert False, "TypeError expected"
+    except TypeError as e:
+        assert "integers or slices" in str(e)
+
+
+def test_concat_and_take():
+    """concat은 순서대로 이어 붙이고 take는 지정 순서로 재배열"""
+    first, second = _boxes(3), _boxes(2, prefix="둘째")
+    merged = BBoxTable.concat([BBoxTable.from_dicts(first), second, []])
+
+    assert merged.to_dicts() == first + second
+    assert merged.take([4, 0, 2]).to_dicts() == [(first + second)[i] for i in (4, 0, 2)]
+    assert len(BBoxTable.concat([])) == 0
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        test_dicts_round_trip,
+        test_arrays_round_trip,
+        test_npz_round_trip,
+        test_indexing_and_slicing,
+        test_concat_and_take,
+    ]
+
+    failed = 0
+    for index, test in enumerate(tests, 1):
+        print("\n" + "="*60)
+        print(f"[TEST {index}] {test.__doc__}")
+        print("="*60)
+        try:
+            test()
+            print("[OK] 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+
+    print(f"\n[RESULT] {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
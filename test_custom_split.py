@@ -1,17 +1,98 @@
 """
 Custom Split Tool 테스트 스크립트
+
+- 초기화 / data/input PDF 처리
+- 벡터 레이아웃 메트릭 판정 (_classify_layout)
+- 이중 페이지 이미지 휴리스틱: 판정용 썸네일(CUSTOM_SPLIT_DETECT_DPI)과 분할 DPI 결과 일치
+- 벡터 분할 절반의 MediaBox / 원점 (0, 0) 배치 (도구별 bbox 좌표계 일치)
 """
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # 현재 디렉토리를 sys.path에 추가
 sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SOLAR_API_KEY", "test-key")
+
+import fitz  # PyMuPDF
 
 from tools.custom_split_tool import CustomSplitTool
+from tools.pdfminer_tool import PDFMinerTool
+from tools.pdfplumber_tool import PDFPlumberTool
+from tools.pypdfium2_tool import PyPDFium2Tool
+from state import BBoxTable
 import config
 
 
+LANDSCAPE = (842, 595)  # A4 가로 (pt)
+PORTRAIT = (595, 842)
+BODY_LINE = "Quarterly revenue grew on strong loan demand and fee income. "
+RIGHT_LINE = "Net interest margin widened as deposit costs eased further. "
+RIGHT_COLUMN_X0 = 461
+
+
+def _write_text_column(page: fitz.Page, x0: float, chars_per_line: int, body: str = BODY_LINE):
+    """문단 4개 x 6줄 텍스트 (문단마다 별도 블록)"""
+    line = (body * 3)[:chars_per_line]
+    for paragraph in range(4):
+        for row in range(6):
+            page.insert_text((x0, 60 + paragraph * 130 + row * 14), line, fontsize=9)
+
+
+def _make_layout_pdf() -> fitz.Document:
+    """
+    판정 테스트용 PDF
+    
+    1. 좌/우 2면 스프레드 (텍스트 레이어)
+    2. 중앙을 가로지르는 1단 본문 (가로형 단일 페이지)
+    3. 1의 스캔본 (텍스트 레이어 없음)
+    4. 텍스트 없는 가로형 그림 페이지 (중앙을 덮는 도형)
+    5. 세로형 페이지
+    """
+    doc = fitz.open()
+    
+    spread = doc.new_page(width=LANDSCAPE[0], height=LANDSCAPE[1])
+    _write_text_column(spread, 40, chars_per_line=58)
+    _write_text_column(spread, RIGHT_COLUMN_X0, chars_per_line=58, body=RIGHT_LINE)
+    
+    single = doc.new_page(width=LANDSCAPE[0], height=LANDSCAPE[1])
+    _write_text_column(single, 40, chars_per_line=150)
+    
+    pixmap = doc[0].get_pixmap(dpi=150)
+    scanned = doc.new_page(width=LANDSCAPE[0], height=LANDSCAPE[1])
+    scanned.insert_image(scanned.rect, pixmap=pixmap)
+    
+    figure = doc.new_page(width=LANDSCAPE[0], height=LANDSCAPE[1])
+    figure.draw_rect(fitz.Rect(100, 100, 742, 495), color=(0.2, 0.3, 0.6), fill=(0.2, 0.3, 0.6))
+    
+    portrait = doc.new_page(width=PORTRAIT[0], height=PORTRAIT[1])
+    _write_text_column(portrait, 40, chars_per_line=90)
+    
+    # 페이지 추가 중 만든 Page 객체는 무효화되므로 다시 열어서 사용
+    return fitz.open(stream=doc.tobytes(), filetype="pdf")
+
+
+def _layout(**overrides) -> dict:
+    """_classify_layout 입력 (기본값: 좌/우 블록 없음, 가로형)"""
+    layout = {
+        "page_area": 842.0 * 595.0,
+        "aspect_ratio": 842 / 595,
+        "left_area": 0.0,
+        "right_area": 0.0,
+        "center_area": 0.0,
+        "left_blocks": 0,
+        "right_blocks": 0,
+        "bridge_blocks": 0,
+        "bridge_area": 0.0,
+        "max_block_width_ratio": 0.0,
+        "center_words": 0,
+    }
+    layout.update(overrides)
+    return layout
+
+
 def test_tool_initialization():
     """도구 초기화 테스트"""
     print("\n" + "="*60)
@@ -79,6 +160,92 @@ def test_with_pdf(tool, pdf_path: str):
         traceback.print_exc()
 
 
+def test_classify_layout_verdicts():
+    """벡터 레이아웃 판정: True(이중) / False(단일) / None(이미지 휴리스틱으로)"""
+    tool = CustomSplitTool()
+    spread = dict(left_blocks=4, right_blocks=4, left_area=20000.0, right_area=20000.0,
+                  max_block_width_ratio=0.35)
+    
+    # 가로세로비 1.2 미만은 블록과 무관하게 단일
+    assert tool._classify_layout(_layout(aspect_ratio=1.19, **spread)) is False
+    # 텍스트 레이어 없음 → 판단 불가
+    assert tool._classify_layout(_layout()) is None
+    # 좌/우 블록 충분 + 중앙 비어 있음 → 이중
+    assert tool._classify_layout(_layout(**spread)) is True
+    assert tool._classify_layout(_layout(**spread, center_area=2000.0)) is True
+    # 중앙 대역에 내용이 많거나 한쪽 블록이 부족하면 판단 불가
+    assert tool._classify_layout(_layout(**dict(spread, center_area=4001.0))) is None
+    assert tool._classify_layout(_layout(**dict(spread, right_blocks=1))) is None
+    # 중앙을 가로지르는 넓은 블록: 중앙선 위 단어가 있으면 단일, 없으면 (번갈아 쓴 스프레드일 수 있어) 판단 불가
+    wide = dict(spread, bridge_blocks=6, bridge_area=10000.0, max_block_width_ratio=0.9)
+    assert tool._classify_layout(_layout(**dict(wide, center_words=3))) is False
+    assert tool._classify_layout(_layout(**dict(wide, center_words=2))) is None
+    
+    with _make_layout_pdf() as pdf:
+        verdicts = [tool._classify_layout(tool._measure_page_layout(page)) for page in pdf]
+    
+    # 스프레드 / 1단 본문 / 스캔본 / 그림 / 세로형
+    assert verdicts == [True, False, None, None, False], verdicts
+
+
+def test_detect_dpi_matches_full_dpi():
+    """이미지 휴리스틱: 판정용 썸네일(CUSTOM_SPLIT_DETECT_DPI)과 분할 DPI(CUSTOM_SPLIT_DPI) 결과 일치"""
+    tool = CustomSplitTool()
+    
+    with _make_layout_pdf() as pdf:
+        for page in pdf:
+            layout = tool._measure_page_layout(page)
+            thumbnail_verdict = tool._is_double_page(tool._render_page(page, config.CUSTOM_SPLIT_DETECT_DPI), layout)
+            full_verdict = tool._is_double_page(tool._render_page(page, config.CUSTOM_SPLIT_DPI), layout)
+            assert thumbnail_verdict == full_verdict, f"page {page.number + 1}: {thumbnail_verdict} != {full_verdict}"
+        
+        # 벡터 메트릭으로 판단할 수 없는 페이지는 썸네일로 판정
+        assert tool._detect_double_page(pdf[2], tool._measure_page_layout(pdf[2])) is True
+        assert tool._detect_double_page(pdf[3], tool._measure_page_layout(pdf[3])) is False
+
+
+def test_vector_halves_mediabox_and_origin():
+    """벡터 분할: 절반 MediaBox는 (0, 0)부터, 반대쪽 텍스트 제거, 도구별 bbox가 [0, 절반 너비]로 일치"""
+    tool = CustomSplitTool()
+    tool.settings["split_mode"] = "vector"
+    half_width = LANDSCAPE[0] / 2
+    
+    with _make_layout_pdf() as pdf:
+        source = pdf.tobytes()
+    
+    # 스프레드(1) + 세로형(5)만 분할
+    split_bytes, page_map = tool._split_pdf_bytes(source, pages=[1, 5])
+    assert page_map == {1: [1, 2], 5: [3]}, page_map
+    
+    with fitz.open(stream=split_bytes, filetype="pdf") as split_pdf:
+        assert split_pdf.page_count == 3
+        for index in (0, 1):
+            assert split_pdf[index].mediabox == fitz.Rect(0, 0, half_width, LANDSCAPE[1]), split_pdf[index].mediabox
+        assert split_pdf[2].mediabox == fitz.Rect(0, 0, *PORTRAIT)
+        
+        left_text, right_text = split_pdf[0].get_text(), split_pdf[1].get_text()
+        assert "Quarterly" in left_text and "Net interest" not in left_text
+        assert "Net interest" in right_text and "Quarterly" not in right_text
+    
+    # 오른쪽 절반도 원점 기준 → 모든 도구에서 오른쪽 단 시작 x = 원래 x - 절반 너비
+    expected_x0 = RIGHT_COLUMN_X0 - half_width
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        split_path = Path(tmp_dir) / "split.pdf"
+        split_path.write_bytes(split_bytes)
+        
+        for extraction_tool in (PDFPlumberTool(), PDFMinerTool(), PyPDFium2Tool()):
+            pages = {page["page"]: page for page in extraction_tool.extract(split_path, pages=[1, 2])["pages"]}
+            name = type(extraction_tool).__name__
+            
+            for page_num in (1, 2):
+                bbox = BBoxTable.coerce(pages[page_num]["bbox"])
+                assert len(bbox) > 0, name
+                assert bbox.column("x0").min() >= -1 and bbox.column("x1").max() <= half_width + 1, name
+            
+            right_x0 = float(BBoxTable.coerce(pages[2]["bbox"]).column("x0").min())
+            assert abs(right_x0 - expected_x0) < 2, f"{name}: right half starts at x={right_x0:.1f}"
+
+
 def main():
     print("\n" + "="*60)
     print("Custom Split Tool 테스트")
@@ -103,6 +270,27 @@ def main():
     else:
         print(f"\n[SKIP] {input_dir} 폴더가 없습니다")
     
+    # 3. 이중 페이지 판정 / 벡터 분할 (생성한 PDF 사용)
+    tests = [
+        test_classify_layout_verdicts,
+        test_detect_dpi_matches_full_dpi,
+        test_vector_halves_mediabox_and_origin,
+    ]
+    
+    failed = 0
+    for index, test in enumerate(tests, 3):
+        print("\n" + "="*60)
+        print(f"[TEST {index}] {test.__doc__}")
+        print("="*60)
+        try:
+            test()
+            print("[OK] 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    
+    print(f"\n[RESULT] {len(tests) - failed}/{len(tests)} 통과")
+    
     print("\n" + "="*60)
     print("[완료] 테스트 종료")
     print("="*60 + "\n")
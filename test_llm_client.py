@@ -0,0 +1,263 @@
+"""
+SolarClient 테스트 스크립트 (로컬 스텁 HTTP 서버 사용, 실제 API 호출 없음)
+
+- 5xx 재시도
+- 429 + Retry-After
+- 백오프 대기 중 동시 호출 슬롯 반납
+- 최대 동시 호출 수 제한
+- acall_many 결과 순서
+- 캐시 DB 오류 시 API 호출로 진행
+- 전체 시간 한도 (timeout) 도달 시 요청/재시도 중단
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 현재 디렉토리를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SOLAR_API_KEY", "test-key")
+
+import config
+import utils.llm_client as llm_client
+from utils.llm_client import SolarClient
+
+
+class _StubSolarServer:
+    """
+    /chat/completions 스텁 서버 (프롬프트로 응답 방식 지정)
+
+    - "ok": 바로 200
+    - "delay:<초>[#구분자]": 지정 시간 후 200
+    - "fail:<횟수>": 처음 N번은 503, 이후 200
+    - "ratelimit:<초>": 첫 시도는 429 + Retry-After, 이후 200
+
+    200 응답의 content는 프롬프트 그대로
+    """
+
+    def __init__(self):
+        self.attempts = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["messages"][-1]["content"]
+                stub._handle(self, prompt)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.api_base = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handle(self, handler: BaseHTTPRequestHandler, prompt: str):
+        with self._lock:
+            attempt = self.attempts[prompt] = self.attempts.get(prompt, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            kind, _, arg = prompt.partition(":")
+            if kind == "delay":
+                time.sleep(float(arg.split("#")[0]))
+            elif kind == "fail" and attempt <= int(arg):
+                return self._send(handler, 503, {"error": "unavailable"})
+            elif kind == "ratelimit" and attempt == 1:
+                return self._send(handler, 429, {"error": "rate limited"}, {"Retry-After": arg})
+
+            self._send(handler, 200, {
+                "choices": [{"message": {"content": prompt}}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                "model": "stub"
+            })
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _send(self, handler: BaseHTTPRequestHandler, status: int, body: dict, headers: dict = None):
+        data = json.dumps(body).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+
+def _client(server: _StubSolarServer, max_concurrency: int = 4) -> SolarClient:
+    """스텁 서버용 클라이언트 (캐시/Rate Limit 없이, 짧은 백오프)"""
+    config.LLM_CACHE_ENABLED = False
+    config.SOLAR_RETRY_BACKOFF_BASE = 0.05
+    return SolarClient(
+        api_base=server.api_base,
+        max_concurrency=max_concurrency,
+        rate_limit_rps=0,
+        max_retries=3
+    )
+
+
+def test_retry_on_server_error():
+    """5xx 응답은 재시도 후 성공"""
+    with _StubSolarServer() as server:
+        result = _client(server).call("fail:2")
+
+        assert result is not None
+        assert result["content"] == "fail:2"
+        assert server.attempts["fail:2"] == 3
+
+
+def test_retries_exhausted_returns_none():
+    """재시도 횟수를 넘기면 None 반환 (예외 전파 없음)"""
+    with _StubSolarServer() as server:
+        assert _client(server).call("fail:10") is None
+        assert server.attempts["fail:10"] == 4
+
+
+def test_rate_limit_retry_after():
+    """429는 Retry-After만큼 기다린 뒤 재시도"""
+    with _StubSolarServer() as server:
+        start = time.monotonic()
+        result = _client(server).call("ratelimit:0.4")
+        elapsed = time.monotonic() - start
+
+        assert result is not None and result["content"] == "ratelimit:0.4"
+        assert server.attempts["ratelimit:0.4"] == 2
+        assert elapsed >= 0.4
+
+
+def test_backoff_releases_concurrency_slot():
+    """429 백오프 대기 중에는 슬롯을 반납하므로 다른 호출이 먼저 끝남"""
+    with _StubSolarServer() as server:
+        client = _client(server, max_concurrency=1)
+        finished = {}
+
+        def run(prompt: str):
+            client.call(prompt)
+            finished[prompt] = time.monotonic()
+
+        start = time.monotonic()
+        limited = threading.Thread(target=run, args=("ratelimit:1",))
+        limited.start()
+        time.sleep(0.2)
+        run("ok")
+        limited.join()
+
+        assert finished["ok"] - start < 0.8
+        assert finished["ok"] < finished["ratelimit:1"]
+
+
+def test_concurrency_cap():
+    """동시에 진행 중인 요청은 max_concurrency를 넘지 않음"""
+    with _StubSolarServer() as server:
+        client = _client(server, max_concurrency=2)
+        threads = [
+            threading.Thread(target=client.call, args=(f"delay:0.2#{i}",))
+            for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert server.max_in_flight == 2
+        assert len(server.attempts) == 6
+
+
+def test_acall_many_keeps_order():
+    """acall_many 결과는 완료 순서와 무관하게 프롬프트 순서"""
+    with _StubSolarServer() as server:
+        prompts = ["delay:0.3", "delay:0.1", "fail:1", "delay:0.2"]
+        results = asyncio.run(_client(server).acall_many(prompts))
+
+        assert [result["content"] for result in results] == prompts
+
+
+def test_call_timeout_stops_request_and_retries():
+    """timeout에 닿으면 진행 중인 요청과 남은 재시도를 멈추고 슬롯을 반납"""
+    with _StubSolarServer() as server:
+        client = _client(server, max_concurrency=1)
+
+        start = time.monotonic()
+        assert client.call("delay:2", timeout=0.5) is None
+        assert client.call("ratelimit:5", timeout=0.5) is None
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 1.5
+        assert server.attempts["ratelimit:5"] == 1
+        assert client.call("ok", timeout=0.5)["content"] == "ok"
+
+
+def test_cache_error_falls_back_to_api():
+    """캐시 DB 오류(잠김 등)는 예외 없이 API 호출로 진행"""
+
+    class _BrokenCache:
+        def get(self, key):
+            raise sqlite3.OperationalError("database is locked")
+
+        def set(self, key, value):
+            raise sqlite3.OperationalError("database is locked")
+
+    with _StubSolarServer() as server:
+        client = _client(server)
+        original = llm_client.get_llm_cache
+        llm_client.get_llm_cache = lambda: _BrokenCache()
+        try:
+            result = client.call("ok")
+        finally:
+            llm_client.get_llm_cache = original
+
+        assert result is not None and result["content"] == "ok"
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        test_retry_on_server_error,
+        test_retries_exhausted_returns_none,
+        test_rate_limit_retry_after,
+        test_backoff_releases_concurrency_slot,
+        test_concurrency_cap,
+        test_acall_many_keeps_order,
+        test_call_timeout_stops_request_and_retries,
+        test_cache_error_falls_back_to_api,
+    ]
+
+    failed = 0
+    for index, test in enumerate(tests, 1):
+        print("\n" + "="*60)
+        print(f"[TEST {index}] {test.__doc__}")
+        print("="*60)
+        try:
+            test()
+            print("[OK] 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+
+    print(f"\n[RESULT] {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Upstage OCR / Document Parse 도구 테스트 스크립트 (로컬 스텁 엔드포인트 사용, 실제 API 호출 없음)
+
+- 샘플 페이지만 담은 PDF 업로드
+- 부분 PDF 페이지 번호 → 원본 페이지 번호 변환
+- 전체 페이지 요청 시 원본 파일 그대로 업로드
+- 범위 안의 페이지가 없으면 API 호출 생략
+"""
+
+import email.parser
+import email.policy
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 현재 디렉토리를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SOLAR_API_KEY", "test-key")
+
+import fitz  # PyMuPDF
+from pypdf import PdfReader
+
+from tools.upstage_ocr_tool import UpstageOCRTool
+from tools.upstage_document_parse_tool import UpstageDocumentParseTool
+from utils.file_utils import build_page_subset_pdf, remap_subset_pages
+
+
+PAGE_COUNT = 12
+
+
+def _page_marker(page_num: int) -> str:
+    return f"Original page {page_num} marker"
+
+
+def _make_pdf(path: Path):
+    """페이지마다 고유 문구가 들어 있는 테스트 PDF 생성"""
+    with fitz.open() as pdf:
+        for page_num in range(1, PAGE_COUNT + 1):
+            page = pdf.new_page()
+            page.insert_text((72, 72), _page_marker(page_num), fontsize=12)
+        pdf.save(str(path))
+
+
+class _StubUpstageServer:
+    """
+    Upstage 문서 API 스텁 (업로드된 PDF의 페이지별 텍스트를 그대로 응답)
+
+    - /ocr: {"pages": [{"text": ...}, ...]}
+    - /document-parse: {"elements": [{"page": i, "content": {"text": ...}}, ...]}
+    """
+
+    def __init__(self):
+        self.uploads = []
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                stub._handle(self, body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handle(self, handler: BaseHTTPRequestHandler, body: bytes):
+        message = email.parser.BytesParser(policy=email.policy.default).parsebytes(
+            f"Content-Type: {handler.headers['Content-Type']}\r\n\r\n".encode("ascii") + body
+        )
+        document = next(
+            part.get_payload(decode=True) for part in message.iter_parts()
+            if part.get_param("name", header="content-disposition") == "document"
+        )
+        self.uploads.append(document)
+
+        texts = [page.extract_text() for page in PdfReader(io.BytesIO(document)).pages]
+        if handler.path == "/ocr":
+            result = {"pages": [{"text": text, "width": 612, "height": 792} for text in texts]}
+        else:
+            result = {"elements": [
+                {"page": index, "category": "paragraph", "content": {"text": text}}
+                for index, text in enumerate(texts, 1)
+            ]}
+
+        data = json.dumps(result).encode("utf-8")
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+
+def _tools(server: _StubUpstageServer):
+    """스텁 엔드포인트를 가리키는 두 도구"""
+    ocr = UpstageOCRTool()
+    ocr.api_url = server.base_url + "/ocr"
+    document_parse = UpstageDocumentParseTool()
+    document_parse.api_url = server.base_url + "/document-parse"
+    return [ocr, document_parse]
+
+
+def test_remap_subset_pages():
+    """부분 PDF 페이지 번호를 원본 페이지 번호로 변환 (대응 페이지가 없으면 제외)"""
+    pages = [{"page": 1, "text": "a"}, {"page": 2, "text": "b"}, {"page": 3, "text": "c"}]
+    remapped = remap_subset_pages(pages, [4, 9])
+
+    assert remapped == [{"page": 4, "text": "a"}, {"page": 9, "text": "b"}]
+
+
+def test_sampled_pages_only_uploaded():
+    """샘플 페이지만 업로드하고 원본 페이지 번호로 반환"""
+    with tempfile.TemporaryDirectory() as tmp_dir, _StubUpstageServer() as server:
+        pdf_path = Path(tmp_dir) / "sample.pdf"
+        _make_pdf(pdf_path)
+
+        for tool in _tools(server):
+            result = tool.extract(pdf_path, pages=[9, 2, 5, 2, 99])
+
+            assert [page["page"] for page in result["pages"]] == [2, 5, 9]
+            for page in result["pages"]:
+                assert _page_marker(page["page"]) in page["text"]
+            assert len(PdfReader(io.BytesIO(server.uploads[-1])).pages) == 3
+
+
+def test_all_pages_upload_original():
+    """전체 페이지 요청 시 원본 파일 그대로 업로드"""
+    with tempfile.TemporaryDirectory() as tmp_dir, _StubUpstageServer() as server:
+        pdf_path = Path(tmp_dir) / "sample.pdf"
+        _make_pdf(pdf_path)
+        original = pdf_path.read_bytes()
+
+        for tool in _tools(server):
+            for pages in (None, list(range(1, PAGE_COUNT + 1))):
+                result = tool.extract(pdf_path, pages=pages)
+
+                assert server.uploads[-1] == original
+                assert [page["page"] for page in result["pages"]] == list(range(1, PAGE_COUNT + 1))
+
+
+def test_out_of_range_pages_skip_api():
+    """범위 안의 페이지가 없으면 API를 호출하지 않고 빈 결과 반환"""
+    with tempfile.TemporaryDirectory() as tmp_dir, _StubUpstageServer() as server:
+        pdf_path = Path(tmp_dir) / "sample.pdf"
+        _make_pdf(pdf_path)
+
+        assert build_page_subset_pdf(pdf_path, [0, 50]) == (None, [])
+        for tool in _tools(server):
+            assert tool.extract(pdf_path, pages=[50, 60])["pages"] == []
+        assert server.uploads == []
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        test_remap_subset_pages,
+        test_sampled_pages_only_uploaded,
+        test_all_pages_upload_original,
+        test_out_of_range_pages_skip_api,
+    ]
+
+    failed = 0
+    for index, test in enumerate(tests, 1):
+        print("\n" + "="*60)
+        print(f"[TEST {index}] {test.__doc__}")
+        print("="*60)
+        try:
+            test()
+            print("[OK] 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+
+    print(f"\n[RESULT] {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
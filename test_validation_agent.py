@@ -0,0 +1,333 @@
+"""
+ValidationAgent 테스트 스크립트 (가짜 LLM 클라이언트 사용, 실제 API 호출 없음)
+
+- 다중 페이지 검증 응답 파싱 (누락/중복/형식 오류 ID)
+- 묶음 검증에서 판정을 얻지 못한 페이지는 결과에서 제외 (개별 재검증 대상)
+- 휴리스틱 사전 검증 Pass/Fail/에스컬레이션 기준
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+# 현재 디렉토리를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SOLAR_API_KEY", "test-key")
+
+import config
+from agents.validation_agent import ValidationAgent
+from prompts.validation_prompts import parse_validation_response
+from state import ExtractionResult, PageExtractionResult
+
+
+BATCH_IDS = ["p1", "p2", "p3"]
+
+# 모든 축을 통과하는 문장 (종결 어미, 적당한 길이)
+GOOD_SENTENCE = "이 보고서는 회사의 분기 실적과 향후 전망을 정리한 자료입니다. "
+PAGE_WIDTH = 600.0
+
+
+def _verdict(batch_id: str, passed=True, confidence: float = 0.9) -> dict:
+    return {"id": batch_id, "pass": passed, "confidence": confidence, "reason": f"reason {batch_id}"}
+
+
+def _batch_response(*items) -> str:
+    return json.dumps({"results": list(items)}, ensure_ascii=False)
+
+
+class _FakeBatchClient:
+    """프롬프트의 항목 ID를 읽어 respond(ids)가 만든 응답을 반환"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.prompts = []
+
+    def call(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return {"content": self.respond(re.findall(r"항목 ID: (\w+)", prompt))}
+
+
+def _single_column_boxes(count: int) -> list:
+    """위에서 아래로 내려가는 1단 줄 bbox (페이지 중앙을 가로지름)"""
+    return [
+        {"text": f"줄{i}", "x0": 50.0, "x1": 550.0, "y0": 780.0 - 20 * i, "y1": 790.0 - 20 * i,
+         "top": 52.0 + 20 * i, "bottom": 62.0 + 20 * i}
+        for i in range(count)
+    ]
+
+
+def _two_column_boxes(rows: int) -> list:
+    """좌우 2단 bbox (중앙부가 비어 있음, 줄 단위로 좌→우 순서)"""
+    return [
+        {"text": f"{side}{i}", "x0": x0, "x1": x0 + 200.0, "y0": 780.0 - 20 * i, "y1": 790.0 - 20 * i,
+         "top": 52.0 + 20 * i, "bottom": 62.0 + 20 * i}
+        for i in range(rows)
+        for side, x0 in (("좌", 50.0), ("우", 350.0))
+    ]
+
+
+def _page(text: str, bbox: list, page_num: int = 1) -> PageExtractionResult:
+    return PageExtractionResult(
+        page_num=page_num,
+        strategy="pdfplumber",
+        text=text,
+        bbox=bbox,
+        metadata={"width": PAGE_WIDTH, "height": 842.0}
+    )
+
+
+def _good_text(min_chars: int) -> str:
+    text = ""
+    while len(text.strip()) < min_chars:
+        text += GOOD_SENTENCE
+    return text.strip()
+
+
+def _decide(agent: ValidationAgent, page: PageExtractionResult) -> dict:
+    return agent._pregate_decisions([page])[0]
+
+
+def test_all_ids_parsed():
+    """모든 ID가 있으면 항목별 판정 반환 (```json 블록 포함)"""
+    response = "```json\n" + _batch_response(
+        _verdict("p1"), _verdict("p2", passed=False, confidence=0.2), _verdict("p3")
+    ) + "\n```"
+
+    verdicts = parse_validation_response(response, batch_ids=BATCH_IDS)
+
+    assert sorted(verdicts) == BATCH_IDS
+    assert verdicts["p1"]["pass"] is True and verdicts["p1"]["reason"] == "reason p1"
+    assert verdicts["p2"]["pass"] is False and verdicts["p2"]["confidence"] == 0.2
+    assert verdicts["p3"]["issues"] == [] and verdicts["p3"]["suggestions"] == []
+
+
+def test_missing_ids_are_none():
+    """응답에 없는 ID는 None, 요청하지 않은 ID는 무시"""
+    verdicts = parse_validation_response(
+        _batch_response(_verdict("p1"), _verdict("p9")),
+        batch_ids=BATCH_IDS
+    )
+
+    assert sorted(verdicts) == BATCH_IDS
+    assert verdicts["p1"]["pass"] is True
+    assert verdicts["p2"] is None and verdicts["p3"] is None
+
+
+def test_duplicate_ids_are_none():
+    """같은 ID가 여러 번 나오면 어느 페이지 판정인지 알 수 없으므로 None"""
+    verdicts = parse_validation_response(
+        _batch_response(_verdict("p1"), _verdict("p1", passed=False), _verdict("p2"), _verdict("p2"), _verdict("p3")),
+        batch_ids=BATCH_IDS
+    )
+
+    assert verdicts["p1"] is None
+    assert verdicts["p2"] is None
+    assert verdicts["p3"]["pass"] is True
+
+
+def test_malformed_items_are_none():
+    """pass 누락/비 bool, confidence 형식 오류, dict가 아닌 항목은 None (다른 항목은 유지)"""
+    verdicts = parse_validation_response(
+        json.dumps([
+            "p1",
+            {"id": "p1", "confidence": 0.9},
+            {"id": "p2", "pass": "false", "confidence": 0.9},
+            {"id": " p3 ", "pass": True, "confidence": "high"},
+        ]),
+        batch_ids=BATCH_IDS
+    )
+    assert verdicts == {"p1": None, "p2": None, "p3": None}
+
+    verdicts = parse_validation_response(
+        _batch_response({"id": "p1", "pass": False, "confidence": "0.3"}, {"id": 2, "pass": True}),
+        batch_ids=BATCH_IDS
+    )
+    assert verdicts["p1"]["pass"] is False and verdicts["p1"]["confidence"] == 0.3
+    assert verdicts["p2"] is None
+
+
+def test_unparseable_response_all_none():
+    """JSON이 아니거나 results가 리스트가 아니면 전부 None"""
+    for response in ("not json at all", json.dumps({"results": {"p1": True}}), json.dumps("p1")):
+        verdicts = parse_validation_response(response, batch_ids=BATCH_IDS)
+        assert verdicts == {batch_id: None for batch_id in BATCH_IDS}, response
+
+
+def test_batched_validation_skips_unresolved_pages():
+    """묶음 검증: 누락/중복 ID 페이지는 결과에서 빠지고 짧은 페이지는 LLM 없이 Fail"""
+    original_batch_size = config.VALIDATION_BATCH_SIZE
+    config.VALIDATION_BATCH_SIZE = 5
+
+    try:
+        agent = ValidationAgent()
+        # p1 Pass, p2 누락, p3 중복, p4 Fail
+        agent.llm_client = _FakeBatchClient(lambda ids: _batch_response(
+            _verdict("p1"), _verdict("p3"), _verdict("p3", passed=False), _verdict("p4", passed=False, confidence=0.1)
+        ))
+
+        extraction = ExtractionResult(strategy="pdfplumber", pages_text_path="", doc_meta_path="")
+        pages = [
+            PageExtractionResult(page_num=page_num, strategy="pdfplumber", text=f"페이지 {page_num} 본문 텍스트입니다. " * 3)
+            for page_num in (1, 2, 3, 4)
+        ]
+        short_page = PageExtractionResult(page_num=5, strategy="pdfplumber", text="짧음")
+
+        validations = agent._validate_pages_batched(
+            [(extraction, page) for page in pages] + [(extraction, short_page)]
+        )
+    finally:
+        config.VALIDATION_BATCH_SIZE = original_batch_size
+
+    assert len(agent.llm_client.prompts) == 1
+    assert sorted(validations) == [("pdfplumber", 1), ("pdfplumber", 4), ("pdfplumber", 5)]
+    assert validations[("pdfplumber", 1)].passed is True
+    assert validations[("pdfplumber", 1)].metadata["validation_batch_size"] == 4
+    assert validations[("pdfplumber", 4)].passed is False
+    assert validations[("pdfplumber", 5)].metadata["fail_reason"] == "text_too_short"
+
+
+def test_pregate_pass():
+    """모든 축 통과 + 텍스트/bbox 충분 + 1단 → 로컬 Pass (confidence = VALIDATION_PREGATE_PASS_CONFIDENCE)"""
+    agent = ValidationAgent()
+    page = _page(_good_text(config.VALIDATION_PREGATE_MIN_CHARS), _single_column_boxes(10))
+
+    decision = _decide(agent, page)
+    assert decision["decision"] == "pass", decision
+    assert decision["failed_axes"] == []
+    assert all(score == 1.0 for score in decision["scores"].values())
+
+    extraction = ExtractionResult(strategy="pdfplumber", pages_text_path="", doc_meta_path="")
+    validation = agent._pregate_validation(page, extraction, decision, 0.0)
+    assert validation.passed is True
+    assert validation.scores["llm_confidence"] == config.VALIDATION_PREGATE_PASS_CONFIDENCE
+    assert validation.metadata["pregate"] is decision
+
+
+def test_pregate_fail_axes_threshold():
+    """실패 축 수가 VALIDATION_PREGATE_FAIL_AXES 이상이면 로컬 Fail, 미만이면 LLM 에스컬레이션"""
+    agent = ValidationAgent()
+
+    # 읽기 순서 역전 + 문장 단절 + 페이지 번호/숫자 줄 노이즈 (표 축만 통과)
+    broken_boxes = list(reversed(_single_column_boxes(10)))
+    broken_text = "\n".join(["12", "매출", "34", "영업", "56", "이익"] * 5)
+    decision = _decide(agent, _page(broken_text, broken_boxes))
+    assert sorted(decision["failed_axes"]) == ["noise", "read", "sent"], decision
+
+    original_fail_axes = config.VALIDATION_PREGATE_FAIL_AXES
+    try:
+        config.VALIDATION_PREGATE_FAIL_AXES = 3
+        assert _decide(agent, _page(broken_text, broken_boxes))["decision"] == "fail"
+
+        config.VALIDATION_PREGATE_FAIL_AXES = 4
+        assert _decide(agent, _page(broken_text, broken_boxes))["decision"] == "escalate"
+
+        # 축 1개 실패 (페이지 번호 줄) → 기본값에서는 에스컬레이션, 기준을 1로 낮추면 Fail
+        noisy = _page(_good_text(config.VALIDATION_PREGATE_MIN_CHARS) + "\n7", _single_column_boxes(10))
+        config.VALIDATION_PREGATE_FAIL_AXES = 3
+        decision = _decide(agent, noisy)
+        assert decision["decision"] == "escalate" and decision["failed_axes"] == ["noise"], decision
+
+        config.VALIDATION_PREGATE_FAIL_AXES = 1
+        assert _decide(agent, noisy)["decision"] == "fail"
+    finally:
+        config.VALIDATION_PREGATE_FAIL_AXES = original_fail_axes
+
+    extraction = ExtractionResult(strategy="pdfplumber", pages_text_path="", doc_meta_path="")
+    fail_decision = {"decision": "fail", "scores": {}, "failed_axes": ["read", "sent", "noise"], "reason": "x"}
+    validation = agent._pregate_validation(_page(broken_text, broken_boxes), extraction, fail_decision, 0.0)
+    assert validation.passed is False and validation.scores["llm_confidence"] == 0.0
+
+
+def test_pregate_min_chars_and_boxes():
+    """VALIDATION_PREGATE_MIN_CHARS / MIN_BOXES 경계 (미만이면 에스컬레이션)"""
+    agent = ValidationAgent()
+    min_chars, min_boxes = config.VALIDATION_PREGATE_MIN_CHARS, config.VALIDATION_PREGATE_MIN_BOXES
+    text = _good_text(min_chars)
+
+    original_min_chars = config.VALIDATION_PREGATE_MIN_CHARS
+    try:
+        config.VALIDATION_PREGATE_MIN_CHARS = len(text)
+        assert _decide(agent, _page(text, _single_column_boxes(10)))["decision"] == "pass"
+
+        config.VALIDATION_PREGATE_MIN_CHARS = len(text) + 1
+        decision = _decide(agent, _page(text, _single_column_boxes(10)))
+        assert decision["decision"] == "escalate" and "too short" in decision["reason"], decision
+    finally:
+        config.VALIDATION_PREGATE_MIN_CHARS = original_min_chars
+
+    assert _decide(agent, _page(text, _single_column_boxes(min_boxes)))["decision"] == "pass"
+    decision = _decide(agent, _page(text, _single_column_boxes(min_boxes - 1)))
+    assert decision["decision"] == "escalate" and "bboxes" in decision["reason"], decision
+
+
+def test_pregate_multi_column_escalates():
+    """축은 모두 통과해도 다단 레이아웃이면 에스컬레이션"""
+    agent = ValidationAgent()
+    decision = _decide(agent, _page(_good_text(config.VALIDATION_PREGATE_MIN_CHARS), _two_column_boxes(8)))
+
+    assert decision["failed_axes"] == []
+    assert decision["decision"] == "escalate" and decision["reason"] == "multi-column layout", decision
+
+
+def test_pregate_pages_split():
+    """_pregate_pages: 로컬 판정/에스컬레이션 분리, 20자 미만은 에스컬레이션, 비활성화 시 전부 LLM"""
+    agent = ValidationAgent()
+    extraction = ExtractionResult(strategy="pdfplumber", pages_text_path="", doc_meta_path="")
+    good = _page(_good_text(config.VALIDATION_PREGATE_MIN_CHARS), _single_column_boxes(10), page_num=1)
+    multi = _page(_good_text(config.VALIDATION_PREGATE_MIN_CHARS), _two_column_boxes(8), page_num=2)
+    tiny = _page("짧음", [], page_num=3)
+    items = [(extraction, good), (extraction, multi), (extraction, tiny)]
+
+    local, escalated, pregates = agent._pregate_pages(items)
+    assert sorted(local) == [("pdfplumber", 1)]
+    assert local[("pdfplumber", 1)].passed is True
+    assert [page.page_num for _, page in escalated] == [3, 2]
+    assert sorted(pregates) == [("pdfplumber", 1), ("pdfplumber", 2)]
+
+    original_enabled = config.VALIDATION_PREGATE_ENABLED
+    try:
+        config.VALIDATION_PREGATE_ENABLED = False
+        local, escalated, pregates = agent._pregate_pages(items)
+    finally:
+        config.VALIDATION_PREGATE_ENABLED = original_enabled
+
+    assert local == {} and pregates == {}
+    assert sorted(page.page_num for _, page in escalated) == [1, 2, 3]
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        test_all_ids_parsed,
+        test_missing_ids_are_none,
+        test_duplicate_ids_are_none,
+        test_malformed_items_are_none,
+        test_unparseable_response_all_none,
+        test_batched_validation_skips_unresolved_pages,
+        test_pregate_pass,
+        test_pregate_fail_axes_threshold,
+        test_pregate_min_chars_and_boxes,
+        test_pregate_multi_column_escalates,
+        test_pregate_pages_split,
+    ]
+
+    failed = 0
+    for index, test in enumerate(tests, 1):
+        print("\n" + "="*60)
+        print(f"[TEST {index}] {test.__doc__}")
+        print("="*60)
+        try:
+            test()
+            print("[OK] 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+
+    print(f"\n[RESULT] {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,29 +6,335 @@ pdf_split.py의 검증된 이중 페이지 감지 로직 사용
 
 from __future__ import annotations
 
+import hashlib
 import io
-from typing import Dict, List, Any, Tuple, Iterable
+import math
+import json
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Tuple, Iterable, Iterator, Optional
 from pathlib import Path
 
 import cv2
 import fitz  # PyMuPDF
 import numpy as np
 from PIL import Image
-from pypdf import PdfReader, PdfWriter
 
 import config
+from utils.batch_runner import get_process_pool
+from utils.extraction_cache import file_sha256
 
 
 LayoutMetrics = dict[str, float | int]
+PageMap = dict[int, list[int]]  # 원본 페이지 번호 → 분할 PDF 페이지 번호 리스트
+Segment = Tuple[int, str, Any]  # (원본 페이지 번호, "copy" | "vector" | "image" | "pdf", 페이지 인덱스/이미지/PDF 바이트)
+
+
+def _image_to_pdf_bytes(image: Image.Image) -> bytes:
+    """이미지 세그먼트를 1페이지 이미지 PDF 바이트로 변환"""
+    with io.BytesIO() as pdf_buffer:
+        image.convert("RGB").save(pdf_buffer, format="PDF")
+        return pdf_buffer.getvalue()
+
+
+def _split_page_range_worker(pdf_path: str, page_numbers: List[int], settings: Dict[str, Any]) -> List[Segment]:
+    """
+    워커 프로세스: 문서를 직접 열어 페이지 범위의 분할 세그먼트 계산
+    
+    이미지는 프로세스 간 전달하지 않고 PDF 바이트("pdf" 세그먼트)로 변환해서 반환
+    프로세스 풀로 전달되므로 모듈 최상위 함수로 정의
+    """
+    tool = CustomSplitTool()
+    tool.settings = dict(settings)
+    
+    segments: List[Segment] = []
+    with fitz.open(pdf_path) as pdf:
+        for page_num, kind, payload in tool._iter_segments(pdf, page_numbers):
+            if kind == "image":
+                segments.append((page_num, "pdf", _image_to_pdf_bytes(payload)))
+            else:
+                segments.append((page_num, kind, payload))
+    return segments
+
+
+class SplitPdfWriter:
+    """
+    분할 결과 PDF 작성기 (세그먼트를 하나씩 받아 바로 기록)
+    
+    - 이미지 세그먼트는 PDF 페이지로 변환 후 즉시 해제 가능 (작성기는 이미지를 보관하지 않음)
+    - finish(path) 지정 시 결과를 바이트로 만들지 않고 파일로 바로 저장 (spill-to-disk)
+    """
+    
+    def __init__(self, source: fitz.Document):
+        self.source = source
+        self.document = fitz.open()
+    
+    @property
+    def page_count(self) -> int:
+        return self.document.page_count
+    
+    def write(self, kind: str, payload: Any):
+        """세그먼트 1개 기록"""
+        if kind == "copy":
+            self.document.insert_pdf(self.source, from_page=payload, to_page=payload)
+        elif kind == "vector":
+            self._write_vector_halves(payload)
+        elif kind == "image":
+            self._write_pdf_bytes(_image_to_pdf_bytes(payload))
+        elif kind == "pdf":
+            self._write_pdf_bytes(payload)
+        else:
+            raise ValueError(f"알 수 없는 세그먼트 종류: {kind}")
+    
+    def _write_vector_halves(self, page_index: int):
+        """
+        원본 페이지를 좌/우 절반으로 잘라 추가 (벡터 유지)
+        
+        각 절반은 반대쪽 텍스트를 제거(redaction)한 뒤 남길 절반이 원점 (0, 0)에서 시작하도록 옮기고 MediaBox를 절반으로 줄임
+        - MediaBox만 줄이면 pdfminer 등은 잘린 영역의 텍스트까지 추출하므로 제거가 필요
+        - MediaBox만 옮기면 오른쪽 절반의 원점이 mid_x가 되어 도구마다 bbox 좌표계가 달라짐
+          (pdfplumber/pypdfium2는 mid_x부터, pdfminer는 0부터) → 내용 스트림 앞에 평행이동을 넣어 [0, width]로 통일
+        - Form XObject(show_pdf_page)로 옮기면 pdfminer가 텍스트 상자를 만들지 않으므로 페이지 내용을 직접 이동
+        - 이미지/선은 그대로 두고 MediaBox로만 가림
+        """
+        rect = self.source[page_index].rect
+        mid_x = rect.x0 + rect.width / 2
+        left = fitz.Rect(rect.x0, rect.y0, mid_x, rect.y1)
+        right = fitz.Rect(mid_x, rect.y0, rect.x1, rect.y1)
+        
+        for keep, drop in ((left, right), (right, left)):
+            self.document.insert_pdf(self.source, from_page=page_index, to_page=page_index)
+            half = self.document[self.document.page_count - 1]
+            half.add_redact_annot(drop)
+            half.apply_redactions(
+                images=fitz.PDF_REDACT_IMAGE_NONE,
+                graphics=fitz.PDF_REDACT_LINE_ART_NONE
+            )
+            if keep.x0 != 0:
+                self._prepend_content(half, f"1 0 0 1 {-keep.x0:g} 0 cm\n".encode("ascii"))
+            half.set_mediabox(fitz.Rect(0, keep.y0, keep.width, keep.y1))
+    
+    def _prepend_content(self, page: fitz.Page, stream: bytes):
+        """페이지 내용 스트림 맨 앞에 연산자 추가 (기존 스트림은 그대로 두고 /Contents 배열 앞에 삽입)"""
+        xref = self.document.get_new_xref()
+        self.document.update_object(xref, "<<>>")
+        self.document.update_stream(xref, stream)
+        
+        contents = " ".join(f"{content_xref} 0 R" for content_xref in page.get_contents())
+        self.document.xref_set_key(page.xref, "Contents", f"[{xref} 0 R {contents}]")
+    
+    def _write_pdf_bytes(self, pdf_bytes: bytes):
+        """1페이지 PDF 바이트(이미지 세그먼트)를 추가"""
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as segment_pdf:
+            self.document.insert_pdf(segment_pdf)
+    
+    def finish(self, path: Optional[Path] = None) -> Optional[bytes]:
+        """
+        작성 완료
+        
+        Args:
+            path: 저장 경로 (지정 시 파일로 저장하고 None 반환)
+            
+        Returns:
+            PDF 바이트 (path 미지정 시)
+        """
+        try:
+            if path is not None:
+                self.document.save(str(path), garbage=3, deflate=True)
+                return None
+            return self.document.tobytes(garbage=3, deflate=True)
+        finally:
+            self.document.close()
 
 
 class CustomSplitTool:
     """좌우 분할 도구 - 정교한 이중 페이지 감지"""
     
+    # 분할 결과 형식 버전 (판정/분할 방식이 바뀌면 올려서 디스크에 남은 이전 분할 결과를 무효화)
+    # 2: 벡터 분할 절반을 원점 (0, 0) 기준으로 이동
+    OUTPUT_VERSION = 2
+    
     def __init__(self):
         self.settings = {
             "dpi": config.CUSTOM_SPLIT_DPI,
+            "split_mode": config.CUSTOM_SPLIT_MODE,
         }
+        
+        # 문서별 분할 결과 메모 (문서 해시 → 분할 PDF 경로/페이지 매핑)
+        self._split_cache: Dict[str, Dict[str, Any]] = {}
+        self._split_locks: Dict[str, threading.Lock] = {}
+        self._split_cache_lock = threading.Lock()
+    
+    def split_document(self, pdf_path: str | Path, pages: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        문서를 렌더링/분할하고 결과 재사용
+        
+        같은 문서(내용 해시 + 설정 + 페이지)는 모든 전략/폴백에서 같은 분할 PDF를 사용
+        - 메모리: 도구 인스턴스 내 메모
+        - 디스크: config.CACHE_DIR / "custom_split" (재실행 시에도 재사용)
+          TTL 만료 / 용량 초과 시 오래 사용하지 않은 항목부터 삭제 (LRU)
+        
+        Args:
+            pdf_path: 원본 PDF 경로
+            pages: 분할할 원본 페이지 번호 (1부터, None이면 전체)
+            
+        Returns:
+            {
+                "split_pdf_path": Path,       # 분할된 PDF (요청한 페이지만 포함)
+                "split_pdf_sha256": str,      # 분할 PDF 내용 해시 (추출 캐시 키)
+                "page_map": {4: [1, 2], ...}  # 원본 페이지 → 분할 PDF 페이지
+            }
+        """
+        pdf_path = Path(pdf_path)
+        
+        if pages is not None:
+            pages = sorted(set(pages))
+        
+        settings_key = json.dumps(
+            {"settings": self.settings, "pages": pages, "version": self.OUTPUT_VERSION},
+            sort_keys=True
+        )
+        split_key = hashlib.sha256((file_sha256(pdf_path) + settings_key).encode("utf-8")).hexdigest()
+        
+        with self._split_cache_lock:
+            if split_key in self._split_cache:
+                return self._split_cache[split_key]
+            key_lock = self._split_locks.setdefault(split_key, threading.Lock())
+        
+        # 같은 문서를 동시에 요청해도 한 번만 분할
+        with key_lock:
+            with self._split_cache_lock:
+                if split_key in self._split_cache:
+                    return self._split_cache[split_key]
+            
+            record = self._load_split_record(split_key)
+            if record is None:
+                page_info = f"pages {pages}" if pages is not None else "all pages"
+                print(f"[CUSTOM_SPLIT] Rendering and splitting {pdf_path.name} ({page_info})...")
+                record = self._create_split_record(split_key, pdf_path, pages)
+            
+            with self._split_cache_lock:
+                self._split_cache[split_key] = record
+                in_use = set(self._split_cache)
+            
+            self._evict_split_records(in_use)
+            
+            return record
+    
+    def _split_record_paths(self, split_key: str) -> Tuple[Path, Path]:
+        """디스크 캐시 경로 (분할 PDF, 메타데이터)"""
+        cache_dir = config.CACHE_DIR / "custom_split"
+        return cache_dir / f"{split_key}.pdf", cache_dir / f"{split_key}.json"
+    
+    def _load_split_record(self, split_key: str) -> Dict[str, Any] | None:
+        """디스크에 저장된 분할 결과 로드 (없거나 만료/손상되면 None)"""
+        pdf_file, meta_file = self._split_record_paths(split_key)
+        if not pdf_file.exists() or not meta_file.exists():
+            return None
+        
+        try:
+            ttl = config.CUSTOM_SPLIT_CACHE_TTL_SECONDS
+            if ttl is not None and time.time() - meta_file.stat().st_mtime > ttl:
+                return None  # 만료 (다시 분할하면서 덮어씀)
+            
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            # PDF 수정 시각을 마지막 사용 시각으로 갱신 (LRU 삭제 순서)
+            os.utime(pdf_file)
+            return {
+                "split_pdf_path": pdf_file,
+                "split_pdf_sha256": meta["split_pdf_sha256"],
+                "page_map": {int(page): pages for page, pages in meta["page_map"].items()}
+            }
+        except Exception as e:
+            print(f"[WARN] Custom split cache entry unreadable, re-splitting: {e}")
+            return None
+    
+    def _create_split_record(self, split_key: str, pdf_path: Path, pages: Optional[List[int]]) -> Dict[str, Any]:
+        """
+        분할 후 결과를 디스크에 저장
+        
+        config.CUSTOM_SPLIT_SPILL_TO_DISK이면 분할 PDF를 메모리에 만들지 않고 파일로 바로 기록
+        """
+        pdf_file, meta_file = self._split_record_paths(split_key)
+        pdf_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # 메타데이터를 마지막에 써서, 메타데이터가 있으면 PDF도 완전함을 보장
+        tmp_pdf = pdf_file.with_suffix(".pdf.tmp")
+        if config.CUSTOM_SPLIT_SPILL_TO_DISK:
+            page_map = self._split_pdf_file(pdf_path, pages, tmp_pdf)
+            if not page_map:
+                shutil.copyfile(pdf_path, tmp_pdf)
+        else:
+            with open(pdf_path, 'rb') as f:
+                split_pdf_bytes, page_map = self._split_pdf_bytes(f.read(), pages)
+            with open(tmp_pdf, 'wb') as f:
+                f.write(split_pdf_bytes)
+        
+        split_pdf_sha256 = file_sha256(tmp_pdf)
+        tmp_pdf.replace(pdf_file)
+        
+        tmp_meta = meta_file.with_suffix(".json.tmp")
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump({
+                "split_pdf_sha256": split_pdf_sha256,
+                "page_map": page_map,
+                "settings": self.settings
+            }, f, ensure_ascii=False, indent=2)
+        tmp_meta.replace(meta_file)
+        
+        return {
+            "split_pdf_path": pdf_file,
+            "split_pdf_sha256": split_pdf_sha256,
+            "page_map": page_map
+        }
+    
+    def _evict_split_records(self, in_use: set[str]):
+        """
+        디스크 캐시 정리 (DiskCache와 같은 정책)
+        
+        메타데이터 수정 시각 = 생성 시각, 분할 PDF 수정 시각 = 마지막 사용 시각
+        - config.CUSTOM_SPLIT_CACHE_TTL_SECONDS를 넘긴 항목 삭제
+        - config.CUSTOM_SPLIT_CACHE_MAX_MB를 넘으면 오래 사용하지 않은 항목부터 삭제
+        
+        Args:
+            in_use: 이 인스턴스가 메모해 둔 분할 키 (경로를 반환했으므로 삭제하지 않음)
+        """
+        cache_dir = config.CACHE_DIR / "custom_split"
+        ttl = config.CUSTOM_SPLIT_CACHE_TTL_SECONDS
+        max_bytes = config.CUSTOM_SPLIT_CACHE_MAX_MB * 1024 * 1024 if config.CUSTOM_SPLIT_CACHE_MAX_MB is not None else None
+        now = time.time()
+        
+        entries = []
+        for meta_file in cache_dir.glob("*.json"):
+            pdf_file = meta_file.with_suffix(".pdf")
+            try:
+                meta_stat, pdf_stat = meta_file.stat(), pdf_file.stat()
+            except FileNotFoundError:
+                continue  # 다른 작업이 쓰는 중이거나 이미 삭제됨
+            entries.append((pdf_stat.st_mtime, meta_stat.st_mtime, meta_stat.st_size + pdf_stat.st_size, meta_file.stem))
+        
+        total = sum(size for _, _, size, _ in entries)
+        victims = []
+        for accessed_at, created_at, size, split_key in sorted(entries):
+            if split_key in in_use:
+                continue
+            expired = ttl is not None and now - created_at > ttl
+            if not expired and (max_bytes is None or total <= max_bytes):
+                continue
+            victims.append(split_key)
+            total -= size
+        
+        for split_key in victims:
+            pdf_file, meta_file = self._split_record_paths(split_key)
+            # 메타데이터를 먼저 지워 다른 작업이 반쪽 항목을 로드하지 않도록 함
+            meta_file.unlink(missing_ok=True)
+            pdf_file.unlink(missing_ok=True)
     
     def process(self, pages: List[Dict], pdf_path: str | Path) -> List[Dict]:
         """
@@ -61,48 +367,244 @@ class CustomSplitTool:
     
     def _process_pdf_bytes(self, source: bytes) -> bytes:
         """PDF 바이트 처리 및 이중 페이지 분할"""
-        pil_pages = self._render_pages(source, self.settings["dpi"])
-        if not pil_pages:
-            return source
-        
-        writer = PdfWriter()
-        buffers: list[io.BytesIO] = []
-        
-        for pil_page, layout in pil_pages:
-            for segment in self._split_page(pil_page, layout):
-                segment_rgb = segment.convert("RGB")
-                pdf_buffer = io.BytesIO()
-                segment_rgb.save(pdf_buffer, format="PDF")
-                pdf_buffer.seek(0)
-                buffers.append(pdf_buffer)
-                
-                reader = PdfReader(pdf_buffer)
-                writer.add_page(reader.pages[0])
+        split_pdf_bytes, _ = self._split_pdf_bytes(source)
+        return split_pdf_bytes
+    
+    def _split_pdf_bytes(self, source: bytes, pages: Optional[List[int]] = None) -> Tuple[bytes, PageMap]:
+        """
+        PDF 바이트 처리 및 이중 페이지 분할
         
-        output = io.BytesIO()
-        writer.write(output)
-        output.seek(0)
+        Args:
+            source: 원본 PDF 바이트
+            pages: 처리할 원본 페이지 번호 (1부터, None이면 전체, 범위 밖 페이지는 무시)
+        
+        Returns:
+            (분할된 PDF 바이트, 원본 페이지 → 분할 페이지 매핑)
+        """
+        try:
+            pdf = fitz.open(stream=source, filetype="pdf")
+        except Exception as exc:
+            raise ValueError(f"PDF 렌더링 실패: {exc}") from exc
         
-        for buffer in buffers:
-            buffer.close()
+        with pdf:
+            split_pdf_bytes, page_map = self._split_document(pdf, pages)
         
-        return output.read()
+        return (split_pdf_bytes if page_map else source), page_map
     
-    def _render_pages(self, source: bytes, dpi: int) -> list[Tuple[Image.Image, LayoutMetrics]]:
-        """PDF 페이지를 이미지로 렌더링하고 레이아웃 메트릭 계산"""
+    def _split_pdf_file(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]],
+        output_path: Path
+    ) -> PageMap:
+        """
+        PDF 파일 분할 결과를 파일로 바로 저장 (원본/결과 모두 메모리에 바이트로 올리지 않음)
+        
+        Returns:
+            원본 페이지 → 분할 페이지 매핑
+        """
         try:
-            with fitz.open(stream=source, filetype="pdf") as pdf:
-                zoom = max(dpi, 72) / 72
-                matrix = fitz.Matrix(zoom, zoom)
-                pages: list[Tuple[Image.Image, LayoutMetrics]] = []
-                for page in pdf:
-                    pixmap = page.get_pixmap(matrix=matrix, alpha=False)
-                    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
-                    layout = self._measure_page_layout(page)
-                    pages.append((image.copy(), layout))
-                return pages
+            pdf = fitz.open(str(pdf_path))
         except Exception as exc:
             raise ValueError(f"PDF 렌더링 실패: {exc}") from exc
+        
+        with pdf:
+            _, page_map = self._split_document(pdf, pages, output_path, pdf_path=pdf_path)
+        
+        return page_map
+    
+    def _split_document(
+        self,
+        pdf: fitz.Document,
+        pages: Optional[List[int]] = None,
+        output_path: Optional[Path] = None,
+        pdf_path: Optional[Path] = None
+    ) -> Tuple[Optional[bytes], PageMap]:
+        """
+        렌더링 → 판정 → 분할 → 기록을 페이지 단위로 진행 (페이지당 일정한 메모리)
+        
+        원본 경로가 있고 페이지가 config.CUSTOM_SPLIT_PARALLEL_MIN_PAGES 이상이면
+        페이지 범위를 워커 프로세스에 나눠 처리하고 순서대로 기록
+        
+        Args:
+            pdf: 원본 문서
+            pages: 처리할 원본 페이지 번호 (None이면 전체)
+            output_path: 지정 시 결과를 파일로 저장 (spill-to-disk), 아니면 바이트 반환
+            pdf_path: 원본 경로 (병렬 처리 시 워커가 직접 열기 위해 필요)
+            
+        Returns:
+            (분할된 PDF 바이트 또는 None, 원본 페이지 → 분할 페이지 매핑)
+        """
+        if pages is None:
+            page_numbers = list(range(1, pdf.page_count + 1))
+        else:
+            page_numbers = [p for p in sorted(set(pages)) if 1 <= p <= pdf.page_count]
+        
+        if not page_numbers:
+            return None, {}
+        
+        writer = SplitPdfWriter(pdf)
+        page_map: PageMap = {}
+        
+        # 코어 수보다 많은 워커는 경합과 프로세스 시작 비용만 늘림
+        workers = min(config.CUSTOM_SPLIT_WORKERS, os.cpu_count() or 1)
+        if pdf_path is not None and workers > 1 and len(page_numbers) >= config.CUSTOM_SPLIT_PARALLEL_MIN_PAGES:
+            segments = self._iter_segments_parallel(pdf_path, page_numbers, workers)
+        else:
+            segments = self._iter_segments(pdf, page_numbers)
+        
+        try:
+            for page_num, kind, payload in segments:
+                pages_before = writer.page_count
+                writer.write(kind, payload)
+                page_map.setdefault(page_num, []).extend(range(pages_before + 1, writer.page_count + 1))
+        except BaseException:
+            writer.document.close()
+            raise
+        
+        return writer.finish(output_path), page_map
+    
+    def _iter_segments(self, pdf: fitz.Document, page_numbers: List[int]) -> Iterator[Segment]:
+        """
+        분할 세그먼트 제너레이터 (한 번에 한 페이지만 처리)
+        
+        - "copy": 분할하지 않는 페이지 (원본 벡터 페이지 복사)
+        - "vector": 벡터 분할 대상 페이지 (작성기가 좌/우 절반으로 크롭)
+        - "image": 래스터 분할 세그먼트 (좌 → 우 순서, 전체 해상도 이미지는 다음 페이지 전에 해제)
+        
+        - 이중 페이지 판정: 벡터 레이아웃 메트릭 → (불확실할 때만) 저해상도 썸네일
+        - 분할 방식 (settings["split_mode"]):
+          - "vector": 원본 페이지를 좌/우 절반으로 잘라 복사 (텍스트 레이어 유지, 무손실)
+          - "raster": config.CUSTOM_SPLIT_DPI로 렌더링 후 이미지 절단 (텍스트 레이어 없음)
+        """
+        for page_num in page_numbers:
+            page = pdf[page_num - 1]
+            layout = self._measure_page_layout(page)
+            
+            if not self._detect_double_page(page, layout):
+                yield page_num, "copy", page_num - 1
+            elif self.settings["split_mode"] == "vector" and self._can_vector_split(page):
+                yield page_num, "vector", page_num - 1
+            else:
+                image = self._render_page(page, self.settings["dpi"])
+                try:
+                    for segment in self._split_image(image):
+                        yield page_num, "image", segment
+                        segment.close()
+                finally:
+                    image.close()
+    
+    def _iter_segments_parallel(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        workers: int
+    ) -> Iterator[Segment]:
+        """
+        병렬 분할 세그먼트 제너레이터 (_iter_segments와 같은 순서로 반환)
+        
+        - 페이지 범위 단위로 공유 프로세스 풀에 분배 (워커가 문서를 직접 열고, 이미지는 PDF 바이트로 반환)
+        - 동시에 처리 중인 범위는 workers * 2개로 제한 (완료 순서와 무관하게 원래 순서대로 기록)
+        - 공유 풀이 교체되어 중단된 범위는 새 풀에 한 번 다시 제출
+        """
+        chunk_size = max(1, math.ceil(len(page_numbers) / (workers * 4)))
+        chunks = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+        
+        print(f"[CUSTOM_SPLIT] Parallel split: {len(page_numbers)} pages, {len(chunks)} ranges, {workers} workers")
+        
+        def submit(chunk: List[int]) -> Future:
+            return get_process_pool().submit(_split_page_range_worker, str(pdf_path), chunk, self.settings)
+        
+        pending = deque()
+        next_chunk = 0
+        
+        try:
+            while next_chunk < len(chunks) or pending:
+                while next_chunk < len(chunks) and len(pending) < workers * 2:
+                    pending.append((chunks[next_chunk], submit(chunks[next_chunk])))
+                    next_chunk += 1
+                
+                chunk, future = pending.popleft()
+                try:
+                    segments = future.result()
+                except (BrokenProcessPool, CancelledError):
+                    segments = submit(chunk).result()
+                
+                for segment in segments:
+                    yield segment
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def _can_vector_split(self, page: fitz.Page) -> bool:
+        """벡터 분할 가능 여부 (회전/크롭 없는 일반 페이지만, 그 외에는 래스터 분할)"""
+        return page.rotation == 0 and page.rect == page.mediabox
+    
+    def _render_page(self, page: fitz.Page, dpi: int) -> Image.Image:
+        """페이지 1개를 지정 DPI로 렌더링"""
+        try:
+            zoom = max(dpi, 1) / 72
+            pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+        except Exception as exc:
+            raise ValueError(f"PDF 렌더링 실패: {exc}") from exc
+    
+    def _detect_double_page(self, page: fitz.Page, layout: LayoutMetrics) -> bool:
+        """
+        이중 페이지 판정 (단계별)
+        
+        1. 벡터 텍스트 블록 메트릭으로 확실히 판단되면 그대로 사용 (렌더링 없음)
+        2. 불확실하면 저해상도 썸네일(config.CUSTOM_SPLIT_DETECT_DPI)로 이미지 휴리스틱 적용
+        """
+        verdict = self._classify_layout(layout)
+        if verdict is not None:
+            return verdict
+        
+        thumbnail = self._render_page(page, config.CUSTOM_SPLIT_DETECT_DPI)
+        return self._is_double_page(thumbnail, layout)
+    
+    def _classify_layout(self, layout: LayoutMetrics) -> Optional[bool]:
+        """
+        벡터 레이아웃 메트릭 기반 판정
+        
+        Returns:
+            True (이중 페이지), False (단일 페이지), None (판단 불가 → 이미지 휴리스틱)
+        """
+        # 이미지 휴리스틱도 가로세로비 1.2 미만은 항상 단일 페이지로 판정
+        if layout.get("aspect_ratio", 0.0) < 1.2:
+            return False
+        
+        left_blocks = layout["left_blocks"]
+        right_blocks = layout["right_blocks"]
+        bridge_blocks = layout["bridge_blocks"]
+        
+        # 텍스트 레이어가 없으면 (스캔본 등) 판단 불가
+        if left_blocks + right_blocks + bridge_blocks == 0:
+            return None
+        
+        side_area = layout["left_area"] + layout["right_area"]
+        if side_area <= 0:
+            return None
+        
+        # 중앙을 가로지르는 넓은 블록 (제목 제외 본문 수준)
+        # - 중앙선을 가로지르는 단어가 있으면 실제 단일 단 본문 → 단일 페이지
+        # - 없으면 좌/우 같은 줄이 한 블록으로 합쳐진 것일 수 있음 (내용 스트림이 두 면을 번갈아 쓰는 스프레드)
+        #   → 블록만으로는 판단 불가, 이미지 휴리스틱으로 넘김
+        if layout["bridge_area"] > side_area * 0.15 or layout["max_block_width_ratio"] > 0.6:
+            if layout["center_words"] >= 3:
+                return False
+            return None
+        
+        # 좌/우 양쪽에 블록이 충분하고 중앙 대역이 비어 있음 → 이중 페이지
+        if (
+            left_blocks >= 2
+            and right_blocks >= 2
+            and bridge_blocks == 0
+            and layout["center_area"] <= side_area * 0.1
+        ):
+            return True
+        
+        return None
     
     def _measure_page_layout(self, page: fitz.Page) -> LayoutMetrics:
         """페이지 레이아웃 메트릭 측정"""
@@ -117,6 +619,7 @@ class CustomSplitTool:
         
         metrics: LayoutMetrics = {
             "page_area": page_area,
+            "aspect_ratio": width / height if height > 0 else 0.0,
             "left_area": 0.0,
             "right_area": 0.0,
             "center_area": 0.0,
@@ -125,6 +628,7 @@ class CustomSplitTool:
             "bridge_blocks": 0,
             "bridge_area": 0.0,
             "max_block_width_ratio": 0.0,
+            "center_words": 0,
         }
         
         if page_area == 0.0:
@@ -173,6 +677,12 @@ class CustomSplitTool:
                 if overlap_ratio > 0:
                     metrics["bridge_area"] += area * overlap_ratio
         
+        # 중앙선을 실제로 가로지르는 단어 수 (넓은 블록이 있을 때만 측정)
+        if metrics["bridge_blocks"] > 0:
+            metrics["center_words"] = sum(
+                1 for word in page.get_text("words") if word[0] < mid_x < word[2]
+            )
+        
         return metrics
     
     def _is_double_page(self, pil_img: Image.Image, layout: LayoutMetrics | None = None) -> bool:
@@ -270,12 +780,16 @@ class CustomSplitTool:
     def _split_page(self, pil_img: Image.Image, layout: LayoutMetrics | None = None) -> Iterable[Image.Image]:
         """페이지 분할 (이중 페이지 감지 시)"""
         if self._is_double_page(pil_img, layout):
-            width, height = pil_img.size
-            left = pil_img.crop((0, 0, width // 2, height))
-            right = pil_img.crop((width // 2, 0, width, height))
-            return (left, right)
+            return self._split_image(pil_img)
         return (pil_img,)
     
+    def _split_image(self, pil_img: Image.Image) -> Tuple[Image.Image, Image.Image]:
+        """이미지를 좌/우 절반으로 절단"""
+        width, height = pil_img.size
+        left = pil_img.crop((0, 0, width // 2, height))
+        right = pil_img.crop((width // 2, 0, width, height))
+        return (left, right)
+    
     def _parse_split_pdf(self, pdf_bytes: bytes, original_page_count: int) -> List[Dict]:
         """분할된 PDF를 파싱해서 페이지 데이터 생성"""
         split_pages = []
@@ -6,6 +6,8 @@ Layout Parser 도구
 from typing import Dict, List, Any
 import numpy as np
 
+from state import BBoxTable
+
 
 class LayoutParserTool:
     """레이아웃 기반 재정렬 도구"""
@@ -43,67 +45,49 @@ class LayoutParserTool:
     def _reorder_page(self, page: Dict) -> Dict:
         """페이지 내 텍스트 블록 재정렬"""
         
-        bbox_list = page["bbox"]
+        bbox_table = BBoxTable.coerce(page["bbox"])
         
-        if not bbox_list:
+        if not len(bbox_table):
             return page
         
-        # 다단 감지
-        columns = self._detect_columns(bbox_list, page.get("width", 800))
+        # 다단 감지 (박스별 컬럼 번호)
+        column_ids = self._detect_columns(bbox_table, page.get("width", 800))
         
-        # 각 컬럼별로 정렬
-        sorted_bbox = []
-        for col_bbox_list in columns:
-            # Y 좌표 기준으로 정렬 (위에서 아래로)
-            col_sorted = sorted(col_bbox_list, key=lambda b: b["y0"])
-            sorted_bbox.extend(col_sorted)
+        # 컬럼 순서 → 컬럼 내 Y 좌표 순서로 정렬 (위에서 아래로, 같은 값은 원래 순서 유지)
+        order = np.lexsort((bbox_table.column("top"), column_ids))
+        sorted_bbox = bbox_table.take(order)
         
         # 재정렬된 텍스트 재구성
-        reordered_text = " ".join([b["text"] for b in sorted_bbox])
+        reordered_text = " ".join(sorted_bbox.texts())
         
         new_page = page.copy()
         new_page["text"] = reordered_text
         new_page["bbox"] = sorted_bbox
         new_page["source"] = page["source"] + "+layout"
         new_page["layout_info"] = {
-            "columns_detected": len(columns),
+            "columns_detected": int(column_ids.max()) + 1,
             "reordered": True
         }
         
         return new_page
     
-    def _detect_columns(self, bbox_list: List[Dict], page_width: float) -> List[List[Dict]]:
-        """다단 레이아웃 감지"""
+    def _detect_columns(self, bbox_table: BBoxTable, page_width: float) -> np.ndarray:
+        """다단 레이아웃 감지 (박스별 컬럼 번호 배열, 0=왼쪽 1=오른쪽)"""
         
         # X 좌표 중심점 추출
-        x_centers = [(bbox["x0"] + bbox["x1"]) / 2 for bbox in bbox_list]
-        
-        if not x_centers:
-            return [bbox_list]
+        x_centers = (bbox_table.column("x0") + bbox_table.column("x1")) / 2
         
         # 간단한 K-means 스타일 클러스터링
         # 일단 2단 가정
         threshold = page_width / 2
         
-        left_column = []
-        right_column = []
-        
-        for bbox in bbox_list:
-            x_center = (bbox["x0"] + bbox["x1"]) / 2
-            
-            if x_center < threshold:
-                left_column.append(bbox)
-            else:
-                right_column.append(bbox)
+        column_ids = (x_centers >= threshold).astype(np.int64)
         
-        # 왼쪽 컬럼 먼저, 오른쪽 컬럼 나중
-        columns = []
-        if left_column:
-            columns.append(left_column)
-        if right_column:
-            columns.append(right_column)
+        # 한쪽 컬럼만 있으면 단일 컬럼
+        if column_ids.min() == column_ids.max():
+            return np.zeros(len(bbox_table), dtype=np.int64)
         
-        return columns if len(columns) > 1 else [bbox_list]
+        return column_ids
 
 
 if __name__ == "__main__":
@@ -5,13 +5,19 @@ PDFMiner.six 도구
 
 from pdfminer.high_level import extract_pages, extract_text
 from pdfminer.layout import LTTextContainer, LTChar, LTTextBox, LTTextLine
-from typing import Dict, List, Any, Union
+from pdfminer.pdfpage import PDFPage
+import pdfminer
+from typing import Dict, Iterator, List, Any, Union, Optional
 from pathlib import Path
 
 
 class PDFMinerTool:
     """PDFMiner.six를 이용한 텍스트 추출"""
     
+    # 페이지 출력 형식 버전 (bbox 좌표계 등 래퍼 출력이 바뀌면 올려서 추출 캐시 무효화)
+    # 2: bbox top/bottom을 페이지 위쪽 기준 좌표로 변경
+    OUTPUT_VERSION = 2
+    
     def __init__(self):
         self.settings = {
             "line_margin": 0.5,
@@ -19,12 +25,33 @@ class PDFMinerTool:
             "char_margin": 2.0
         }
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def get_version(self) -> str:
+        """pdfminer.six 버전 반환"""
+        return pdfminer.__version__
+    
+    def get_page_count(self, pdf_path: Union[str, Path]) -> int:
+        """
+        전체 페이지 수 확인 (레이아웃 분석 없이 페이지 트리만 조회)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            페이지 수
+        """
+        if not isinstance(pdf_path, Path):
+            pdf_path = Path(pdf_path)
+        
+        with open(pdf_path, 'rb') as f:
+            return sum(1 for _ in PDFPage.get_pages(f))
+    
+    def extract(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트 추출
         
         Args:
             pdf_path: PDF 파일 경로
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
             
         Returns:
             {
@@ -33,51 +60,8 @@ class PDFMinerTool:
             }
         """
         
-        # Path 객체로 변환
-        if not isinstance(pdf_path, Path):
-            pdf_path = Path(pdf_path)
-        
-        pages_data = []
-        
         try:
-            # 페이지별 추출
-            for page_num, page_layout in enumerate(extract_pages(str(pdf_path)), 1):
-                # 텍스트 추출
-                text_elements = []
-                bbox_elements = []
-                
-                for element in page_layout:
-                    if isinstance(element, LTTextContainer):
-                        text_elements.append(element.get_text())
-                        
-                        # bbox 정보 추출
-                        try:
-                            bbox_elements.append({
-                                "text": element.get_text().strip(),
-                                "x0": float(element.x0),
-                                "y0": float(element.y0),
-                                "x1": float(element.x1),
-                                "y1": float(element.y1),
-                                "top": float(element.y0),
-                                "bottom": float(element.y1)
-                            })
-                        except:
-                            pass
-                
-                page_text = "".join(text_elements)
-                
-                page_data = {
-                    "page": page_num,
-                    "source": "pdfminer",
-                    "text": page_text,
-                    "bbox": bbox_elements,
-                    "tables": [],  # PDFMiner는 기본적으로 표 감지 안 함
-                    "width": float(page_layout.width),
-                    "height": float(page_layout.height)
-                }
-                
-                pages_data.append(page_data)
-        
+            pages_data = list(self.iter_pages(pdf_path, pages))
         except Exception as e:
             print(f"[ERROR] PDFMiner extraction failed: {e}")
             return {"pages": [], "settings": self.settings}
@@ -87,6 +71,74 @@ class PDFMinerTool:
             "settings": self.settings
         }
     
+    def iter_pages(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        페이지를 분석하는 대로 하나씩 반환 (문서 전체를 메모리에 모으지 않음)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
+            
+        Yields:
+            extract()의 "pages" 항목과 같은 형식의 페이지 데이터 (페이지 순서)
+        """
+        
+        # Path 객체로 변환
+        if not isinstance(pdf_path, Path):
+            pdf_path = Path(pdf_path)
+        
+        # extract_pages는 0부터 시작하는 인덱스를 받고, 지정된 페이지만 문서 순서대로 반환
+        if pages is not None:
+            target_pages = sorted(p for p in set(pages) if p >= 1)
+            page_numbers = [p - 1 for p in target_pages]
+        else:
+            target_pages = None
+            page_numbers = None
+        
+        # 페이지별 추출
+        for idx, page_layout in enumerate(extract_pages(str(pdf_path), page_numbers=page_numbers)):
+            if target_pages is not None:
+                if idx >= len(target_pages):
+                    break
+                page_num = target_pages[idx]
+            else:
+                page_num = idx + 1
+            
+            # 텍스트 추출
+            text_elements = []
+            bbox_elements = []
+            
+            for element in page_layout:
+                if isinstance(element, LTTextContainer):
+                    text_elements.append(element.get_text())
+                    
+                    # bbox 정보 추출
+                    try:
+                        bbox_elements.append({
+                            "text": element.get_text().strip(),
+                            "x0": float(element.x0),
+                            "y0": float(element.y0),
+                            "x1": float(element.x1),
+                            "y1": float(element.y1),
+                            # top/bottom: 페이지 위쪽 기준 좌표 (y0/y1은 PDF 아래쪽 기준)
+                            "top": float(page_layout.height - element.y1),
+                            "bottom": float(page_layout.height - element.y0)
+                        })
+                    except:
+                        pass
+            
+            page_text = "".join(text_elements)
+            
+            yield {
+                "page": page_num,
+                "source": "pdfminer",
+                "text": page_text,
+                "bbox": bbox_elements,
+                "tables": [],  # PDFMiner는 기본적으로 표 감지 안 함
+                "width": float(page_layout.width),
+                "height": float(page_layout.height)
+            }
+    
     def process(self, pages: List[Dict], pdf_path: Union[str, Path]) -> List[Dict]:
         """
         폴백 도구 인터페이스 (2단계 호환)
@@ -4,7 +4,8 @@ pdfplumber 도구
 """
 
 import pdfplumber
-from typing import Dict, List, Any, Union
+from pdfplumber.utils.text import WordExtractor
+from typing import Dict, Iterator, List, Any, Union, Optional
 from pathlib import Path
 import config
 
@@ -12,18 +13,39 @@ import config
 class PDFPlumberTool:
     """pdfplumber를 이용한 텍스트 추출"""
     
+    # 페이지 출력 형식 버전 (bbox 좌표계 등 래퍼 출력이 바뀌면 올려서 추출 캐시 무효화)
+    OUTPUT_VERSION = 1
+    
     def __init__(self):
         self.settings = {
             "layout_width_tolerance": config.PDF_PLUMBER_LAYOUT_WIDTH_TOLERANCE,
             "layout_height_tolerance": config.PDF_PLUMBER_LAYOUT_HEIGHT_TOLERANCE
         }
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def get_page_count(self, pdf_path: Union[str, Path]) -> int:
+        """
+        전체 페이지 수 확인 (텍스트 파싱 없이 페이지 트리만 조회)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            페이지 수
+        """
+        if not isinstance(pdf_path, Path):
+            pdf_path = Path(pdf_path)
+        
+        with open(pdf_path, 'rb') as f:
+            with pdfplumber.open(f) as pdf:
+                return len(pdf.pages)
+    
+    def extract(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트 추출
         
         Args:
             pdf_path: PDF 파일 경로 (str 또는 Path 객체)
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
             
         Returns:
             {
@@ -32,59 +54,90 @@ class PDFPlumberTool:
             }
         """
         
+        return {
+            "pages": list(self.iter_pages(pdf_path, pages)),
+            "settings": self.settings
+        }
+    
+    def iter_pages(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        페이지를 파싱하는 대로 하나씩 반환 (문서 전체를 메모리에 모으지 않음)
+        
+        Args:
+            pdf_path: PDF 파일 경로 (str 또는 Path 객체)
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
+            
+        Yields:
+            extract()의 "pages" 항목과 같은 형식의 페이지 데이터 (페이지 순서)
+        """
+        
         # Path 객체로 변환 (한글 경로 처리)
         if not isinstance(pdf_path, Path):
             pdf_path = Path(pdf_path)
         
-        pages_data = []
-        
         # Windows에서 한글 경로 처리를 위해 파일을 바이너리로 읽어서 전달
         with open(pdf_path, 'rb') as f:
-            with pdfplumber.open(f) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # 텍스트 추출
-                    text = page.extract_text() or ""
-                    
-                    # 단어별 bbox 정보 (안전하게 처리)
-                    words = page.extract_words() or []
-                    
-                    # 테이블 감지
-                    tables = page.extract_tables() or []
-                    
-                    page_data = {
-                        "page": page_num,
-                        "source": "plumber",
-                        "text": text,
-                        "bbox": [
-                            {
-                                "text": word.get("text", ""),
-                                "x0": word.get("x0", 0),
-                                "y0": word.get("y0", 0),
-                                "x1": word.get("x1", 0),
-                                "y1": word.get("y1", 0),
-                                "top": word.get("top", 0),
-                                "bottom": word.get("bottom", 0)
-                            }
-                            for word in words
-                            if word and isinstance(word, dict)
-                        ],
-                        "tables": [
-                            {
-                                "rows": len(table),
-                                "cols": len(table[0]) if table else 0,
-                                "data": table
-                            }
-                            for table in tables
-                        ] if tables else [],
-                        "width": page.width,
-                        "height": page.height
-                    }
-                    
-                    pages_data.append(page_data)
+            # pages 지정 시 해당 페이지만 파싱 (나머지 페이지는 건너뜀)
+            with pdfplumber.open(f, pages=sorted(set(pages)) if pages is not None else None) as pdf:
+                for page in pdf.pages:
+                    try:
+                        yield self._extract_page(page)
+                    finally:
+                        # 페이지 객체 캐시 해제 (긴 문서에서도 메모리 일정하게 유지)
+                        page.close()
+    
+    def _extract_page(self, page: Any) -> Dict[str, Any]:
+        """
+        단일 페이지 추출 (문자 → 단어 클러스터링 1회)
+        
+        extract_text()/extract_words()는 각각 page.chars를 다시 단어로 묶으므로,
+        WordMap을 한 번 만들어 단어 목록과 텍스트(TextMap)를 함께 얻음
+        (기본 설정의 extract_text()/extract_words() 결과와 동일)
+        """
+        chars = page.chars
+        
+        # 단어 클러스터링 (텍스트/bbox 공용)
+        wordmap = WordExtractor().extract_wordmap(chars)
+        words = [word for word, _ in wordmap.tuples]
+        
+        # 텍스트 (page.extract_text()와 동일한 TextMap 설정)
+        text = wordmap.to_textmap(
+            layout_bbox=page.bbox,
+            layout_width=page.width,
+            layout_height=page.height,
+            presorted=True
+        ).as_string if chars else ""
+        
+        # 테이블 감지 (기본 lines 전략은 선분이 없으면 표 후보가 없으므로 생략)
+        tables = [table.extract() for table in page.find_tables()] if page.edges else []
         
         return {
-            "pages": pages_data,
-            "settings": self.settings
+            "page": page.page_number,
+            "source": "plumber",
+            "text": text,
+            "bbox": [
+                {
+                    "text": word.get("text", ""),
+                    "x0": word.get("x0", 0),
+                    "y0": word.get("y0", 0),
+                    "x1": word.get("x1", 0),
+                    "y1": word.get("y1", 0),
+                    "top": word.get("top", 0),
+                    "bottom": word.get("bottom", 0)
+                }
+                for word in words
+                if word and isinstance(word, dict)
+            ],
+            "tables": [
+                {
+                    "rows": len(table),
+                    "cols": len(table[0]) if table else 0,
+                    "data": table
+                }
+                for table in tables
+            ] if tables else [],
+            "width": page.width,
+            "height": page.height
         }
     
     def get_version(self) -> str:
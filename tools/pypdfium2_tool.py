@@ -5,32 +5,72 @@ Chromium 기반 고속 PDF 렌더링 + 텍스트 추출
 
 try:
     import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
     PYPDFIUM2_AVAILABLE = True
 except ImportError:
     PYPDFIUM2_AVAILABLE = False
     print("[WARNING] pypdfium2 not installed. Install with: pip install pypdfium2")
 
-from typing import Dict, List, Any, Union
+from typing import Dict, Iterator, List, Any, Tuple, Union, Optional
 from pathlib import Path
 
+import numpy as np
+
+
+# 단어 경계로 취급하는 문자 (공백류, pdfium이 생성한 줄바꿈 포함)
+_SEPARATOR_CODES = np.array([0, 9, 10, 13, 32, 0xA0, 0x3000, 0xFFFE], dtype=np.int64)
+
 
 class PyPDFium2Tool:
     """PyPDFium2를 이용한 텍스트 추출"""
     
+    # 페이지 출력 형식 버전 (bbox 좌표계 등 래퍼 출력이 바뀌면 올려서 추출 캐시 무효화)
+    OUTPUT_VERSION = 2
+    
     def __init__(self):
         self.settings = {
-            "text_mode": "layout"  # layout or raw
+            "text_mode": "layout",  # layout or raw
+            "bbox_level": "word"  # 문자 bbox를 단어 단위로 묶음 (추출 캐시 키에 포함)
         }
         
         if not PYPDFIUM2_AVAILABLE:
             print("[WARNING] PyPDFium2Tool initialized but library not available")
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def get_version(self) -> str:
+        """pypdfium2 버전 반환"""
+        if not PYPDFIUM2_AVAILABLE:
+            return "unavailable"
+        
+        # v5: pdfium.version.PYPDFIUM_INFO / v4: pdfium.V_PYPDFIUM2
+        version_info = getattr(getattr(pdfium, "version", None), "PYPDFIUM_INFO", None)
+        return str(version_info or getattr(pdfium, "V_PYPDFIUM2", "unknown"))
+    
+    def get_page_count(self, pdf_path: Union[str, Path]) -> int:
+        """
+        전체 페이지 수 확인 (페이지 로드 없이 문서 정보만 조회)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            페이지 수
+        """
+        if not PYPDFIUM2_AVAILABLE:
+            raise ImportError("pypdfium2 not installed")
+        
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    
+    def extract(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트 추출
         
         Args:
             pdf_path: PDF 파일 경로
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
             
         Returns:
             {
@@ -42,43 +82,65 @@ class PyPDFium2Tool:
         if not PYPDFIUM2_AVAILABLE:
             return {"pages": [], "settings": self.settings}
         
+        try:
+            pages_data = list(self.iter_pages(pdf_path, pages))
+        except Exception as e:
+            print(f"[ERROR] PyPDFium2 extraction failed: {e}")
+            return {"pages": [], "settings": self.settings}
+        
+        return {
+            "pages": pages_data,
+            "settings": self.settings
+        }
+    
+    def iter_pages(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        페이지를 추출하는 대로 하나씩 반환 (문서 전체를 메모리에 모으지 않음)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
+            
+        Yields:
+            extract()의 "pages" 항목과 같은 형식의 페이지 데이터 (페이지 순서)
+        """
+        
+        if not PYPDFIUM2_AVAILABLE:
+            return
+        
         # Path 객체로 변환
         if not isinstance(pdf_path, Path):
             pdf_path = Path(pdf_path)
         
-        pages_data = []
+        # PDF 열기
+        pdf = pdfium.PdfDocument(str(pdf_path))
         
         try:
-            # PDF 열기
-            pdf = pdfium.PdfDocument(str(pdf_path))
+            # pages 지정 시 해당 페이지만 로드 (0부터 시작하는 인덱스로 변환)
+            if pages is not None:
+                page_indices = [p - 1 for p in sorted(set(pages)) if 1 <= p <= len(pdf)]
+            else:
+                page_indices = range(len(pdf))
             
-            for page_num in range(len(pdf)):
+            for page_num in page_indices:
                 page = pdf[page_num]
-                
-                # 텍스트 추출
                 textpage = page.get_textpage()
-                text = textpage.get_text_range()
-                
-                # 페이지 크기
-                width, height = page.get_size()
                 
-                # bbox 정보 (간단히 처리)
-                bbox_elements = []
+                try:
+                    # 텍스트 추출
+                    text = textpage.get_text_range()
+                    
+                    # 페이지 크기
+                    width, height = page.get_size()
+                    
+                    # 단어 단위 bbox (문자 bbox를 줄/단어로 묶음)
+                    bbox_elements = self._extract_word_boxes(textpage, height)
+                finally:
+                    # 리소스 해제
+                    textpage.close()
+                    page.close()
                 
-                # PyPDFium2는 텍스트를 문자 단위로 추출 가능
-                # 여기서는 간단히 전체 텍스트만 사용
-                if text.strip():
-                    bbox_elements.append({
-                        "text": text.strip(),
-                        "x0": 0,
-                        "y0": 0,
-                        "x1": width,
-                        "y1": height,
-                        "top": 0,
-                        "bottom": height
-                    })
-                
-                page_data = {
+                yield {
                     "page": page_num + 1,
                     "source": "pypdfium2",
                     "text": text,
@@ -87,23 +149,118 @@ class PyPDFium2Tool:
                     "width": float(width),
                     "height": float(height)
                 }
-                
-                pages_data.append(page_data)
-                
-                # 리소스 해제
-                textpage.close()
-                page.close()
-            
+        finally:
             pdf.close()
+    
+    def _extract_word_boxes(self, textpage: Any, page_height: float) -> List[Dict[str, Any]]:
+        """
+        문자 bbox → 단어 bbox
         
-        except Exception as e:
-            print(f"[ERROR] PyPDFium2 extraction failed: {e}")
-            return {"pages": [], "settings": self.settings}
+        - 문자 bbox는 loose 박스 사용 (tight 박스는 일부 CJK 글꼴에서 높이가 0에 가까워
+          count_rects/get_rect 사각형도 함께 무너짐)
+        - 단어 경계: 공백/줄바꿈 문자 또는 줄 변경
+        - BMP 밖 문자는 서로게이트 쌍을 합쳐 한 문자로 처리
+        - 묶음/좌표 계산은 numpy로 일괄 처리
         
-        return {
-            "pages": pages_data,
-            "settings": self.settings
-        }
+        Args:
+            textpage: PdfTextPage
+            page_height: 페이지 높이 (top/bottom 변환용)
+            
+        Returns:
+            [{"text", "x0", "y0", "x1", "y1", "top", "bottom"}, ...]
+            (y0/y1은 PDF 아래쪽 기준, top/bottom은 페이지 위쪽 기준)
+        """
+        char_count = textpage.count_chars()
+        if char_count <= 0:
+            return []
+        
+        # 문자 코드 + loose 문자 bbox (글꼴 높이 기준이라 같은 줄 단어의 top이 일치, ctypes 버퍼 재사용)
+        codes = np.empty(char_count, dtype=np.int64)
+        boxes = np.zeros((char_count, 4), dtype=np.float64)  # left, bottom, right, top
+        rect = pdfium_c.FS_RECTF()
+        for index in range(char_count):
+            codes[index] = pdfium_c.FPDFText_GetUnicode(textpage, index)
+            if pdfium_c.FPDFText_GetLooseCharBox(textpage, index, rect):
+                boxes[index] = (rect.left, rect.bottom, rect.right, rect.top)
+        
+        codes, boxes = self._merge_surrogate_pairs(codes, boxes)
+        char_count = len(codes)
+        
+        # 단어 경계: 공백류 문자(pdfium이 생성한 줄바꿈 포함) 다음, 또는 줄이 바뀐 문자
+        # (세로 중심이 글자 높이 절반 이상 이동하거나 왼쪽으로 되돌아가면 새 줄)
+        keep = ~np.isin(codes, _SEPARATOR_CODES) & (boxes[:, 2] > boxes[:, 0])
+        if not keep.any():
+            return []
+        
+        center_y = (boxes[:, 1] + boxes[:, 3]) / 2
+        char_height = boxes[:, 3] - boxes[:, 1]
+        new_line = (
+            (np.abs(np.diff(center_y)) > char_height[1:] / 2) |
+            (boxes[1:, 0] < boxes[:-1, 2] - char_height[1:])
+        )
+        
+        breaks = np.ones(char_count, dtype=bool)
+        breaks[1:] = ~keep[:-1] | new_line
+        word_ids = np.cumsum(breaks)[keep]
+        
+        kept_boxes = boxes[keep]
+        starts = np.flatnonzero(np.diff(word_ids, prepend=-1))
+        x0 = np.minimum.reduceat(kept_boxes[:, 0], starts)
+        y0 = np.minimum.reduceat(kept_boxes[:, 1], starts)
+        x1 = np.maximum.reduceat(kept_boxes[:, 2], starts)
+        y1 = np.maximum.reduceat(kept_boxes[:, 3], starts)
+        
+        chars = "".join(map(chr, codes[keep].tolist()))
+        ends = np.append(starts[1:], len(chars))
+        
+        return [
+            {
+                "text": chars[start:end],
+                "x0": float(x0[i]),
+                "y0": float(y0[i]),
+                "x1": float(x1[i]),
+                "y1": float(y1[i]),
+                "top": float(page_height - y1[i]),
+                "bottom": float(page_height - y0[i])
+            }
+            for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist()))
+        ]
+    
+    @staticmethod
+    def _merge_surrogate_pairs(codes: np.ndarray, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        UTF-16 서로게이트 쌍을 한 문자로 합침
+        
+        FPDFText_GetUnicode는 UTF-16 코드 단위를 반환하므로 BMP 밖 문자(수학 기호, 이모지 등)는
+        문자 인덱스 2개(high + low)로 나뉨 → 코드 포인트 하나와 두 bbox의 합으로 합침
+        짝이 없는 서로게이트는 U+FFFD로 바꿈 (UTF-8 인코딩/캐시 저장 실패 방지)
+        
+        Args:
+            codes: 문자 인덱스별 UTF-16 코드 단위
+            boxes: 문자 인덱스별 bbox (left, bottom, right, top)
+        
+        Returns:
+            (코드 포인트, bbox) - 합친 만큼 길이가 줄어듦
+        """
+        is_high = (codes >= 0xD800) & (codes <= 0xDBFF)
+        is_low = (codes >= 0xDC00) & (codes <= 0xDFFF)
+        pairs = np.flatnonzero(is_high[:-1] & is_low[1:])
+        
+        if len(pairs):
+            codes[pairs] = 0x10000 + ((codes[pairs] - 0xD800) << 10) + (codes[pairs + 1] - 0xDC00)
+            
+            # 한쪽 bbox만 유효하면 그 bbox, 둘 다 유효하면 합집합
+            high, low = boxes[pairs], boxes[pairs + 1]
+            high_ok = (high[:, 2] > high[:, 0])[:, None]
+            low_ok = (low[:, 2] > low[:, 0])[:, None]
+            union = np.hstack((np.minimum(high[:, :2], low[:, :2]), np.maximum(high[:, 2:], low[:, 2:])))
+            boxes[pairs] = np.where(high_ok & low_ok, union, np.where(low_ok, low, high))
+            
+            codes = np.delete(codes, pairs + 1)
+            boxes = np.delete(boxes, pairs + 1, axis=0)
+        
+        codes[(codes >= 0xD800) & (codes <= 0xDFFF)] = 0xFFFD
+        return codes, boxes
     
     def process(self, pages: List[Dict], pdf_path: Union[str, Path]) -> List[Dict]:
         """
@@ -7,7 +7,10 @@ import requests
 import os
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Union
+from typing import Dict, Iterator, List, Any, Union, Optional
+from pypdf import PdfReader
+
+from utils.file_utils import build_page_subset_pdf, remap_subset_pages
 
 
 class UpstageDocumentParseTool:
@@ -20,6 +23,9 @@ class UpstageDocumentParseTool:
     - 고급 파싱 기능
     """
     
+    # 페이지 출력 형식 버전 (bbox 좌표계 등 래퍼 출력이 바뀌면 올려서 추출 캐시 무효화)
+    OUTPUT_VERSION = 1
+    
     def __init__(self):
         self.api_key = os.getenv("SOLAR_API_KEY")
         if not self.api_key:
@@ -27,17 +33,37 @@ class UpstageDocumentParseTool:
         
         # 올바른 API 엔드포인트
         self.api_url = "https://api.upstage.ai/v1/document-digitization"
+        self.settings = {
+            "api": "upstage-document-parse",
+            "version": self.get_version(),
+            "ocr": "auto"
+        }
     
     def get_version(self) -> str:
         """도구 버전 반환"""
         return "upstage-document-parse-v1"
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def get_page_count(self, pdf_path: Union[str, Path]) -> int:
+        """
+        전체 페이지 수 확인 (API 호출 없이 로컬에서 조회)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            페이지 수
+        """
+        with open(pdf_path, 'rb') as f:
+            return len(PdfReader(f).pages)
+    
+    def extract(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         Upstage Document Parse API로 PDF 추출
         
         Args:
             pdf_path: PDF 파일 경로
+            pages: 추출할 페이지 번호 리스트 (1부터 시작, None이면 전체)
+                   지정 시 해당 페이지만 담은 PDF를 업로드 (처리 시간/업로드 크기/과금이 샘플 수에 비례)
             
         Returns:
             {
@@ -62,9 +88,21 @@ class UpstageDocumentParseTool:
         try:
             print(f"[INFO] Upstage Document Parse 시작: {pdf_path.name}")
             
+            # 지정 페이지만 담은 PDF 생성 (전체 페이지면 원본 그대로)
+            subset_pdf, page_numbers = build_page_subset_pdf(pdf_path, pages) if pages is not None else (None, None)
+            if page_numbers == []:
+                # 범위 안의 페이지가 없으면 API를 호출하지 않음 (빈 PDF 업로드 방지)
+                return {
+                    "pages": [],
+                    "settings": self.settings
+                }
+            if subset_pdf is not None:
+                print(f"[INFO] 샘플 페이지만 업로드: {page_numbers}")
+            
             # PDF 파일을 바이너리로 읽기
             with open(pdf_path, 'rb') as f:
-                files = {"document": f}
+                document = (pdf_path.name, subset_pdf) if subset_pdf is not None else f
+                files = {"document": document}
                 headers = {"Authorization": f"Bearer {self.api_key}"}
                 
                 # API 파라미터 (document-parse 모델 사용)
@@ -96,18 +134,16 @@ class UpstageDocumentParseTool:
             else:
                 print(f"[WARNING] API 응답에 'elements' 필드가 없습니다. 응답 키: {list(result.keys())}")
             
-            # 응답 파싱
-            pages = self._parse_upstage_response(result)
+            # 응답 파싱 (부분 PDF의 페이지 번호 → 원본 페이지 번호)
+            parsed_pages = self._parse_upstage_response(result)
+            if page_numbers is not None:
+                parsed_pages = remap_subset_pages(parsed_pages, page_numbers)
             
-            print(f"[INFO] 파싱 완료: {len(pages)}개 페이지")
+            print(f"[INFO] 파싱 완료: {len(parsed_pages)}개 페이지")
             
             return {
-                "pages": pages,
-                "settings": {
-                    "api": "upstage-document-parse",
-                    "version": self.get_version(),
-                    "ocr": "auto"
-                }
+                "pages": parsed_pages,
+                "settings": self.settings
             }
             
         except requests.exceptions.RequestException as e:
@@ -117,6 +153,21 @@ class UpstageDocumentParseTool:
             print(f"[ERROR] Upstage Document Parse processing error: {e}")
             raise
     
+    def iter_pages(self, pdf_path: Union[str, Path], pages: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        페이지 단위 반환 (다른 도구와 같은 스트리밍 인터페이스)
+        
+        API가 문서를 한 번에 처리하므로 응답을 받은 뒤 페이지 순서대로 반환
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 반환할 페이지 번호 리스트 (1부터 시작, None이면 전체)
+            
+        Yields:
+            extract()의 "pages" 항목과 같은 형식의 페이지 데이터
+        """
+        yield from self.extract(pdf_path, pages)["pages"]
+    
     def _parse_upstage_response(self, response: Dict) -> List[Dict]:
         """
         Upstage Document Parse API 응답을 표준 형식으로 변환
@@ -2,14 +2,24 @@
 유틸리티 모듈
 """
 
-from .llm_client import SolarClient
+from .llm_client import SolarClient, get_llm_cache
 from .metrics import ValidationMetrics
 from .file_utils import load_pages_text, save_error_log
+from .batch_runner import run_batch
+from .disk_cache import DiskCache, make_cache_key
+from .extraction_cache import ExtractionCache, get_extraction_cache, file_sha256
 
 __all__ = [
     "SolarClient",
     "ValidationMetrics",
     "load_pages_text",
-    "save_error_log"
+    "save_error_log",
+    "run_batch",
+    "get_llm_cache",
+    "DiskCache",
+    "make_cache_key",
+    "ExtractionCache",
+    "get_extraction_cache",
+    "file_sha256"
 ]
 
@@ -0,0 +1,154 @@
+"""
+배치 실행기
+여러 문서를 워커 풀에서 병렬 처리 (입력 순서대로 결과 수집)
+"""
+
+import contextvars
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+import config
+
+
+# forkserver에 미리 올려 둘 모듈 (워커마다 PDF 라이브러리를 새로 import하지 않도록, 없는 모듈은 무시됨)
+FORKSERVER_PRELOAD = [
+    "numpy", "fitz", "pdfplumber", "pdfminer.high_level", "pypdfium2",
+    "tools.pdfplumber_tool", "tools.pdfminer_tool", "tools.pypdfium2_tool", "tools.custom_split_tool",
+    "utils.sharded_extraction"
+]
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_batch(
+    items: Sequence[T],
+    worker: Callable[[int, T], R],
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    on_error: Optional[Callable[[int, T, Exception], R]] = None
+) -> List[Optional[R]]:
+    """
+    항목별 작업을 워커 풀에서 병렬 실행
+    
+    - 동시에 제출되는 작업 수를 max_in_flight로 제한 (메모리/API 부하 제한)
+    - 한 항목의 예외는 다른 항목에 영향을 주지 않음 (on_error로 대체 결과 생성)
+    - 결과는 완료 순서와 무관하게 입력 순서대로 반환
+    - 작업은 제출 시점의 컨텍스트(contextvars)에서 실행 (작업 출력 버퍼 등이 워커 스레드로 이어짐)
+    
+    Args:
+        items: 처리할 항목 리스트 (예: 입력 PDF 경로)
+        worker: (1부터 시작하는 순번, 항목) → 결과
+        max_workers: 워커 수 (기본값: config.MAX_WORKERS)
+        max_in_flight: 동시에 제출되는 최대 항목 수 (기본값: config.BATCH_SIZE)
+        on_error: 예외 발생 시 대체 결과 생성 함수 (없으면 None)
+        
+    Returns:
+        입력 순서와 동일한 결과 리스트
+    """
+    
+    max_workers = max(1, max_workers or config.MAX_WORKERS)
+    max_in_flight = max(max_workers, max_in_flight or config.BATCH_SIZE)
+    
+    results: List[Optional[R]] = [None] * len(items)
+    
+    def _handle_error(index: int, item: T, error: Exception) -> Optional[R]:
+        print(f"[ERROR] Batch item {index + 1} failed: {str(error)}")
+        return on_error(index + 1, item, error) if on_error else None
+    
+    # 워커 1개면 스레드 없이 순차 실행 (디버깅 용이)
+    if max_workers == 1:
+        for index, item in enumerate(items):
+            try:
+                results[index] = worker(index + 1, item)
+            except Exception as e:
+                results[index] = _handle_error(index, item, e)
+        return results
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict[Future, int] = {}
+        next_index = 0
+        
+        while next_index < len(items) or pending:
+            # 제한된 수만큼만 제출
+            while next_index < len(items) and len(pending) < max_in_flight:
+                future = executor.submit(
+                    contextvars.copy_context().run, worker, next_index + 1, items[next_index]
+                )
+                pending[future] = next_index
+                next_index += 1
+            
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = _handle_error(index, items[index], e)
+    
+    return results
+
+
+def make_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    프로세스 풀 생성 (시작 방식: config.PROCESS_POOL_START_METHOD)
+    
+    프로세스 풀은 run_batch 워커나 검증 스레드 안에서도 만들어지므로 fork를 쓰지 않음
+    (fork 시점에 다른 스레드가 잡고 있던 락 - SQLite 캐시, requests 세션 등 - 이 자식 프로세스에
+    잠긴 채 복사되어 교착될 수 있음). 지원하지 않는 OS(Windows의 forkserver 등)는 spawn 사용
+    
+    Args:
+        max_workers: 워커 프로세스 수
+    """
+    start_method = config.PROCESS_POOL_START_METHOD
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = "spawn"
+    
+    context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        context.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    공유 프로세스 풀 반환 (워커 수: config.PROCESS_POOL_WORKERS, 기본 CPU 코어 수)
+    
+    문서마다 풀을 만들면 동시 처리 문서 수 × 워커 수만큼 파서 프로세스가 뜨고 시작 비용도 매번 들므로
+    모든 문서/단계가 한 풀을 재사용 (깨진 풀은 새로 만듦)
+    """
+    global _process_pool
+    
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool._broken:
+            _process_pool = make_process_pool(config.PROCESS_POOL_WORKERS or os.cpu_count() or 1)
+        return _process_pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor):
+    """
+    멈춘 작업이 있는 공유 풀을 버리고 워커 프로세스 강제 종료 (다음 get_process_pool()은 새 풀 생성)
+    
+    ProcessPoolExecutor는 이미 실행 중인 작업을 취소하지 못하므로 shutdown만으로는 멈춘 워커가
+    코어를 계속 점유함. 같은 풀에서 실행 중이던 다른 작업은 BrokenProcessPool로 끝나므로
+    호출 측에서 새 풀에 다시 제출해야 함
+    """
+    global _process_pool
+    
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    
+    processes = list((pool._processes or {}).values())
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,205 @@
+"""
+디스크 캐시 (SQLite 기반)
+
+내용 해시를 키로 JSON 직렬화 가능한 값을 저장
+- TTL 만료 / 용량 초과 시 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 적중/미스 카운터
+- 스레드 및 프로세스 간 공유 가능 (WAL 모드)
+- 저장 용량은 연결별 누적값으로 추적 (저장마다 전체 SUM 스캔 없음)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+# 이 횟수만큼 저장할 때마다 누적 용량을 DB 기준으로 다시 계산 (다른 프로세스의 저장/삭제 반영)
+_TOTAL_RESYNC_WRITES = 256
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    캐시 키 생성 (구성 요소의 sha256)
+
+    Args:
+        parts: JSON 직렬화 가능한 키 구성 요소
+
+    Returns:
+        64자리 hex 문자열
+    """
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite 디스크 캐시
+
+    사용 예:
+        cache = DiskCache(path, ttl_seconds=3600, max_bytes=100 * 1024 * 1024)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_seconds: 항목 유효 기간 (None이면 만료 없음)
+            max_bytes: 최대 저장 용량 (None이면 제한 없음)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_created ON cache(created_at)")
+        self._conn.commit()
+
+        # 저장 용량 누적값 (열 때 한 번 계산, 이후 저장/삭제 시 증감)
+        self._total_bytes = self._sum_sizes()
+        self._writes_since_resync = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Returns:
+            저장된 값 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, size, created_at = row
+
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._total_bytes = max(0, self._total_bytes - size)
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any):
+        """캐시 저장 (같은 키가 있으면 덮어씀)"""
+        serialized = json.dumps(value, ensure_ascii=False)
+        size = len(serialized.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, serialized, size, now, now)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+
+            self._writes_since_resync += 1
+            if self._writes_since_resync >= _TOTAL_RESYNC_WRITES:
+                self._total_bytes = self._sum_sizes()
+                self._writes_since_resync = 0
+
+            self._evict(now)
+            self._conn.commit()
+
+    def _sum_sizes(self) -> int:
+        """DB 기준 전체 저장 용량 (전체 스캔, 열 때/주기적 재계산에만 사용)"""
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+
+    def _evict(self, now: float):
+        """만료 항목 삭제 후 용량 초과분을 LRU 순서로 삭제 (lock 보유 상태에서 호출)"""
+        if self.ttl_seconds is not None:
+            # created_at 인덱스로 만료 구간만 조회 (만료 항목이 없으면 즉시 끝남)
+            cutoff = now - self.ttl_seconds
+            expired = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache WHERE created_at < ?", (cutoff,)
+            ).fetchone()[0]
+            if expired:
+                self._conn.execute("DELETE FROM cache WHERE created_at < ?", (cutoff,))
+                self._total_bytes = max(0, self._total_bytes - expired)
+
+        if self.max_bytes is None or self._total_bytes <= self.max_bytes:
+            return
+
+        excess = self._total_bytes - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM cache ORDER BY accessed_at ASC"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+        self._total_bytes = max(0, self._total_bytes - freed)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 및 저장 현황"""
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": total_bytes
+        }
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
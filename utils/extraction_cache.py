@@ -0,0 +1,141 @@
+"""
+추출 결과 캐시
+
+키: (PDF 내용 sha256, 도구 이름, 도구 버전, 출력 형식 버전, 설정 해시, 페이지 번호)
+- 같은 PDF를 같은 도구/설정으로 다시 추출하면 파싱 생략
+- 페이지 단위 저장이므로 샘플링 페이지가 달라도 겹치는 페이지는 재사용
+- 최초 추출 시간도 함께 저장 (캐시 적중 시에도 속도 평가가 달라지지 않도록)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import config
+from .disk_cache import DiskCache, make_cache_key
+
+
+# (절대 경로, 크기, 수정 시각 ns) → 내용 해시 (같은 문서를 단계마다 다시 읽지 않도록)
+_FILE_HASH_MEMO_SIZE = 256
+_file_hash_memo: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_file_hash_lock = threading.Lock()
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """
+    파일 내용 sha256 (대용량 PDF도 청크 단위로 읽음)
+
+    같은 파일(경로, 크기, 수정 시각이 같음)은 프로세스 내에서 한 번만 읽음
+    (1단계 추출 캐시, 검증 재추출, custom split 분할 키가 모두 같은 원본 해시를 사용)
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    with _file_hash_lock:
+        if memo_key in _file_hash_memo:
+            _file_hash_memo.move_to_end(memo_key)
+            return _file_hash_memo[memo_key]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    hexdigest = digest.hexdigest()
+
+    with _file_hash_lock:
+        _file_hash_memo[memo_key] = hexdigest
+        while len(_file_hash_memo) > _FILE_HASH_MEMO_SIZE:
+            _file_hash_memo.popitem(last=False)
+
+    return hexdigest
+
+
+def tool_fingerprint(tool: Any) -> Tuple[str, int, str]:
+    """
+    도구 식별 정보 (라이브러리 버전, 출력 형식 버전, 설정 해시)
+
+    설정이 바뀌거나 도구 래퍼의 출력 형식(tool.OUTPUT_VERSION)이 바뀌면
+    결과가 달라지므로 다른 캐시 항목으로 취급
+    """
+    version = getattr(tool, "get_version", lambda: "unknown")()
+    output_version = getattr(tool, "OUTPUT_VERSION", 0)
+    settings_hash = make_cache_key(getattr(tool, "settings", {}))
+    return str(version), output_version, settings_hash
+
+
+class ExtractionCache:
+    """페이지 단위 추출 결과 캐시 (DiskCache 기반)"""
+
+    def __init__(self, cache: DiskCache):
+        self.cache = cache
+
+    def _key(self, pdf_hash: str, tool_name: str, tool: Any, page_num: int) -> str:
+        version, output_version, settings_hash = tool_fingerprint(tool)
+        return make_cache_key("extraction", pdf_hash, tool_name, version, output_version, settings_hash, page_num)
+
+    def get_pages(
+        self,
+        pdf_hash: str,
+        tool_name: str,
+        tool: Any,
+        pages: List[int]
+    ) -> Tuple[List[Dict[str, Any]], float, List[int]]:
+        """
+        캐시된 페이지 조회
+
+        Returns:
+            (캐시된 페이지 데이터 리스트, 캐시된 페이지의 최초 추출 시간 합계 ms,
+             추출이 필요한 페이지 번호 리스트)
+        """
+        cached_pages = []
+        cached_time_ms = 0.0
+        missing_pages = []
+
+        for page_num in pages:
+            entry = self.cache.get(self._key(pdf_hash, tool_name, tool, page_num))
+            if entry is None:
+                missing_pages.append(page_num)
+            else:
+                cached_pages.append(entry["page_data"])
+                cached_time_ms += entry["processing_time_ms"]
+
+        return cached_pages, cached_time_ms, missing_pages
+
+    def put_pages(
+        self,
+        pdf_hash: str,
+        tool_name: str,
+        tool: Any,
+        pages: List[Dict[str, Any]],
+        time_per_page_ms: float = 0.0
+    ):
+        """추출된 페이지 저장 (페이지 데이터의 "page" 값 기준)"""
+        for page_data in pages:
+            self.cache.set(
+                self._key(pdf_hash, tool_name, tool, page_data["page"]),
+                {"page_data": page_data, "processing_time_ms": time_per_page_ms}
+            )
+
+
+_extraction_cache_lock = threading.Lock()
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """추출 결과 캐시 반환 (config.EXTRACTION_CACHE_ENABLED가 False이면 None)"""
+    global _extraction_cache
+
+    if not config.EXTRACTION_CACHE_ENABLED:
+        return None
+
+    with _extraction_cache_lock:
+        if _extraction_cache is None:
+            _extraction_cache = ExtractionCache(DiskCache(
+                config.EXTRACTION_CACHE_PATH,
+                ttl_seconds=config.EXTRACTION_CACHE_TTL_SECONDS,
+                max_bytes=config.EXTRACTION_CACHE_MAX_MB * 1024 * 1024
+            ))
+        return _extraction_cache
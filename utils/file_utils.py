@@ -2,9 +2,10 @@
 파일 유틸리티
 """
 
+import io
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 import config
 
@@ -13,6 +14,8 @@ def load_pages_text(jsonl_path: str) -> List[Dict]:
     """
     pages_text.jsonl 파일 로드
     
+    같은 디렉토리에 bbox npz(config.BBOX_FILENAME)가 있으면 페이지별 "bbox"(BBoxTable)로 붙임
+    
     Args:
         jsonl_path: JSONL 파일 경로
         
@@ -20,6 +23,8 @@ def load_pages_text(jsonl_path: str) -> List[Dict]:
         페이지 데이터 리스트
     """
     
+    from state import load_bbox_tables
+    
     pages = []
     
     try:
@@ -35,6 +40,13 @@ def load_pages_text(jsonl_path: str) -> List[Dict]:
         print(f"[ERROR] JSON parsing error: {str(e)}")
         return []
     
+    bboxes_path = Path(jsonl_path).parent / config.BBOX_FILENAME
+    if bboxes_path.exists():
+        bbox_tables = load_bbox_tables(bboxes_path)
+        for page in pages:
+            if "bbox" not in page and page.get("page") in bbox_tables:
+                page["bbox"] = bbox_tables[page["page"]]
+    
     return pages
 
 
@@ -55,6 +67,62 @@ def save_pages_text(pages: List[Dict], output_path: str) -> None:
             f.write(json.dumps(page, ensure_ascii=False) + '\n')
 
 
+def build_page_subset_pdf(pdf_path: Union[str, Path], pages: List[int]) -> Tuple[Optional[bytes], List[int]]:
+    """
+    지정한 페이지만 담은 PDF 생성 (pypdf로 로컬에서 페이지 복사, 렌더링 없음)
+    
+    API에 문서 전체 대신 샘플 페이지만 업로드할 때 사용
+    
+    Args:
+        pdf_path: 원본 PDF 경로
+        pages: 담을 페이지 번호 리스트 (1부터 시작, 범위 밖 번호는 무시)
+        
+    Returns:
+        (부분 PDF 바이트 - 모든 페이지가 포함되거나 담을 페이지가 없으면 None,
+         부분 PDF의 i번째 페이지에 대응하는 원본 페이지 번호 리스트 - 비어 있으면 업로드할 페이지 없음)
+    """
+    
+    from pypdf import PdfReader, PdfWriter
+    
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        total_pages = len(reader.pages)
+        page_numbers = sorted(p for p in set(pages) if 1 <= p <= total_pages)
+        
+        if not page_numbers or page_numbers == list(range(1, total_pages + 1)):
+            return None, page_numbers
+        
+        writer = PdfWriter()
+        for page_num in page_numbers:
+            writer.add_page(reader.pages[page_num - 1])
+        
+        buffer = io.BytesIO()
+        writer.write(buffer)
+    
+    return buffer.getvalue(), page_numbers
+
+
+def remap_subset_pages(pages: List[Dict], page_numbers: List[int]) -> List[Dict]:
+    """
+    부분 PDF 기준 페이지 번호를 원본 페이지 번호로 변환
+    
+    Args:
+        pages: 부분 PDF 추출 결과 ("page"는 부분 PDF 기준, 1부터 시작)
+        page_numbers: build_page_subset_pdf가 반환한 원본 페이지 번호 리스트
+        
+    Returns:
+        원본 페이지 번호로 바꾼 페이지 리스트 (대응하는 원본 페이지가 없으면 제외)
+    """
+    
+    remapped = []
+    for page in pages:
+        index = page["page"] - 1
+        if 0 <= index < len(page_numbers):
+            remapped.append({**page, "page": page_numbers[index]})
+    
+    return remapped
+
+
 def save_error_log(state: Dict[str, Any]) -> None:
     """
     에러 로그 저장
@@ -92,7 +160,8 @@ def ensure_directories() -> None:
         config.TABLES_DIR,
         config.EXTRACTED_DIR,
         config.VALIDATED_DIR,
-        config.JUDGED_DIR
+        config.JUDGED_DIR,
+        config.CACHE_DIR
     ]
     
     for directory in directories:
@@ -2,28 +2,152 @@
 LLM 클라이언트 (Upstage Solar pro2)
 """
 
+import asyncio
+import random
+import threading
+import time
 import requests
 import json
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Tuple
 import config
+from .disk_cache import DiskCache, make_cache_key
+
+
+# 재시도 대상 HTTP 상태 코드 (Rate limit / 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 Rate Limiter (스레드 안전)
+    
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 누적 (순간 버스트 허용)
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득 (부족하면 채워질 때까지 대기)
+        
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                
+                wait_time = (1.0 - self._tokens) / self.rate
+            
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class _ConnectionResources:
+    """동일 설정의 클라이언트가 공유하는 연결 풀 / 동시성 제한 / Rate Limiter"""
+    
+    def __init__(self, max_concurrency: int, rate_limit_rps: Optional[float], rate_limit_burst: int):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.rate_limiter = TokenBucket(rate_limit_rps, rate_limit_burst) if rate_limit_rps else None
+
+
+_resources_lock = threading.Lock()
+_shared_resources: Dict[Tuple, _ConnectionResources] = {}
+
+
+def _get_shared_resources(
+    api_base: str,
+    max_concurrency: int,
+    rate_limit_rps: Optional[float],
+    rate_limit_burst: int
+) -> _ConnectionResources:
+    """설정별 공유 리소스 반환 (에이전트/문서가 달라도 같은 풀과 제한을 사용)"""
+    key = (api_base, max_concurrency, rate_limit_rps, rate_limit_burst)
+    with _resources_lock:
+        if key not in _shared_resources:
+            _shared_resources[key] = _ConnectionResources(max_concurrency, rate_limit_rps, rate_limit_burst)
+        return _shared_resources[key]
+
+
+_llm_cache_lock = threading.Lock()
+_llm_cache: Optional[DiskCache] = None
+
+
+def get_llm_cache() -> Optional[DiskCache]:
+    """LLM 응답 캐시 반환 (config.LLM_CACHE_ENABLED가 False이면 None)"""
+    global _llm_cache
+    
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = DiskCache(
+                config.LLM_CACHE_PATH,
+                ttl_seconds=config.LLM_CACHE_TTL_SECONDS,
+                max_bytes=config.LLM_CACHE_MAX_MB * 1024 * 1024
+            )
+        return _llm_cache
 
 
 class SolarClient:
-    """Upstage Solar pro2 API 클라이언트"""
+    """
+    Upstage Solar pro2 API 클라이언트
+    
+    - 연결 재사용 (requests.Session keep-alive, 프로세스 내 공유 풀)
+    - 최대 동시 호출 수 제한 (config.SOLAR_MAX_CONCURRENCY)
+    - 토큰 버킷 Rate Limit (config.SOLAR_RATE_LIMIT_RPS)
+    - 429/5xx 응답 시 지터 포함 지수 백오프 재시도
+    - 디스크 응답 캐시 (동일 모델/온도/프롬프트 재호출 생략)
+    - asyncio API (acall / acall_many)
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        api_base: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit_rps: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ):
         self.api_key = config.SOLAR_API_KEY
-        self.api_base = config.SOLAR_API_BASE
+        self.api_base = api_base or config.SOLAR_API_BASE
         self.model = config.SOLAR_MODEL
         self.max_tokens = config.SOLAR_MAX_TOKENS
         self.temperature = config.SOLAR_TEMPERATURE
+        self.max_retries = config.SOLAR_MAX_RETRIES if max_retries is None else max_retries
+        
+        self._resources = _get_shared_resources(
+            self.api_base,
+            max(1, max_concurrency or config.SOLAR_MAX_CONCURRENCY),
+            config.SOLAR_RATE_LIMIT_RPS if rate_limit_rps is None else rate_limit_rps,
+            config.SOLAR_RATE_LIMIT_BURST
+        )
     
     def call(
         self,
         prompt: str,
         system: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Solar pro2 API 호출
@@ -33,6 +157,8 @@ class SolarClient:
             system: 시스템 프롬프트
             temperature: 온도 (기본값: config)
             max_tokens: 최대 토큰 (기본값: config)
+            timeout: 전체 시간 한도 (초, 슬롯 대기/재시도/백오프 포함, None이면 재시도 횟수까지)
+                     한도에 닿으면 진행 중인 요청과 남은 재시도를 멈추고 None 반환
             
         Returns:
             {
@@ -42,7 +168,8 @@ class SolarClient:
                     "output_tokens": 50,
                     "total_tokens": 150
                 },
-                "model": "solar-pro-2"
+                "model": "solar-pro-2",
+                "cached": False  # 캐시 적중 시 True
             }
         """
         
@@ -71,12 +198,33 @@ class SolarClient:
             "max_tokens": max_tokens or self.max_tokens
         }
         
+        # 캐시 조회 (키: 모델, 온도, 최대 토큰, 시스템/사용자 프롬프트)
+        cache = get_llm_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = make_cache_key(
+                payload["model"],
+                payload["temperature"],
+                payload["max_tokens"],
+                system,
+                prompt
+            )
+            try:
+                cached = cache.get(cache_key)
+            except Exception as e:
+                # 캐시 DB 오류(잠김/손상)는 호출 실패로 취급하지 않고 API 호출로 진행
+                print(f"[WARN] LLM cache lookup failed: {str(e)}")
+                cached = None
+            if cached is not None:
+                cached["cached"] = True
+                return cached
+        
         try:
-            response = requests.post(
+            response = self._post_with_retry(
                 f"{self.api_base}/chat/completions",
                 headers=headers,
-                json=payload,
-                timeout=config.LLM_TIMEOUT
+                payload=payload,
+                deadline=time.monotonic() + timeout if timeout else None
             )
             
             response.raise_for_status()
@@ -87,16 +235,25 @@ class SolarClient:
             choice = data["choices"][0]
             usage = data.get("usage", {})
             
-            return {
+            result = {
                 "content": choice["message"]["content"],
                 "usage": {
                     "input_tokens": usage.get("prompt_tokens", 0),
                     "output_tokens": usage.get("completion_tokens", 0),
                     "total_tokens": usage.get("total_tokens", 0)
                 },
-                "model": data.get("model", self.model)
+                "model": data.get("model", self.model),
+                "cached": False
             }
             
+            if cache is not None:
+                try:
+                    cache.set(cache_key, result)
+                except Exception as e:
+                    print(f"[WARN] LLM cache store failed: {str(e)}")
+            
+            return result
+            
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Solar API error: {str(e)}")
             if hasattr(e, 'response') and e.response:
@@ -106,6 +263,124 @@ class SolarClient:
         except Exception as e:
             print(f"[ERROR] Exception occurred: {str(e)}")
             return None
+    
+    def _post_with_retry(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        deadline: Optional[float] = None
+    ) -> requests.Response:
+        """
+        POST 요청 (429/5xx 및 연결 오류 시 재시도)
+        
+        동시 호출 슬롯은 요청을 보내는 동안만 잡고 백오프 대기 중에는 반납
+        (한 호출의 429 재시도 대기가 다른 호출을 막지 않도록)
+        
+        deadline(time.monotonic 기준)이 있으면 슬롯 대기/요청 타임아웃/백오프를 남은 시간 안으로 제한
+        (한도를 넘긴 호출이 슬롯을 잡은 채 계속 재시도하지 않도록)
+        
+        마지막 시도의 응답을 그대로 반환하거나 연결 오류를 다시 발생시킴
+        
+        Raises:
+            requests.exceptions.Timeout: deadline 초과
+        """
+        
+        def remaining() -> Optional[float]:
+            if deadline is None:
+                return None
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise requests.exceptions.Timeout("Solar API call deadline exceeded")
+            return left
+        
+        def out_of_time(delay: float) -> bool:
+            return deadline is not None and time.monotonic() + delay >= deadline
+        
+        for attempt in range(self.max_retries + 1):
+            if self._resources.rate_limiter:
+                self._resources.rate_limiter.acquire()
+            
+            try:
+                if not self._resources.semaphore.acquire(timeout=remaining()):
+                    raise requests.exceptions.Timeout("Solar API call deadline exceeded while waiting for a slot")
+                try:
+                    left = remaining()
+                    response = self._resources.session.post(
+                        url,
+                        headers=headers,
+                        json=payload,
+                        timeout=config.LLM_TIMEOUT if left is None else min(config.LLM_TIMEOUT, left)
+                    )
+                finally:
+                    self._resources.semaphore.release()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                if out_of_time(delay):
+                    raise
+                print(f"[WARN] Solar API connection error, retry {attempt + 1}/{self.max_retries} in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
+                continue
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                return response
+            
+            delay = self._backoff_delay(attempt, response.headers.get("Retry-After"))
+            if out_of_time(delay):
+                return response
+            print(f"[WARN] Solar API {response.status_code}, retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+        
+        return response
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """재시도 대기 시간 (Retry-After 우선, 없으면 full jitter 지수 백오프)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), config.SOLAR_RETRY_BACKOFF_MAX)
+            except ValueError:
+                pass
+        
+        ceiling = min(config.SOLAR_RETRY_BACKOFF_MAX, config.SOLAR_RETRY_BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(0, ceiling)
+    
+    async def acall(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Solar pro2 API 비동기 호출 (call과 동일한 반환 형식)
+        
+        공유 연결 풀과 동시성 제한은 call과 동일하게 적용됨
+        """
+        return await asyncio.to_thread(self.call, prompt, system, temperature, max_tokens)
+    
+    async def acall_many(
+        self,
+        prompts: List[str],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 프롬프트 동시 호출
+        
+        Args:
+            prompts: 사용자 프롬프트 리스트
+            
+        Returns:
+            프롬프트와 같은 순서의 응답 리스트 (실패한 항목은 None)
+        """
+        return list(await asyncio.gather(*(
+            self.acall(prompt, system, temperature, max_tokens)
+            for prompt in prompts
+        )))
 
 
 if __name__ == "__main__":
@@ -123,4 +398,3 @@ if __name__ == "__main__":
         print(f"토큰: {response['usage']}")
     else:
         print(f"[ERROR] Solar API call failed")
-
@@ -0,0 +1,97 @@
+"""
+작업별 콘솔 출력 버퍼
+병렬 작업의 print 출력이 줄 단위로 뒤섞이지 않도록 작업마다 모아서 한 번에 출력
+"""
+
+import contextvars
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+_task_buffer: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar("task_buffer", default=None)
+_print_lock = threading.RLock()
+
+# 대리 stdout 설치 상태 (여러 문서/에이전트가 동시에 capture_task_output을 쓰므로 참조 수로 관리)
+_capture_lock = threading.Lock()
+_capture_count = 0
+_original_stdout = None
+
+
+class _TaskAwareStdout:
+    """현재 컨텍스트에 작업 버퍼가 있으면 버퍼로, 없으면 원래 stdout으로 쓰는 stdout 대리 객체"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _task_buffer.get()
+        if buffer is not None:
+            return buffer.write(text)
+        with _print_lock:
+            return self.stream.write(text)
+
+    def flush(self):
+        if _task_buffer.get() is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def capture_task_output() -> Iterator[None]:
+    """
+    병렬 구간 전체를 감싸는 컨텍스트 (sys.stdout을 작업 인식 대리 객체로 교체)
+
+    여러 스레드에서 동시에 들어와도 대리 객체는 한 번만 설치하고,
+    마지막으로 나가는 구간에서만 원래 stdout으로 복원
+    (먼저 끝난 구간이 복원하면 다른 구간의 작업 출력이 버퍼를 벗어나 섞임)
+
+    구간 안에서 task_output()을 쓰지 않은 출력은 그대로 콘솔에 출력됨
+    """
+    global _capture_count, _original_stdout
+
+    with _capture_lock:
+        if _capture_count == 0 and not isinstance(sys.stdout, _TaskAwareStdout):
+            _original_stdout = sys.stdout
+            sys.stdout = _TaskAwareStdout(_original_stdout)
+        _capture_count += 1
+
+    try:
+        yield
+    finally:
+        with _capture_lock:
+            _capture_count -= 1
+            if _capture_count == 0 and _original_stdout is not None:
+                sys.stdout = _original_stdout
+                _original_stdout = None
+
+
+@contextmanager
+def task_output(header: Optional[str] = None) -> Iterator[io.StringIO]:
+    """
+    현재 작업의 출력을 버퍼에 모았다가 끝날 때 한 덩어리로 출력
+
+    작업 안에서 스레드 풀에 제출하는 함수는 contextvars.copy_context().run으로 감싸면
+    같은 버퍼에 출력됨
+
+    Args:
+        header: 출력 덩어리 첫 줄 (없으면 생략)
+    """
+    buffer = io.StringIO()
+    if header:
+        buffer.write(header + "\n")
+
+    token = _task_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _task_buffer.reset(token)
+        output = buffer.getvalue()
+        if output:
+            with _print_lock:
+                sys.stdout.write(output if output.endswith("\n") else output + "\n")
+                sys.stdout.flush()
@@ -3,17 +3,124 @@
 유효성 검증을 위한 단순하고 명확한 메트릭
 """
 
+import operator
 import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional
 from collections import Counter
 
+import numpy as np
+
+from state import BBoxTable
+
+
+# 미리 컴파일한 패턴 (페이지마다 다시 컴파일하지 않도록)
+_PAGE_NUMBER_PATTERN = re.compile(r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$|^-\s*\d+\s*-$')
+_PAGE_NUMBER_PATTERN_DETAILED = re.compile(r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s]|_')  # isalnum()도 isspace()도 아닌 문자
+_SOFT_WRAP_PATTERN = re.compile(r'(?<![.!?다요까음네자])[ \t]*\n(?!\s*\n)')  # 문장 중간 줄바꿈 (PDF 줄 넘김)
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+\s+|\n+')
+_SENTENCE_ENDINGS = ('다', '요', '니다', '습니다', '음', '까', '네', '자', '.', '?', '!')
+
+
+def _find_repeated_word(text: str, min_run: int = 5) -> Optional[str]:
+    """
+    같은 단어(공백 구분)가 min_run회 이상 연속 반복되는 첫 단어 (없으면 None)
+    
+    인접 단어 동일 여부를 바이트열로 만든 뒤 연속 구간(run)을 한 번에 검색
+    """
+    words = text.split()
+    run_start = bytes(map(operator.eq, words, words[1:])).find(b"\x01" * (min_run - 1))
+    return words[run_start] if run_start >= 0 else None
+
 
 class ValidationMetrics:
     """유효성 검증 메트릭 - 페이지별 Pass/Fail 판정"""
     
+    AXES = ('read', 'sent', 'noise', 'table')
+    
     def __init__(self):
         pass
     
+    def evaluate_pages(self, pages: List[Dict]) -> List[Dict[str, float]]:
+        """
+        여러 페이지(전략 구분 없이)를 한 번에 페이지별로 채점
+        
+        읽기 순서는 모든 페이지의 y0를 이어 붙여 한 번에 계산하고,
+        나머지 축은 미리 컴파일한 패턴으로 페이지별 계산
+        
+        Args:
+            pages: 페이지 데이터 리스트 (서로 다른 전략의 페이지가 섞여 있어도 됨)
+            
+        Returns:
+            입력 순서대로 [{'read': 1.0, 'sent': 0.0, 'noise': 1.0, 'table': 1.0}, ...]
+        """
+        
+        read_scores = self._reading_order_scores(pages)
+        
+        return [
+            {
+                'read': float(read_scores[i]),
+                'sent': self.evaluate_sentence_integrity([page]),
+                'noise': self.evaluate_noise_removal([page]),
+                'table': self.evaluate_table_parsing([page])
+            }
+            for i, page in enumerate(pages)
+        ]
+    
+    def has_column_gutter(self, page: Dict, band: Tuple[float, float] = (0.35, 0.65), bins: int = 60) -> bool:
+        """
+        다단 레이아웃 여부 (페이지 중앙부에 어떤 bbox도 걸치지 않는 세로 여백이 있는지)
+        
+        줄 단위로 좌우 단이 섞여 추출되면 Y 역전이 생기지 않으므로 읽기 순서 점수만으로는 감지 불가
+        → 다단이면 로컬 판정 대신 LLM 검증 필요
+        """
+        
+        bbox_table = BBoxTable.coerce(page.get("bbox"))
+        if len(bbox_table) < 2:
+            return False
+        
+        x0, x1 = bbox_table.column("x0"), bbox_table.column("x1")
+        width = page.get("width") or float(x1.max())
+        if width <= 0:
+            return False
+        
+        x0, x1 = x0 / width, x1 / width
+        
+        # 좌우 모두에 bbox가 충분히 있어야 다단
+        left_ratio = float(((x0 + x1) / 2 < 0.5).mean())
+        if min(left_ratio, 1 - left_ratio) < 0.2:
+            return False
+        
+        edges = np.linspace(band[0], band[1], bins + 1)
+        centers = (edges[:-1] + edges[1:]) / 2
+        covered = ((x0[:, None] <= centers[None, :]) & (x1[:, None] >= centers[None, :])).any(axis=0)
+        return not bool(covered.all())
+    
+    def _reading_order_scores(self, pages: List[Dict]) -> np.ndarray:
+        """페이지별 읽기 순서 점수 배열 (evaluate_reading_order([page])와 동일한 판정)"""
+        
+        scores = np.ones(len(pages), dtype=np.float64)
+        if not pages:
+            return scores
+        
+        tables = [BBoxTable.coerce(page.get("bbox")) for page in pages]
+        counts = np.array([len(table) for table in tables], dtype=np.int64)
+        if counts.sum() < 2:
+            return scores
+        
+        y = np.concatenate([table.column("top") for table in tables])
+        page_ids = np.repeat(np.arange(len(pages)), counts)
+        
+        # 같은 페이지 안에서 이전 요소보다 10px 넘게 위로 올라가면 역전
+        prev_y = y[:-1]
+        is_reversal = (prev_y > 0) & (np.diff(y) < -10) & (page_ids[1:] == page_ids[:-1])
+        reversals = np.bincount(page_ids[1:][is_reversal], minlength=len(pages))
+        
+        # bbox 2개 미만은 판단 불가 → Pass, 역전 5% 이상 → Fail
+        ratios = reversals / np.maximum(counts, 1)
+        scores[(counts >= 2) & (ratios >= 0.05)] = 0.0
+        return scores
+    
     def evaluate_reading_order(self, pages: List[Dict]) -> float:
         """
         read: 읽기 순서 평가 (다단 혼입 감지)
@@ -30,27 +137,14 @@ class ValidationMetrics:
             return 0.0
         
         for page in pages:
-            bbox_list = page.get("bbox", [])
+            bbox_table = BBoxTable.coerce(page.get("bbox"))
             
-            if len(bbox_list) < 2:
+            if len(bbox_table) < 2:
                 # bbox가 너무 적으면 판단 불가 → Pass로 간주
                 continue
             
-            # Y 좌표 기준 역전 횟수 카운트
-            reversals = 0
-            prev_y = 0
-            
-            for bbox in bbox_list:
-                y = bbox.get("y0", 0)
-                
-                # 이전 요소보다 위에 있으면 역전 (10px 오차 허용)
-                if prev_y > 0 and y < prev_y - 10:
-                    reversals += 1
-                
-                prev_y = y
-            
             # 역전 비율 계산
-            reversal_ratio = reversals / len(bbox_list)
+            reversal_ratio = self._count_y_reversals(bbox_table) / len(bbox_table)
             
             # 5% 이상 역전 → FAIL
             if reversal_ratio >= 0.05:
@@ -58,6 +152,12 @@ class ValidationMetrics:
         
         return 1.0
     
+    @staticmethod
+    def _count_y_reversals(bbox_table: BBoxTable) -> int:
+        """Y 좌표 역전 횟수 (이전 요소보다 10px 넘게 위에 있으면 역전, 페이지 위쪽 기준 top 사용)"""
+        y = bbox_table.column("top")
+        return int(np.count_nonzero((y[:-1] > 0) & (np.diff(y) < -10)))
+    
     def evaluate_sentence_integrity(self, pages: List[Dict]) -> float:
         """
         sent: 문장 완결성 평가 (문장 단절 감지)
@@ -87,7 +187,7 @@ class ValidationMetrics:
         
         # 2. 문장 분할
         # 한국어: 마침표, 물음표, 느낌표 + 종결어미
-        sentences = re.split(r'[.!?]+\s+|\n+', full_text)
+        sentences = _SENTENCE_SPLIT_PATTERN.split(_SOFT_WRAP_PATTERN.sub(' ', full_text))
         sentences = [s.strip() for s in sentences if s.strip()]
         
         if len(sentences) == 0:
@@ -103,11 +203,7 @@ class ValidationMetrics:
             return 0.0
         
         # 4. 종결 어미 비율 체크
-        sentence_endings = ['다', '요', '니다', '습니다', '음', '까', '네', '자', '.', '?', '!']
-        ending_count = sum(
-            1 for s in sentences 
-            if any(s.endswith(e) for e in sentence_endings)
-        )
+        ending_count = sum(1 for s in sentences if s.endswith(_SENTENCE_ENDINGS))
         ending_ratio = ending_count / len(sentences)
         
         # 종결 어미 비율이 30% 미만이면 FAIL
@@ -146,24 +242,16 @@ class ValidationMetrics:
                 continue
             
             # 1. 페이지 번호 패턴 감지
-            page_number_pattern = re.compile(
-                r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$|^-\s*\d+\s*-$'
-            )
-            
             for line in lines:
-                if page_number_pattern.match(line):
+                if _PAGE_NUMBER_PATTERN.match(line):
                     return 0.0  # 페이지 번호 발견 → FAIL
             
-            # 2. 동일 단어 연속 반복 감지
-            words = text.split()
-            if len(words) >= 5:
-                for i in range(len(words) - 4):
-                    # 5개 연속 단어가 모두 같으면
-                    if words[i] == words[i+1] == words[i+2] == words[i+3] == words[i+4]:
-                        return 0.0  # 반복 노이즈 → FAIL
+            # 2. 동일 단어 연속 반복 감지 (5회 이상 연속)
+            if _find_repeated_word(text) is not None:
+                return 0.0  # 반복 노이즈 → FAIL
             
             # 3. 특수문자 비율 체크
-            special_chars = sum(1 for c in text if not c.isalnum() and not c.isspace())
+            special_chars = len(_SPECIAL_CHAR_PATTERN.findall(text))
             total_chars = len(text)
             
             if total_chars > 0:
@@ -286,20 +374,12 @@ class ValidationMetrics:
         if not pages or not pages[0].get("bbox"):
             return {'pass': True, 'reversal_ratio': 0.0, 'reason': 'No bbox data'}
         
-        bbox_list = pages[0].get("bbox", [])
-        if len(bbox_list) < 2:
+        bbox_table = BBoxTable.coerce(pages[0].get("bbox"))
+        if len(bbox_table) < 2:
             return {'pass': True, 'reversal_ratio': 0.0, 'reason': 'Too few bboxes'}
         
-        reversals = 0
-        prev_y = 0
-        
-        for bbox in bbox_list:
-            y = bbox.get("y0", 0)
-            if prev_y > 0 and y < prev_y - 10:
-                reversals += 1
-            prev_y = y
-        
-        reversal_ratio = reversals / len(bbox_list)
+        reversals = self._count_y_reversals(bbox_table)
+        reversal_ratio = reversals / len(bbox_table)
         passed = reversal_ratio < 0.05
         reason = f"{reversals} reversals ({reversal_ratio*100:.1f}%)" if not passed else ""
         
@@ -312,7 +392,7 @@ class ValidationMetrics:
         if len(full_text) < 50:
             return {'pass': False, 'reason': f'Text too short ({len(full_text)} chars)'}
         
-        sentences = re.split(r'[.!?]+\s+|\n+', full_text)
+        sentences = _SENTENCE_SPLIT_PATTERN.split(_SOFT_WRAP_PATTERN.sub(' ', full_text))
         sentences = [s.strip() for s in sentences if s.strip()]
         
         if not sentences:
@@ -326,8 +406,7 @@ class ValidationMetrics:
         if avg_length > 500:
             return {'pass': False, 'avg_length': avg_length, 'reason': 'Avg sentence too long'}
         
-        sentence_endings = ['다', '요', '니다', '습니다', '음', '까', '네', '자', '.', '?', '!']
-        ending_count = sum(1 for s in sentences if any(s.endswith(e) for e in sentence_endings))
+        ending_count = sum(1 for s in sentences if s.endswith(_SENTENCE_ENDINGS))
         ending_ratio = ending_count / len(sentences)
         
         if ending_ratio < 0.30:
@@ -346,20 +425,17 @@ class ValidationMetrics:
             lines = [l.strip() for l in text.split("\n") if l.strip()]
             
             # 페이지 번호
-            page_number_pattern = re.compile(r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$')
             for line in lines:
-                if page_number_pattern.match(line):
+                if _PAGE_NUMBER_PATTERN_DETAILED.match(line):
                     return {'pass': False, 'reason': f'Page number found: "{line}"'}
             
             # 연속 반복
-            words = text.split()
-            if len(words) >= 5:
-                for i in range(len(words) - 4):
-                    if words[i] == words[i+1] == words[i+2] == words[i+3] == words[i+4]:
-                        return {'pass': False, 'reason': f'Repeated word: "{words[i]}"'}
+            repeated_word = _find_repeated_word(text)
+            if repeated_word is not None:
+                return {'pass': False, 'reason': f'Repeated word: "{repeated_word}"'}
             
             # 특수문자 비율
-            special_chars = sum(1 for c in text if not c.isalnum() and not c.isspace())
+            special_chars = len(_SPECIAL_CHAR_PATTERN.findall(text))
             special_ratio = special_chars / len(text) if len(text) > 0 else 0
             if special_ratio > 0.30:
                 return {'pass': False, 'reason': f'High special char ratio: {special_ratio*100:.1f}%'}
@@ -0,0 +1,133 @@
+"""
+페이지 범위 샤딩 추출
+
+로컬 파서(pdfplumber/pdfminer/pypdfium2)는 한 프로세스에서 페이지를 순서대로 처리하므로
+전체 문서 추출 시 페이지 범위를 나눠 공유 프로세스 풀에서 동시에 추출
+- 워커마다 PDF를 따로 열어 지정된 페이지만 추출 (도구 extract(pages=...) 그대로 사용)
+- 결과는 페이지 순서대로 하나씩 반환 (iter_sharded)
+
+사용처
+- FullExtractionAgent: 최종 선택 전략으로 문서 전체 추출 (iter_sharded)
+- BasicExtractionAgent 동시 추출 (shard_pages로 샤드 단위 제출)
+  단, 기본 설정에서는 샘플 페이지(config.MAX_PAGES_SAMPLE)가 config.EXTRACTION_SHARD_MIN_PAGES보다
+  적어 도구당 샤드 1개로 실행됨 (샘플 수를 늘렸을 때만 샤딩)
+"""
+
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import config
+from utils.batch_runner import get_process_pool
+
+
+def shard_workers(max_workers: Optional[int] = None) -> int:
+    """샤드 워커 수 (CPU 코어 수를 넘지 않음, 코어보다 많으면 샤드끼리 경합만 늘어남)"""
+    max_workers = max_workers or config.EXTRACTION_SHARD_WORKERS
+    return max(1, min(max_workers, os.cpu_count() or 1))
+
+
+def shard_pages(
+    pages: Sequence[int],
+    max_workers: Optional[int] = None,
+    min_pages: Optional[int] = None
+) -> List[List[int]]:
+    """
+    페이지 목록을 연속 범위 샤드로 분할
+
+    워커당 여러 샤드로 나눠 페이지별 처리 시간 편차(표가 많은 페이지 등)를 흡수
+    샤드 크기는 config.EXTRACTION_SHARD_MAX_PAGES 이하 (샤드 결과를 한 번에 주고받으므로 메모리 상한)
+
+    Args:
+        pages: 추출할 페이지 번호 (1부터 시작)
+        max_workers: 워커 수 (기본값: config.EXTRACTION_SHARD_WORKERS, CPU 코어 수로 제한)
+        min_pages: 이 페이지 수 미만이면 샤딩하지 않음 (기본값: config.EXTRACTION_SHARD_MIN_PAGES)
+
+    Returns:
+        샤드 리스트 (샤딩하지 않으면 전체 페이지 1개 샤드)
+    """
+    pages = sorted(set(pages))
+    max_workers = shard_workers(max_workers)
+    min_pages = min_pages or config.EXTRACTION_SHARD_MIN_PAGES
+
+    if max_workers <= 1 or len(pages) < min_pages:
+        return [pages] if pages else []
+
+    shard_size = max(1, min(math.ceil(len(pages) / (max_workers * 4)), config.EXTRACTION_SHARD_MAX_PAGES))
+    return [pages[i:i + shard_size] for i in range(0, len(pages), shard_size)]
+
+
+def extract_shard(tool: Any, pdf_path: Path, pages: List[int]) -> Tuple[Dict[str, Any], float]:
+    """
+    샤드 1개 추출 (워커 프로세스에서 호출, 프로세스 풀로 전달되므로 모듈 최상위 함수)
+
+    Returns:
+        (추출 결과, 처리 시간 ms)
+    """
+    start_time = time.time()
+    result = tool.extract(pdf_path, pages=pages)
+    return result, (time.time() - start_time) * 1000
+
+
+def iter_sharded(
+    tool: Any,
+    pdf_path: Union[str, Path],
+    pages: Optional[Sequence[int]] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    페이지 범위 샤딩 추출 (전체 문서 추출용, 페이지 순서대로 하나씩 반환)
+
+    - 샤드를 공유 프로세스 풀에 제출하고 앞선 샤드부터 결과를 내보냄
+    - 동시에 제출하는 샤드는 워커 수의 2배까지 (문서 길이와 무관하게 메모리에 남는 페이지 수 제한)
+    - 공유 풀이 교체되어(다른 문서의 타임아웃 등) 중단된 샤드는 새 풀에 한 번 다시 제출
+    - 페이지 수가 적거나 워커가 1개면 현재 프로세스에서 tool.iter_pages()로 그대로 추출
+
+    Args:
+        tool: 로컬 추출 도구 (extract(pdf_path, pages=...), iter_pages() 지원)
+        pdf_path: PDF 경로
+        pages: 추출할 페이지 번호 (None이면 전체)
+        max_workers: 워커 수 (기본값: config.EXTRACTION_SHARD_WORKERS)
+
+    Yields:
+        도구 extract()의 "pages" 항목과 같은 형식의 페이지 데이터 (페이지 순서)
+    """
+    if not isinstance(pdf_path, Path):
+        pdf_path = Path(pdf_path)
+
+    if pages is None:
+        pages = range(1, tool.get_page_count(pdf_path) + 1)
+
+    shards = shard_pages(pages, max_workers)
+
+    if len(shards) <= 1:
+        if shards:
+            yield from tool.iter_pages(pdf_path, shards[0])
+        return
+
+    def submit(shard: List[int]) -> Future:
+        return get_process_pool().submit(extract_shard, tool, pdf_path, shard)
+
+    remaining = iter(shards)
+    in_flight = deque((shard, submit(shard)) for shard in islice(remaining, 2 * shard_workers(max_workers)))
+
+    try:
+        while in_flight:
+            shard, future = in_flight.popleft()
+            try:
+                result, _ = future.result()
+            except (BrokenProcessPool, CancelledError):
+                result, _ = submit(shard).result()
+
+            # 결과를 내보내기 전에 다음 샤드를 제출 (소비 측이 느려도 워커는 계속 동작)
+            in_flight.extend((next_shard, submit(next_shard)) for next_shard in islice(remaining, 1))
+            yield from result["pages"]
+    finally:
+        for _, future in in_flight:
+            future.cancel()